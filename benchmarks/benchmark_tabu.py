@@ -0,0 +1,42 @@
+import time
+import numpy as np
+
+from majorana_mapper.fermionic_mappings import bk_majoranas
+from majorana_mapper.annealing import anneal
+from majorana_mapper.tabu import tabu_search, quadratic_weight_neighbour_energies
+from majorana_mapper.tableau import spread_node
+from majorana_mapper.cost_functions import quadratic_term_mean_weight
+
+def run_anneal(x, z):
+    return anneal(x.copy(), z.copy(), spread_node, quadratic_term_mean_weight, 0.99995)
+
+def run_tabu(x, z):
+    N = x.shape[1]
+    return tabu_search(x.copy(), z.copy(), quadratic_weight_neighbour_energies,
+                       quadratic_term_mean_weight, tenure=N)
+
+def main(sizes=(4, 6, 8, 10, 12, 14, 16)):
+    # Compile both engines once so the timings below exclude JIT overhead
+    x, z, _ = bk_majoranas(2)
+    run_anneal(x, z)
+    run_tabu(x, z)
+
+    print(f"{'N':<4} | {'BK':<8} | {'Anneal':<8} | {'Anneal(s)':<10} | {'Tabu':<8} | {'Tabu(s)':<10} | {'Speedup':<8}")
+    print("-" * 75)
+    for N in sizes:
+        x, z, _ = bk_majoranas(N)
+        initial = quadratic_term_mean_weight(x, z)
+
+        start = time.time()
+        *_, anneal_opt = run_anneal(x, z)
+        anneal_time = time.time() - start
+
+        start = time.time()
+        *_, tabu_opt = run_tabu(x, z)
+        tabu_time = time.time() - start
+
+        speedup = anneal_time / tabu_time if tabu_time > 0 else np.inf
+        print(f"{N:<4} | {initial:<8.4f} | {anneal_opt:<8.4f} | {anneal_time:<10.4f} | {tabu_opt:<8.4f} | {tabu_time:<10.4f} | {speedup:<8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import time
+import numpy as np
+from qiskit_nature.second_q.operators import FermionicOp
+
+from majorana_mapper.majorana_mapper import MajoranaMapper, set_n
+from majorana_mapper.electronic_hamiltonian import majorana_term_indices, term_csr
+from majorana_mapper.cost_functions import sparse_term_mean_weight
+
+def scan_hamiltonians(num_spin_orbitals=12, num_points=6):
+    """Model PES scan: hopping grows with the bond coordinate and couples further modes."""
+    hamiltonians = []
+    for k, r in enumerate(np.linspace(0.5, 2.0, num_points)):
+        terms = {f"+_{i} -_{i}": -1.0 - 0.1*i*r for i in range(num_spin_orbitals)}
+        for i in range(num_spin_orbitals - 1):
+            terms[f"+_{i} -_{i+1}"] = terms[f"+_{i+1} -_{i}"] = 0.2 / r
+        for i in range(0, num_spin_orbitals - 2, 2):
+            terms[f"+_{i} +_{i+1} -_{i+1} -_{i}"] = 0.5 * r
+        if k >= num_points // 2:
+            terms["+_0 -_3"] = terms["+_3 -_0"] = 0.05
+        hamiltonians.append(FermionicOp(terms, num_spin_orbitals=num_spin_orbitals))
+    return hamiltonians
+
+def table_cost(mapper, hamiltonian, N):
+    term_ptr, term_rows = term_csr(majorana_term_indices(hamiltonian, N))
+    x, z = mapper.majorana_arrays(N)
+    return sparse_term_mean_weight(x, z, term_ptr, term_rows)
+
+def main(N=12):
+    set_n(N)
+    hamiltonians = scan_hamiltonians(N)
+
+    # Compile the engine once so the timings below exclude JIT overhead
+    MajoranaMapper(strategy="sparse", hamiltonian=hamiltonians[0]).map(hamiltonians[0])
+
+    cold = []
+    for hamiltonian in hamiltonians:
+        mapper = MajoranaMapper(strategy="sparse", hamiltonian=hamiltonian)
+        start = time.time()
+        mapper.map(hamiltonian)
+        cold.append((time.time() - start, table_cost(mapper, hamiltonian, N)))
+
+    warm = []
+    mapper = MajoranaMapper(strategy="sparse")
+    for hamiltonian in hamiltonians:
+        start = time.time()
+        mapper.map_sequence([hamiltonian])
+        warm.append((time.time() - start, table_cost(mapper, hamiltonian, N)))
+
+    print(f"{'Point':<6} | {'Cold(s)':<8} | {'Cold cost':<10} | {'Warm(s)':<8} | {'Warm cost':<10}")
+    print("-" * 55)
+    for k, ((t_c, e_c), (t_w, e_w)) in enumerate(zip(cold, warm)):
+        print(f"{k:<6} | {t_c:<8.3f} | {e_c:<10.4f} | {t_w:<8.3f} | {e_w:<10.4f}")
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,12 @@
-import time
-import numpy as np
+import argparse
 import csv
-from typing import Dict, List
 
-from qiskit import transpile
 from qiskit.providers.fake_provider import GenericBackendV2
 from qiskit_nature.second_q.mappers import JordanWignerMapper, BravyiKitaevMapper
-from qiskit_nature.second_q.circuit.library import UCCSD, HartreeFock
 from qiskit_nature.second_q.operators import FermionicOp
 
-from majorana_mapper.majorana_mapper import MajoranaMapper, set_n
+from majorana_mapper.majorana_mapper import MajoranaMapper
+from majorana_mapper.harness import BenchmarkCase, COLUMNS, run_benchmarks, save_columns
 
 # --- Molecular Hamiltonians (Fallbacks) ---
 
@@ -37,35 +34,10 @@ def get_lih():
 
 # --- Benchmark Logic ---
 
-def run_transpilation_benchmark():
-    # Setup target backend (Simulating ibm_boston: 127 qubits)
-    print("Initializing target backend simulator (127 qubits)...")
-    backend = GenericBackendV2(num_qubits=127)
-    
-    molecules = {
-        "H2": get_h2,
-        "LiH": get_lih,
-    }
-    
-    results = []
-    output_file = "benchmarks/transpilation_results.csv"
-    
-    # Initialize CSV header
-    fieldnames = [
-        "Molecule", "Mapper", "Depth", "Total Gates", "CNOTs", 
-        "Non-Local Gates", "Gate Set", "Ansatz Time (s)", "Transpilation Time (s)"
-    ]
-    with open(output_file, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
+def benchmark_cases(molecules, backend):
+    cases = []
     for mol_name, mol_getter in molecules.items():
-        print(f"\n--- Benchmarking Molecule: {mol_name} ---")
         hamiltonian, n_particles, n_spin_orbitals = mol_getter()
-        num_spatial_orbitals = n_spin_orbitals // 2
-        set_n(n_spin_orbitals)
-        
-        # Define Mappers
         mappers = {
             "Jordan-Wigner": JordanWignerMapper(),
             "Bravyi-Kitaev": BravyiKitaevMapper(),
@@ -73,79 +45,58 @@ def run_transpilation_benchmark():
             "Majorana-Conn": MajoranaMapper(strategy="connectivity", coupling_map=backend.coupling_map),
             "Majorana-Subspace": MajoranaMapper(strategy="subspace", hamiltonian=hamiltonian)
         }
-        
         for mapper_name, mapper in mappers.items():
-            print(f"  Processing Mapper: {mapper_name}...")
-            
-            try:
-                # 1. Map to qubit operator
-                _ = mapper.map(hamiltonian)
-                
-                # 2. Generate UCCSD Ansatz
-                start_ansatz = time.time()
-                initial_state = HartreeFock(num_spatial_orbitals, n_particles, mapper)
-                ansatz = UCCSD(
-                    num_spatial_orbitals,
-                    n_particles,
-                    mapper,
-                    initial_state=initial_state
-                )
-                ansatz_circuit = ansatz.decompose()
-                end_ansatz = time.time()
-                
-                # 3. Transpile
-                print(f"    Transpiling to {backend.name}...")
-                start_transpilation = time.time()
-                transpiled_circuit = transpile(ansatz_circuit, backend, optimization_level=1, seed_transpiler=42)
-                end_transpilation = time.time()
-                
-                # 4. Collect Metrics
-                ops = transpiled_circuit.count_ops()
-                res = {
-                    "Molecule": mol_name,
-                    "Mapper": mapper_name,
-                    "Depth": transpiled_circuit.depth(),
-                    "Total Gates": sum(ops.values()),
-                    "CNOTs": ops.get('cx', ops.get('ecr', ops.get('cz', 0))),
-                    "Non-Local Gates": sum(v for k, v in ops.items() if k not in ['u', 'p', 'rz', 'sx', 'x', 'id']),
-                    "Gate Set": list(ops.keys()),
-                    "Ansatz Time (s)": end_ansatz - start_ansatz,
-                    "Transpilation Time (s)": end_transpilation - start_transpilation
-                }
-                results.append(res)
-                
-                # Save iteratively
-                with open(output_file, "a", newline="") as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writerow(res)
-                
-            except Exception as e:
-                print(f"    Error processing {mapper_name}: {e}")
-                res = {
-                    "Molecule": mol_name, "Mapper": mapper_name, "Depth": "N/A", "Total Gates": "N/A", "CNOTs": "N/A",
-                    "Non-Local Gates": "N/A", "Gate Set": str(e), "Ansatz Time (s)": 0, "Transpilation Time (s)": 0
-                }
-                results.append(res)
+            cases.append(BenchmarkCase(mol_name, mapper_name, mapper, n_spin_orbitals, n_particles))
+    return cases
+
+def run_transpilation_benchmark(cache_dir="benchmarks/.cache", workers=None):
+    # Setup target backend (Simulating ibm_boston: 127 qubits). The fixed seed keeps
+    # its calibration, and with it the transpiled-circuit cache, stable across runs
+    print("Initializing target backend simulator (127 qubits)...")
+    backend = GenericBackendV2(num_qubits=127, seed=42)
+
+    molecules = {
+        "H2": get_h2,
+        "LiH": get_lih,
+    }
+    cases = benchmark_cases(molecules, backend)
+    print(f"Running {len(cases)} cases, artifacts cached in {cache_dir}...")
+    results = run_benchmarks(cases, backend, cache_dir, workers=workers)
+
+    output_file = "benchmarks/transpilation_results"
+    save_columns(output_file + ".npz", results)
+    with open(output_file + ".csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        writer.writerows(zip(*(results[name].tolist() for name in COLUMNS)))
 
     # --- Output Table ---
     print("\n" + "#"*80)
     print("FINAL TRANSPILATION BENCHMARK RESULTS")
     print("#"*80)
-    
-    header = ["Mapper", "Depth", "Total Gates", "CNOTs", "Non-Local", "Ansatz(s)", "Transp(s)"]
+
+    header = ["Depth", "Total Gates", "CNOTs", "Non-Local", "Table(s)", "Ansatz(s)", "Transp(s)", "Cached"]
     for mol in molecules.keys():
         print(f"\nResults for {mol}:")
         print(f"{'':<20} | {' | '.join([f'{h:<11}' for h in header])}")
-        print("-" * 110)
-        mol_results = [r for r in results if r["Molecule"] == mol]
-        for r in mol_results:
+        print("-" * 120)
+        for k in (results["molecule"] == mol).nonzero()[0]:
+            if results["error"][k]:
+                print(f"{results['mapper'][k]:<20} | Error: {results['error'][k]}")
+                continue
             row = [
-                f"{r['Depth'] or 'N/A':<11}", f"{r['Total Gates'] or 'N/A':<11}", f"{r['CNOTs'] or 'N/A':<11}", 
-                f"{r['Non-Local Gates'] or 'N/A':<11}", f"{r['Ansatz Time (s)'] or 0:.4f}", f"{r['Transpilation Time (s)'] or 0:.4f}"
+                f"{results['depth'][k]:<11}", f"{results['gates'][k]:<11}", f"{results['cnots'][k]:<11}",
+                f"{results['nonlocal_gates'][k]:<11}", f"{results['table_time'][k]:<11.4f}",
+                f"{results['ansatz_time'][k]:<11.4f}", f"{results['transpile_time'][k]:<11.4f}",
+                results["cached"][k] or "-",
             ]
-            print(f"{r['Mapper']:<20} | {' | '.join(row)}")
+            print(f"{results['mapper'][k]:<20} | {' | '.join(row)}")
 
-    print(f"\nResults saved to {output_file}")
+    print(f"\nResults saved to {output_file}.npz and {output_file}.csv")
 
 if __name__ == "__main__":
-    run_transpilation_benchmark()
+    parser = argparse.ArgumentParser(description="Transpile UCCSD ansatzes of every (molecule, mapper) pair.")
+    parser.add_argument("--cache-dir", default="benchmarks/.cache")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    run_transpilation_benchmark(args.cache_dir, args.workers)
@@ -1,8 +1,14 @@
 import numpy as np
 import random
 from numba import njit
+from .tableau import NUM_MOVES, MOVE_CNOT, MOVE_CZ, MOVE_SWAP, MOVE_ROW_SWAP
+from .tableau import spread_node
+from .cost_functions import column_symbol_counts, quadratic_weight_from_counts, quadratic_weight_move_delta
+from .cost_functions import pack_rows, unpack_rows, packed_term_paulis, grouping_cost_from_terms
+from .cost_functions import csr_term_paulis, packed_weight
+from .transposition import tableau_hash, table_lookup, table_store
 
-@njit
+@njit(nogil=True)
 def anneal(x, z, explore, energy, cooling_rate):
     N = x.shape[0]
     x_opt, z_opt = x.copy(), z.copy()
@@ -40,6 +46,442 @@ def anneal(x, z, explore, energy, cooling_rate):
 
     return x_opt, z_opt, energies, energy_opt
 
+# Floor for calibrated temperatures, e.g. when no sampled move goes uphill
+MIN_TEMP = 1e-6
+
+@njit
+def calibrate_temperature(deltas, p0):
+    """Temperature at which an average uphill move is accepted with probability p0."""
+    total = 0.0
+    count = 0
+    for d in deltas:
+        if d > 0:
+            total += d
+            count += 1
+    if count == 0:
+        return MIN_TEMP
+    return max((total / count) / -np.log(p0), MIN_TEMP)
+
+@njit
+def target_acceptance(step, num_steps, p0, p_end):
+    """Uphill acceptance target, decaying geometrically from p0 to p_end."""
+    return p0 * (p_end / p0) ** (step / num_steps)
+
+@njit
+def adapt_temperature(T, accepted, proposed, target):
+    """Rescale T so that uphill moves are accepted at the target rate.
+
+    With an acceptance a ~ exp(-d/T), the temperature T ln(a) / ln(target) accepts
+    the same moves at the target rate. The factor is clipped to [1/2, 2] per call.
+    A window too short to expect a single accept at the target, as late in the
+    schedule, keeps T when none is accepted.
+    """
+    if proposed == 0:
+        return T
+    a = accepted / proposed
+    if a <= 0.0:
+        if target * proposed < 1.0:
+            return T
+        factor = 2.0
+    elif a >= 1.0:
+        factor = 0.5
+    else:
+        factor = min(2.0, max(0.5, np.log(a) / np.log(target)))
+    return max(T * factor, MIN_TEMP)
+
+@njit(nogil=True)
+def anneal_adaptive(x, z, explore, energy, num_steps, p0=0.8, p_end=1e-3, window=100, involution=True,
+                    energy_args=()):
+    """Simulated annealing with a self-calibrating temperature schedule.
+
+    T0 is calibrated from the deltas of one sampled move per row, so that an average
+    uphill move is accepted with probability p0. Every `window` steps T is rescaled
+    so that uphill moves are accepted at a target rate decaying geometrically to
+    p_end over `num_steps`, independent of the energy scale of the cost.
+
+    Args:
+        involution: Undo rejected moves by applying `explore` again, as `anneal`
+            does. Otherwise the previous state is restored from a copy.
+        energy_args: Extra arguments of `energy`, e.g. the distance matrix of
+            `connectivity_aware_cost`. Unlike a closure over the same data, they
+            do not make every new cost compile the engine again.
+    """
+    N = x.shape[0]
+    x_opt, z_opt = x.copy(), z.copy()
+
+    current_energy = energy(x, z, *energy_args)
+    energy_opt = current_energy
+    energies = [current_energy]
+
+    deltas = np.zeros(N)
+    for n in range(N):
+        x_trial, z_trial = explore(n, x.copy(), z.copy())
+        deltas[n] = energy(x_trial, z_trial, *energy_args) - current_energy
+    T = calibrate_temperature(deltas, p0)
+
+    uphill = 0
+    accepted = 0
+    x_prev, z_prev = x.copy(), z.copy()
+
+    for i in range(1, num_steps + 1):
+        n = random.randint(0, N - 1)
+
+        if not involution:
+            x_prev[:], z_prev[:] = x, z
+        x, z = explore(n, x, z)
+        new_energy = energy(x, z, *energy_args)
+        delta = new_energy - current_energy
+
+        if delta > 0:
+            uphill += 1
+        if delta <= 0 or random.random() < np.exp(-delta / T):
+            if delta > 0:
+                accepted += 1
+            current_energy = new_energy
+            energies.append(current_energy)
+
+            if current_energy < energy_opt:
+                energy_opt = current_energy
+                x_opt, z_opt = x.copy(), z.copy()
+        elif involution:
+            x, z = explore(n, x, z) # Undo
+        else:
+            x[:], z[:] = x_prev, z_prev
+
+        if i % window == 0:
+            T = adapt_temperature(T, accepted, uphill, target_acceptance(i, num_steps, p0, p_end))
+            uphill = accepted = 0
+
+    return x_opt, z_opt, energies, energy_opt
+
+@njit(nogil=True)
+def anneal_memoized(x, z, explore, hash_delta, energy, keys, table_keys, table_values, num_steps,
+                    p0=0.8, p_end=1e-3, window=100, involution=True, energy_args=()):
+    """`anneal_adaptive` with energies memoized in a transposition table.
+
+    The Zobrist hash of the proposed tableau is derived from the current one by
+    `hash_delta` before the move is applied. A known state is scored from the table
+    and, if rejected, the move is never applied at all.
+
+    Args:
+        hash_delta: Hash change of `explore`, e.g. `spread_node_hash`.
+        keys: Zobrist keys of `zobrist_keys`.
+        table_keys, table_values: Table of `transposition_table`. Its energies are
+            those of `energy`, so only runs of the same cost may share it.
+        energy_args: Extra arguments of `energy`, as for `anneal_adaptive`.
+
+    Returns:
+        Same as `anneal`, plus the number of lookups and of hits.
+    """
+    N = x.shape[0]
+    x_opt, z_opt = x.copy(), z.copy()
+    h = tableau_hash(x, z, keys)
+
+    current_energy = energy(x, z, *energy_args)
+    table_store(table_keys, table_values, h, current_energy)
+    energy_opt = current_energy
+    energies = [current_energy]
+    lookups = 0
+    hits = 0
+
+    deltas = np.zeros(N)
+    for n in range(N):
+        x_trial, z_trial = explore(n, x.copy(), z.copy())
+        deltas[n] = energy(x_trial, z_trial, *energy_args) - current_energy
+    T = calibrate_temperature(deltas, p0)
+
+    uphill = 0
+    accepted = 0
+    x_prev, z_prev = x.copy(), z.copy()
+
+    for i in range(1, num_steps + 1):
+        n = random.randint(0, N - 1)
+        h_new = h ^ hash_delta(n, x, z, keys)
+
+        lookups += 1
+        new_energy = table_lookup(table_keys, table_values, h_new)
+        applied = False
+        if np.isnan(new_energy):
+            if not involution:
+                x_prev[:], z_prev[:] = x, z
+            x, z = explore(n, x, z)
+            applied = True
+            new_energy = energy(x, z, *energy_args)
+            table_store(table_keys, table_values, h_new, new_energy)
+        else:
+            hits += 1
+        delta = new_energy - current_energy
+
+        if delta > 0:
+            uphill += 1
+        if delta <= 0 or random.random() < np.exp(-delta / T):
+            if delta > 0:
+                accepted += 1
+            if not applied:
+                x, z = explore(n, x, z)
+            h = h_new
+            current_energy = new_energy
+            energies.append(current_energy)
+
+            if current_energy < energy_opt:
+                energy_opt = current_energy
+                x_opt, z_opt = x.copy(), z.copy()
+        elif applied and involution:
+            x, z = explore(n, x, z) # Undo
+        elif applied:
+            x[:], z[:] = x_prev, z_prev
+
+        if i % window == 0:
+            T = adapt_temperature(T, accepted, uphill, target_acceptance(i, num_steps, p0, p_end))
+            uphill = accepted = 0
+
+    return x_opt, z_opt, energies, energy_opt, lookups, hits
+
+@njit
+def _sample_move(probs):
+    r = random.random()
+    acc = 0.0
+    for k in range(probs.shape[0]):
+        acc += probs[k]
+        if r < acc:
+            return k
+    return probs.shape[0] - 1
+
+@njit
+def _two_distinct(M):
+    a = random.randint(0, M - 1)
+    b = random.randint(0, M - 2)
+    if b >= a:
+        b += 1
+    return a, b
+
+@njit
+def _random_move(probs, N, Q):
+    kind = _sample_move(probs)
+    if kind == MOVE_ROW_SWAP:
+        a, b = _two_distinct(N)
+    elif kind == MOVE_CNOT or kind == MOVE_CZ or kind == MOVE_SWAP:
+        a, b = _two_distinct(Q)
+    else:
+        a, b = random.randint(0, Q - 1), 0
+    return kind, a, b
+
+@njit(nogil=True)
+def anneal_scheduled(x, z, num_steps, p0=0.8, p_end=1e-3, window=200, min_share=0.02):
+    """Anneal `quadratic_term_mean_weight` with local Clifford moves.
+
+    Move types are drawn from an adaptive distribution: every `window` steps each
+    type is reweighted by its recent rate of accepted, energy-changing moves, with
+    a floor of `min_share` so that no type dies out. Moves and energies are updated
+    incrementally through `quadratic_weight_move_delta`, so a step costs O(N). The
+    temperature follows the schedule of `anneal_adaptive`.
+
+    Returns:
+        Same as `anneal`, plus the final move-type probabilities.
+    """
+    N = x.shape[0]
+    Q = x.shape[1]
+    x_opt, z_opt = x.copy(), z.copy()
+
+    counts = column_symbol_counts(x, z)
+    current_energy = quadratic_weight_from_counts(counts)
+    energy_opt = current_energy
+    energies = [current_energy]
+
+    probs = np.full(NUM_MOVES, 1.0 / NUM_MOVES)
+    proposed = np.zeros(NUM_MOVES, dtype=np.int64)
+    effective = np.zeros(NUM_MOVES, dtype=np.int64)
+
+    deltas = np.zeros(N)
+    for k in range(N):
+        kind, a, b = _random_move(probs, N, Q)
+        deltas[k] = quadratic_weight_move_delta(kind, a, b, x, z, counts)
+        quadratic_weight_move_delta(kind, a, b, x, z, counts) # Undo
+    T = calibrate_temperature(deltas, p0)
+    uphill = 0
+    accepted = 0
+
+    for i in range(1, num_steps + 1):
+        kind, a, b = _random_move(probs, N, Q)
+        delta = quadratic_weight_move_delta(kind, a, b, x, z, counts)
+        proposed[kind] += 1
+
+        if delta > 0:
+            uphill += 1
+        if delta <= 0 or random.random() < np.exp(-delta / T):
+            if delta > 0:
+                accepted += 1
+            current_energy += delta
+            energies.append(current_energy)
+            if delta != 0:
+                effective[kind] += 1
+
+            if current_energy < energy_opt - 1e-12:
+                # Resync with the counts so rounding does not accumulate
+                current_energy = quadratic_weight_from_counts(counts)
+                energy_opt = current_energy
+                x_opt, z_opt = x.copy(), z.copy()
+        else:
+            quadratic_weight_move_delta(kind, a, b, x, z, counts) # Undo
+
+        if i % window == 0:
+            rates = np.zeros(NUM_MOVES)
+            for k in range(NUM_MOVES):
+                if proposed[k] > 0:
+                    rates[k] = effective[k] / proposed[k]
+            if rates.sum() > 0:
+                probs = min_share + (1 - NUM_MOVES * min_share) * rates / rates.sum()
+            proposed[:] = 0
+            effective[:] = 0
+
+            T = adapt_temperature(T, accepted, uphill, target_acceptance(i, num_steps, p0, p_end))
+            uphill = accepted = 0
+
+    return x_opt, z_opt, energies, energy_opt, probs
+
+@njit
+def _xor_into_terms(tx, tz, terms, x_row, z_row):
+    for t in terms:
+        tx[t] ^= x_row
+        tz[t] ^= z_row
+
+@njit(nogil=True)
+def anneal_grouping(x, z, term_indices, row_ptr, term_ids, num_steps, p0=0.8, p_end=1e-3, window=100):
+    """Anneal the QWC group count of the Hamiltonian terms over `spread_node` moves.
+
+    For an even Majorana product, `spread_node(n)` only multiplies the terms that
+    contain row n by that row, so the packed term Paulis are updated through the
+    `term_row_incidence` index and only the greedy colouring is redone per step.
+    The tableau itself is only touched when a move is accepted. The temperature
+    follows the schedule of `anneal_adaptive`.
+    """
+    N = x.shape[0]
+    Q = x.shape[1]
+    x_opt, z_opt = x.copy(), z.copy()
+
+    x_packed, z_packed = pack_rows(x, z)
+    tx, tz = packed_term_paulis(x_packed, z_packed, term_indices)
+
+    current_energy = grouping_cost_from_terms(tx, tz, Q)
+    energy_opt = current_energy
+    energies = [current_energy]
+
+    deltas = np.zeros(N)
+    for n in range(N):
+        x_n, z_n = pack_rows(x[n:n+1], z[n:n+1])
+        terms = term_ids[row_ptr[n]:row_ptr[n+1]]
+        _xor_into_terms(tx, tz, terms, x_n[0], z_n[0])
+        deltas[n] = grouping_cost_from_terms(tx, tz, Q) - current_energy
+        _xor_into_terms(tx, tz, terms, x_n[0], z_n[0])
+    T = calibrate_temperature(deltas, p0)
+    uphill = 0
+    accepted = 0
+
+    for i in range(1, num_steps + 1):
+        n = random.randint(0, N - 1)
+
+        x_n, z_n = pack_rows(x[n:n+1], z[n:n+1])
+        terms = term_ids[row_ptr[n]:row_ptr[n+1]]
+        _xor_into_terms(tx, tz, terms, x_n[0], z_n[0])
+        new_energy = grouping_cost_from_terms(tx, tz, Q)
+        delta = new_energy - current_energy
+
+        if delta > 0:
+            uphill += 1
+        if delta <= 0 or random.random() < np.exp(-delta / T):
+            if delta > 0:
+                accepted += 1
+            x, z = spread_node(n, x, z)
+            current_energy = new_energy
+            energies.append(current_energy)
+
+            if current_energy < energy_opt:
+                energy_opt = current_energy
+                x_opt, z_opt = x.copy(), z.copy()
+        else:
+            _xor_into_terms(tx, tz, terms, x_n[0], z_n[0]) # Undo
+
+        if i % window == 0:
+            T = adapt_temperature(T, accepted, uphill, target_acceptance(i, num_steps, p0, p_end))
+            uphill = accepted = 0
+
+    return x_opt, z_opt, energies, energy_opt
+
+@njit(nogil=True)
+def anneal_sparse(x, z, term_ptr, term_rows, row_ptr, term_ids, num_steps, p0=0.8, p_end=1e-3, window=100):
+    """Anneal `sparse_term_mean_weight` with work proportional to the terms touched.
+
+    The tableau and the term Paulis are kept bit-packed. A `spread_node(n)` proposal
+    is scored from the terms containing row n only, and the packed tableau is only
+    updated, in O(N) words, when the move is accepted. The temperature follows the
+    schedule of `anneal_adaptive`.
+    """
+    N = x.shape[0]
+    Q = x.shape[1]
+    num_terms = term_ptr.shape[0] - 1
+    if num_terms == 0:
+        # Nothing to weigh: every table is optimal
+        return x.copy(), z.copy(), [0.0], 0.0
+
+    x_packed, z_packed = pack_rows(x, z)
+    tx, tz = csr_term_paulis(x_packed, z_packed, term_ptr, term_rows)
+    weights = np.zeros(num_terms, dtype=np.int64)
+    for t in range(num_terms):
+        weights[t] = packed_weight(tx[t], tz[t])
+
+    total = weights.sum()
+    x_opt, z_opt = x_packed.copy(), z_packed.copy()
+    current_energy = total / num_terms
+    energy_opt = current_energy
+    energies = [current_energy]
+
+    deltas = np.zeros(N)
+    for n in range(N):
+        for t in term_ids[row_ptr[n]:row_ptr[n+1]]:
+            deltas[n] += packed_weight(tx[t] ^ x_packed[n], tz[t] ^ z_packed[n]) - weights[t]
+    T = calibrate_temperature(deltas / num_terms, p0)
+    uphill = 0
+    accepted = 0
+
+    for step in range(1, num_steps + 1):
+        n = random.randint(0, N - 1)
+        x_n, z_n = x_packed[n].copy(), z_packed[n].copy()
+        terms = term_ids[row_ptr[n]:row_ptr[n+1]]
+
+        delta = 0
+        for t in terms:
+            delta += packed_weight(tx[t] ^ x_n, tz[t] ^ z_n) - weights[t]
+        new_energy = (total + delta) / num_terms
+
+        if delta > 0:
+            uphill += 1
+        if delta <= 0 or random.random() < np.exp(-(new_energy - current_energy) / T):
+            if delta > 0:
+                accepted += 1
+            for t in terms:
+                tx[t] ^= x_n
+                tz[t] ^= z_n
+                weights[t] = packed_weight(tx[t], tz[t])
+            for i in range(N):
+                if i != n:
+                    x_packed[i] ^= x_n
+                    z_packed[i] ^= z_n
+
+            total += delta
+            current_energy = new_energy
+            energies.append(current_energy)
+
+            if current_energy < energy_opt:
+                energy_opt = current_energy
+                x_opt, z_opt = x_packed.copy(), z_packed.copy()
+
+        if step % window == 0:
+            T = adapt_temperature(T, accepted, uphill, target_acceptance(step, num_steps, p0, p_end))
+            uphill = accepted = 0
+
+    x_opt, z_opt = unpack_rows(x_opt, z_opt, Q)
+    return x_opt, z_opt, energies, energy_opt
+
 
 def anneal1(x, z, explore, energy, cooling_rate=0.995, min_temp=1e-3, max_iter=10000):
     N = x.shape[0]
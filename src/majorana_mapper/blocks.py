@@ -0,0 +1,113 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+from .fermionic_mappings import bk_majoranas
+from .annealing import anneal_adaptive, anneal_sparse
+from .electronic_hamiltonian import majorana_products, term_row_incidence, term_csr
+from .cost_functions import quadratic_term_mean_weight
+from .tableau import spread_node
+
+def interaction_matrix(hamiltonian, N) -> np.ndarray:
+    """Summed coefficient magnitudes of the terms coupling each pair of modes."""
+    weights = np.zeros((N, N))
+    for rows, coeff in majorana_products(hamiltonian, N).items():
+        modes = np.unique(np.array(rows, dtype=np.int64) % N)
+        weights[np.ix_(modes, modes)] += abs(coeff)
+    np.fill_diagonal(weights, 0.0)
+    return weights
+
+def partition_modes(N, block_size, hamiltonian=None) -> list[np.ndarray]:
+    """Split the modes into blocks of at most `block_size`.
+
+    Without a Hamiltonian the blocks are contiguous. Otherwise every block is seeded
+    with the most strongly coupled free mode and grown by the free mode most strongly
+    coupled to it, so that most of the Hamiltonian stays inside blocks.
+    """
+    if hamiltonian is None:
+        return [np.arange(start, min(start + block_size, N)) for start in range(0, N, block_size)]
+
+    weights = interaction_matrix(hamiltonian, N)
+    free = np.ones(N, dtype=bool)
+    blocks = []
+    while free.any():
+        seed = int(np.argmax(np.where(free, weights.sum(axis=1), -1.0)))
+        block = [seed]
+        free[seed] = False
+        while len(block) < block_size and free.any():
+            coupling = np.where(free, weights[block].sum(axis=0), -1.0)
+            mode = int(np.argmax(coupling))
+            block.append(mode)
+            free[mode] = False
+        blocks.append(np.array(sorted(block), dtype=np.int64))
+    return blocks
+
+def _block_rows(modes, N) -> np.ndarray:
+    # Global Majorana rows of a block in local order: all g, then all g'
+    return np.concatenate([modes, modes + N])
+
+def block_term_indices(term_indices, modes, N) -> np.ndarray:
+    """Padded local row indices of the terms acting on the block's modes only."""
+    local = np.full(2*N, -1, dtype=np.int64)
+    local[_block_rows(modes, N)] = np.arange(2 * len(modes))
+    mapped = np.where(term_indices >= 0, local[np.maximum(term_indices, 0)], -1)
+    inside = ((mapped >= 0) | (term_indices < 0)).all(axis=1)
+    return mapped[inside]
+
+def stitch_blocks(block_tables, blocks, N):
+    """Assemble block tables on consecutive qubit ranges into one Majorana table.
+
+    Rows of different blocks act on disjoint qubits and would commute, so each row
+    also carries the parity string (the product of all rows) of the preceding
+    blocks, as in Jordan-Wigner. Products of rows within one block are unchanged.
+    """
+    x = np.zeros((2*N, N), dtype=bool)
+    z = np.zeros((2*N, N), dtype=bool)
+    prefix_x = np.zeros(N, dtype=bool)
+    prefix_z = np.zeros(N, dtype=bool)
+    offset = 0
+    for (bx, bz), modes in zip(block_tables, blocks):
+        n = len(modes)
+        rows = _block_rows(modes, N)
+        x[rows, offset:offset + n] = bx
+        z[rows, offset:offset + n] = bz
+        x[rows] ^= prefix_x
+        z[rows] ^= prefix_z
+        prefix_x[offset:offset + n] ^= np.bitwise_xor.reduce(bx, axis=0)
+        prefix_z[offset:offset + n] ^= np.bitwise_xor.reduce(bz, axis=0)
+        offset += n
+    return x, z
+
+def _anneal_block(modes, N, term_indices, num_steps, p0, p_end):
+    n = len(modes)
+    x, z, _ = bk_majoranas(n)
+    if term_indices is None:
+        x, z, _, _ = anneal_adaptive(x, z, spread_node, quadratic_term_mean_weight,
+                                     num_steps=num_steps, p0=p0, p_end=p_end)
+        return x, z
+
+    local = block_term_indices(term_indices, modes, N)
+    if len(local) == 0:
+        return x, z
+    row_ptr, term_ids = term_row_incidence(local, 2*n)
+    term_ptr, term_rows = term_csr(local)
+    x, z, _, _ = anneal_sparse(x, z, term_ptr, term_rows, row_ptr, term_ids,
+                               num_steps=num_steps, p0=p0, p_end=p_end)
+    return x, z
+
+def anneal_blocks(N, blocks, steps, term_indices=None, workers=None, p0=0.8, p_end=1e-3):
+    """Anneal every block on its own qubits in parallel and stitch the results.
+
+    The engines release the GIL, so the blocks run concurrently on worker threads.
+
+    Args:
+        blocks: Mode blocks, e.g. from `partition_modes`.
+        steps: Function giving the annealing steps of a block of n modes.
+        term_indices: Padded Hamiltonian terms. Blocks are scored on the terms
+            inside them, or on the quadratic weight if None.
+        workers: Number of threads, as for `ThreadPoolExecutor`.
+    """
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="majorana-block") as pool:
+        tables = list(pool.map(
+            lambda modes: _anneal_block(modes, N, term_indices, steps(len(modes)), p0, p_end), blocks
+        ))
+    return stitch_blocks(tables, blocks, N)
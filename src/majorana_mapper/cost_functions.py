@@ -9,6 +9,7 @@ from qiskit.transpiler import CouplingMap
 import networkx as nx
 import copy, math, random
 from numba import njit
+from .tableau import apply_clifford_move, MOVE_CNOT, MOVE_CZ, MOVE_SWAP, MOVE_ROW_SWAP
 
 @njit
 def weight(x, z) -> float:
@@ -71,6 +72,277 @@ def subspace_optimized_cost(x: np.ndarray, z: np.ndarray, active_indices: np.nda
         
     return total_weight / num_terms if num_terms > 0 else 0.0
 
+@njit
+def column_symbol_counts(x: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """Histogram of the Pauli symbols (I, X, Z, Y) per qubit over the scored rows.
+
+    A quadratic term acts on qubit q iff its two rows carry different symbols
+    there, so `quadratic_term_mean_weight` is separable over columns and can be
+    rebuilt from these counts alone.
+    """
+    Q = x.shape[1]
+    counts = np.zeros((Q, 4), dtype=np.int64)
+    for q in range(Q):
+        _count_column(x, z, q, counts)
+    return counts
+
+@njit
+def _count_column(x, z, q, counts):
+    Q = x.shape[1]
+    counts[q, :] = 0
+    for i in range(Q):
+        counts[q, x[i, q] + 2 * z[i, q]] += 1
+
+@njit
+def _column_pairs(counts, q) -> int:
+    Q = counts[q].sum()
+    same = 0
+    for s in range(4):
+        same += counts[q, s] * (counts[q, s] - 1) // 2
+    return Q * (Q - 1) // 2 - same
+
+@njit
+def quadratic_weight_from_counts(counts: np.ndarray) -> float:
+    Q = counts.shape[0]
+    total = 0
+    for q in range(Q):
+        total += _column_pairs(counts, q)
+    return total / (Q * (Q - 1) // 2)
+
+@njit
+def quadratic_weight_move_delta(kind: int, a: int, b: int, x: np.ndarray, z: np.ndarray,
+                                counts: np.ndarray) -> float:
+    """Apply a local Clifford move and return the change in `quadratic_term_mean_weight`.
+
+    `counts` from `column_symbol_counts` is updated in place, so every move costs
+    O(N): column moves recount their one or two columns, single-qubit moves keep
+    the support and a row swap only moves one row in or out of the scored block.
+    """
+    Q = x.shape[1]
+    num_terms = Q * (Q - 1) // 2
+
+    if kind == MOVE_ROW_SWAP:
+        if (a < Q) == (b < Q):
+            apply_clifford_move(kind, a, b, x, z)
+            return 0.0
+        out_row, in_row = (a, b) if a < Q else (b, a)
+        delta = 0
+        for q in range(Q):
+            s_out = x[out_row, q] + 2 * z[out_row, q]
+            s_in = x[in_row, q] + 2 * z[in_row, q]
+            if s_out != s_in:
+                delta += (counts[q, s_out] - 1) - counts[q, s_in]
+                counts[q, s_out] -= 1
+                counts[q, s_in] += 1
+        apply_clifford_move(kind, a, b, x, z)
+        return delta / num_terms
+
+    if kind == MOVE_CNOT or kind == MOVE_CZ or kind == MOVE_SWAP:
+        before = _column_pairs(counts, a) + _column_pairs(counts, b)
+        apply_clifford_move(kind, a, b, x, z)
+        _count_column(x, z, a, counts)
+        _count_column(x, z, b, counts)
+        return (_column_pairs(counts, a) + _column_pairs(counts, b) - before) / num_terms
+
+    # H and S permute the non-identity symbols of a column
+    apply_clifford_move(kind, a, b, x, z)
+    _count_column(x, z, a, counts)
+    return 0.0
+
+@njit
+def pack_rows(x: np.ndarray, z: np.ndarray):
+    """Pack boolean Pauli rows into uint64 words, 64 qubits per word."""
+    R, N = x.shape
+    W = (N + 63) // 64
+    x_packed = np.zeros((R, W), dtype=np.uint64)
+    z_packed = np.zeros((R, W), dtype=np.uint64)
+    for r in range(R):
+        for q in range(N):
+            bit = np.uint64(1) << np.uint64(q & 63)
+            if x[r, q]:
+                x_packed[r, q >> 6] |= bit
+            if z[r, q]:
+                z_packed[r, q >> 6] |= bit
+    return x_packed, z_packed
+
+@njit
+def unpack_rows(x_packed: np.ndarray, z_packed: np.ndarray, N: int):
+    R = x_packed.shape[0]
+    x = np.zeros((R, N), dtype=np.bool_)
+    z = np.zeros((R, N), dtype=np.bool_)
+    for r in range(R):
+        for q in range(N):
+            bit = np.uint64(1) << np.uint64(q & 63)
+            x[r, q] = (x_packed[r, q >> 6] & bit) != 0
+            z[r, q] = (z_packed[r, q >> 6] & bit) != 0
+    return x, z
+
+@njit
+def popcount64(v) -> int:
+    v = np.uint64(v)
+    v = v - ((v >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    v = (v & np.uint64(0x3333333333333333)) + ((v >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    v = (v + (v >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return int((v * np.uint64(0x0101010101010101)) >> np.uint64(56))
+
+@njit
+def packed_term_paulis(x_packed: np.ndarray, z_packed: np.ndarray, term_indices: np.ndarray):
+    """XOR the packed Majorana rows of every term, padding (-1) skipped."""
+    T = term_indices.shape[0]
+    W = x_packed.shape[1]
+    tx = np.zeros((T, W), dtype=np.uint64)
+    tz = np.zeros((T, W), dtype=np.uint64)
+    for t in range(T):
+        for idx in term_indices[t]:
+            if idx >= 0:
+                tx[t] ^= x_packed[idx]
+                tz[t] ^= z_packed[idx]
+    return tx, tz
+
+@njit
+def packed_weight(x_words: np.ndarray, z_words: np.ndarray) -> int:
+    weight = 0
+    for w in range(x_words.shape[0]):
+        weight += popcount64(x_words[w] | z_words[w])
+    return weight
+
+@njit
+def csr_term_paulis(x_packed: np.ndarray, z_packed: np.ndarray, term_ptr: np.ndarray, term_rows: np.ndarray):
+    """Same as `packed_term_paulis` for terms in `term_csr` form."""
+    T = term_ptr.shape[0] - 1
+    W = x_packed.shape[1]
+    tx = np.zeros((T, W), dtype=np.uint64)
+    tz = np.zeros((T, W), dtype=np.uint64)
+    for t in range(T):
+        for k in range(term_ptr[t], term_ptr[t+1]):
+            tx[t] ^= x_packed[term_rows[k]]
+            tz[t] ^= z_packed[term_rows[k]]
+    return tx, tz
+
+@njit
+def sparse_term_mean_weight(x: np.ndarray, z: np.ndarray, term_ptr: np.ndarray, term_rows: np.ndarray) -> float:
+    """Mean Pauli weight of only those Majorana products present in the Hamiltonian."""
+    x_packed, z_packed = pack_rows(x, z)
+    tx, tz = csr_term_paulis(x_packed, z_packed, term_ptr, term_rows)
+    T = tx.shape[0]
+    total = 0
+    for t in range(T):
+        total += packed_weight(tx[t], tz[t])
+    return total / T if T > 0 else 0.0
+
+@njit
+def greedy_qwc_groups(tx: np.ndarray, tz: np.ndarray):
+    """Largest-first greedy colouring of packed Paulis into qubit-wise commuting groups.
+
+    Every group keeps the union of its members, which fixes one basis per qubit, so
+    a term is tested against a group in W word operations.
+
+    Returns:
+        (num_groups, total_weight) where identity terms are not counted as a group.
+    """
+    T, W = tx.shape
+    weights = np.zeros(T, dtype=np.int64)
+    for t in range(T):
+        for w in range(W):
+            weights[t] += popcount64(tx[t, w] | tz[t, w])
+    order = np.argsort(-weights, kind="mergesort")
+
+    gx = np.zeros((T, W), dtype=np.uint64)
+    gz = np.zeros((T, W), dtype=np.uint64)
+    num_groups = 0
+    for t in order:
+        if weights[t] == 0:
+            break
+        placed = False
+        for g in range(num_groups):
+            compatible = True
+            for w in range(W):
+                clash = (tx[t, w] ^ gx[g, w]) | (tz[t, w] ^ gz[g, w])
+                if (tx[t, w] | tz[t, w]) & (gx[g, w] | gz[g, w]) & clash:
+                    compatible = False
+                    break
+            if compatible:
+                gx[g] |= tx[t]
+                gz[g] |= tz[t]
+                placed = True
+                break
+        if not placed:
+            gx[num_groups] = tx[t]
+            gz[num_groups] = tz[t]
+            num_groups += 1
+
+    return num_groups, weights.sum()
+
+@njit
+def grouping_cost_from_terms(tx: np.ndarray, tz: np.ndarray, N: int) -> float:
+    """Number of QWC groups, with the mean term weight (scaled below 1) breaking ties."""
+    T = tx.shape[0]
+    num_groups, total_weight = greedy_qwc_groups(tx, tz)
+    return num_groups + total_weight / (T * N + 1)
+
+@njit
+def qwc_group_cost(x: np.ndarray, z: np.ndarray, term_indices: np.ndarray) -> float:
+    """Estimated number of measurement groups of the mapped Hamiltonian terms."""
+    x_packed, z_packed = pack_rows(x, z)
+    tx, tz = packed_term_paulis(x_packed, z_packed, term_indices)
+    return grouping_cost_from_terms(tx, tz, x.shape[1])
+
+@njit
+def shared_support(xa: np.ndarray, za: np.ndarray, xb: np.ndarray, zb: np.ndarray) -> int:
+    """Number of qubits on which two packed Paulis act with the same non-identity Pauli."""
+    shared = 0
+    for w in range(xa.shape[0]):
+        same = ~((xa[w] ^ xb[w]) | (za[w] ^ zb[w]))
+        shared += popcount64(same & (xa[w] | za[w]) & (xb[w] | zb[w]))
+    return shared
+
+@njit
+def greedy_trotter_order(tx: np.ndarray, tz: np.ndarray):
+    """Greedy nearest-neighbour order of the Pauli exponentials of one Trotter step.
+
+    Each exponential of weight w costs a CNOT ladder of 2(w - 1). Consecutive
+    exponentials sharing the same Pauli on s qubits can cancel s - 1 CNOTs of
+    either ladder when both ladders start along the shared qubits, which makes the
+    count a bound on what cancellation can reach. The walk starts at the heaviest
+    term and always moves to the unvisited term with the largest shared support.
+
+    Returns:
+        (order, cnots): The term order and its estimated CNOT count.
+    """
+    T = tx.shape[0]
+    order = np.zeros(T, dtype=np.int64)
+    if T == 0:
+        return order, 0
+    weights = np.zeros(T, dtype=np.int64)
+    for t in range(T):
+        weights[t] = packed_weight(tx[t], tz[t])
+    cnots = 2 * np.maximum(weights - 1, 0).sum()
+
+    visited = np.zeros(T, dtype=np.bool_)
+    current = np.argmax(weights)
+    for k in range(T):
+        order[k] = current
+        visited[current] = True
+        best, best_shared = -1, -1
+        for t in range(T):
+            if not visited[t]:
+                shared = shared_support(tx[current], tz[current], tx[t], tz[t])
+                if shared > best_shared:
+                    best, best_shared = t, shared
+        if best < 0:
+            break
+        cnots -= 2 * max(best_shared - 1, 0)
+        current = best
+    return order, cnots
+
+@njit
+def trotter_cnot_cost(x: np.ndarray, z: np.ndarray, term_ptr: np.ndarray, term_rows: np.ndarray) -> float:
+    """Estimated CNOTs of one Trotter step of the mapped Hamiltonian terms."""
+    x_packed, z_packed = pack_rows(x, z)
+    tx, tz = csr_term_paulis(x_packed, z_packed, term_ptr, term_rows)
+    _, cnots = greedy_trotter_order(tx, tz)
+    return float(cnots)
+
 
 
 def compute_cost_pauli_string(x, z, coupling_map=None):
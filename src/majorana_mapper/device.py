@@ -0,0 +1,242 @@
+import hashlib
+import threading
+import numpy as np
+from numba import njit
+
+# All-pairs distances and regions, keyed by coupling-map hash so that mappers
+# on the same device share one computation. Error-weighted distances are keyed
+# by `backend_hash`, i.e. by calibration snapshot
+_distance_cache = {}
+_region_cache = {}
+_error_distance_cache = {}
+_cache_lock = threading.Lock()
+
+# Two-qubit gates whose calibrated error weights a coupling
+TWO_QUBIT_GATES = ("cx", "ecr", "cz")
+
+def coupling_map_hash(coupling_map) -> str:
+    """Content hash of a coupling map: its size and sorted undirected edges."""
+    edges = sorted({tuple(sorted(e)) for e in coupling_map.get_edges()})
+    h = hashlib.sha256(f"{coupling_map.size()}|".encode())
+    h.update(np.array(edges, dtype=np.int64).tobytes())
+    return h.hexdigest()
+
+def backend_hash(backend) -> str:
+    """Content hash of a backend target: its operations on every qubit tuple with their calibration."""
+    h = hashlib.sha256(f"{backend.num_qubits}|".encode())
+    for name in sorted(backend.target.operation_names):
+        properties = backend.target[name]
+        for qargs in sorted(properties, key=lambda q: q or ()):
+            props = properties[qargs]
+            error, duration = (props.error, props.duration) if props is not None else (None, None)
+            h.update(f"{name}|{qargs}|{error!r}|{duration!r};".encode())
+    return h.hexdigest()
+
+def _adjacency_csr(coupling_map):
+    n = coupling_map.size()
+    edges = np.array(coupling_map.get_edges(), dtype=np.int64).reshape(-1, 2)
+    edges = np.unique(np.sort(edges, axis=1), axis=0)
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    edges = np.concatenate([edges, edges[:, ::-1]])
+    order = np.argsort(edges[:, 0], kind="stable")
+    adj_ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(edges[:, 0], minlength=n), out=adj_ptr[1:])
+    return adj_ptr, edges[order, 1].copy()
+
+@njit
+def _bfs_distances(adj_ptr, adj, n, unreachable):
+    dist = np.full((n, n), unreachable, dtype=np.int32)
+    queue = np.empty(n, dtype=np.int64)
+    for s in range(n):
+        dist[s, s] = 0
+        queue[0] = s
+        head, tail = 0, 1
+        while head < tail:
+            u = queue[head]
+            head += 1
+            for k in range(adj_ptr[u], adj_ptr[u+1]):
+                v = adj[k]
+                if dist[s, v] == unreachable:
+                    dist[s, v] = dist[s, u] + 1
+                    queue[tail] = v
+                    tail += 1
+    return dist
+
+def device_distances(coupling_map) -> np.ndarray:
+    """Undirected all-pairs hop distances as int32, computed once per device.
+
+    Disconnected pairs are set to the number of physical qubits.
+    """
+    key = coupling_map_hash(coupling_map)
+    with _cache_lock:
+        if key in _distance_cache:
+            return _distance_cache[key]
+    n = coupling_map.size()
+    dist = _bfs_distances(*_adjacency_csr(coupling_map), n, n)
+    dist.flags.writeable = False
+    with _cache_lock:
+        return _distance_cache.setdefault(key, dist)
+
+@njit
+def _grow_region(dist, weights, root, size):
+    # Greedily add the neighbour of the region closest in total to its members
+    n = dist.shape[0]
+    region = np.empty(size, dtype=np.int64)
+    inside = np.zeros(n, dtype=np.bool_)
+    frontier = dist[root] == 1
+    total = weights[root].astype(np.float64)
+    region[0] = root
+    inside[root] = True
+    cost = 0.0
+    for k in range(1, size):
+        best, best_total = -1, np.inf
+        for v in range(n):
+            if frontier[v] and not inside[v] and total[v] < best_total:
+                best, best_total = v, total[v]
+        if best < 0:
+            return region, -1.0
+        region[k] = best
+        inside[best] = True
+        frontier |= dist[best] == 1
+        cost += best_total
+        total += weights[best]
+    return region, cost
+
+@njit
+def _best_region(dist, weights, size):
+    # Regions grow along couplings (hop distance 1) and are scored by `weights`
+    best_region = np.empty(size, dtype=np.int64)
+    best_cost = -1.0
+    for root in range(dist.shape[0]):
+        region, cost = _grow_region(dist, weights, root, size)
+        if cost >= 0 and (best_cost < 0 or cost < best_cost):
+            best_region, best_cost = region, cost
+    return best_region, best_cost
+
+def select_region(coupling_map, num_qubits):
+    """Compact connected region of `num_qubits` physical qubits.
+
+    A region is grown from every physical qubit by adding the neighbour with the
+    smallest total distance to the region, and the one with the smallest sum of
+    pairwise distances is kept. Regions are cached per device and size.
+
+    Returns:
+        (region, distances): Physical qubit of every logical qubit and the int32
+        device distances between them.
+    """
+    key = (coupling_map_hash(coupling_map), num_qubits)
+    with _cache_lock:
+        if key in _region_cache:
+            return _region_cache[key]
+    dist = device_distances(coupling_map)
+    if num_qubits > dist.shape[0]:
+        raise ValueError(f"The device has {dist.shape[0]} qubits, {num_qubits} are required.")
+    region, cost = _best_region(dist, dist, num_qubits)
+    if cost < 0:
+        raise ValueError(f"The device has no connected region of {num_qubits} qubits.")
+    distances = np.ascontiguousarray(dist[np.ix_(region, region)])
+    region.flags.writeable = False
+    distances.flags.writeable = False
+    with _cache_lock:
+        return _region_cache.setdefault(key, (region, distances))
+
+def two_qubit_errors(backend):
+    """Smallest calibrated two-qubit gate error of every undirected coupling.
+
+    Couplings without a reported error get the median of the reported ones.
+
+    Returns:
+        (edges, errors): (E, 2) sorted qubit pairs and their errors.
+    """
+    best = {}
+    for name in TWO_QUBIT_GATES:
+        if name not in backend.target.operation_names:
+            continue
+        for qargs, props in backend.target[name].items():
+            if qargs is None or len(qargs) != 2:
+                continue
+            edge = tuple(sorted(qargs))
+            error = props.error if props is not None else None
+            if error is not None:
+                prev = best.get(edge)
+                best[edge] = error if prev is None else min(prev, error)
+            else:
+                best.setdefault(edge, None)
+    known = [e for e in best.values() if e is not None]
+    if not known:
+        raise ValueError(f"The backend {backend.name} reports no two-qubit gate errors.")
+    fallback = float(np.median(known))
+    edges = np.array(sorted(best), dtype=np.int64).reshape(-1, 2)
+    errors = np.array([fallback if best[tuple(e)] is None else best[tuple(e)] for e in edges.tolist()])
+    return edges, errors
+
+@njit
+def _dijkstra_distances(adj_ptr, adj, weights, n):
+    # Dense O(n^2) Dijkstra from every source; devices are sparse and small
+    dist = np.full((n, n), np.inf)
+    for s in range(n):
+        done = np.zeros(n, dtype=np.bool_)
+        dist[s, s] = 0.0
+        for _ in range(n):
+            u, best = -1, np.inf
+            for v in range(n):
+                if not done[v] and dist[s, v] < best:
+                    u, best = v, dist[s, v]
+            if u < 0:
+                break
+            done[u] = True
+            for k in range(adj_ptr[u], adj_ptr[u+1]):
+                v = adj[k]
+                if best + weights[k] < dist[s, v]:
+                    dist[s, v] = best + weights[k]
+    return dist
+
+def error_distances(backend) -> np.ndarray:
+    """All-pairs shortest paths with every coupling weighted by -log(1 - error).
+
+    The distance of two qubits is the negative log fidelity of the most reliable
+    route between them, about its expected number of two-qubit errors. Computed once
+    per calibration snapshot (`backend_hash`). Disconnected pairs are set to the
+    largest finite distance times the number of qubits.
+    """
+    key = backend_hash(backend)
+    with _cache_lock:
+        if key in _error_distance_cache:
+            return _error_distance_cache[key]
+    n = backend.num_qubits
+    edges, errors = two_qubit_errors(backend)
+    edges = np.concatenate([edges, edges[:, ::-1]])
+    weights = np.tile(-np.log1p(-np.clip(errors, 0.0, 1.0 - 1e-12)), 2)
+    order = np.argsort(edges[:, 0], kind="stable")
+    adj_ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(edges[:, 0], minlength=n), out=adj_ptr[1:])
+    dist = _dijkstra_distances(adj_ptr, edges[order, 1].copy(), weights[order], n)
+    finite = np.isfinite(dist)
+    dist[~finite] = dist[finite].max(initial=1.0) * n
+    dist.flags.writeable = False
+    with _cache_lock:
+        return _error_distance_cache.setdefault(key, dist)
+
+def select_calibrated_region(backend, num_qubits):
+    """Like `select_region`, with regions scored by their `error_distances`.
+
+    Returns:
+        (region, distances): Physical qubit of every logical qubit and the float64
+        error distances between them.
+    """
+    key = (backend_hash(backend), num_qubits)
+    with _cache_lock:
+        if key in _region_cache:
+            return _region_cache[key]
+    dist = device_distances(backend.coupling_map)
+    weights = error_distances(backend)
+    if num_qubits > dist.shape[0]:
+        raise ValueError(f"The device has {dist.shape[0]} qubits, {num_qubits} are required.")
+    region, cost = _best_region(dist, weights, num_qubits)
+    if cost < 0:
+        raise ValueError(f"The device has no connected region of {num_qubits} qubits.")
+    distances = np.ascontiguousarray(weights[np.ix_(region, region)])
+    region.flags.writeable = False
+    distances.flags.writeable = False
+    with _cache_lock:
+        return _region_cache.setdefault(key, (region, distances))
@@ -2,6 +2,8 @@ from itertools import combinations
 import numpy as np
 from numba import njit
 
+from .integrals import MajoranaTerms
+
 def quadratic_terms_indices(N):
     return list(combinations(range(N), 2))
 
@@ -76,3 +78,102 @@ def quartic_terms(x, z, N):
 
     return x_terms, z_terms
 
+
+def _majorana_product(monomial, coeff, row):
+    """Right-multiply a sorted Majorana monomial by a single Majorana."""
+    passed = sum(1 for r in monomial if r > row)
+    sign = -1 if passed % 2 else 1
+    if row in monomial:
+        monomial = tuple(r for r in monomial if r != row)
+    else:
+        monomial = tuple(sorted(monomial + (row,)))
+    return monomial, sign * coeff
+
+def majorana_products(fermionic_op, N, atol=1e-12) -> dict:
+    """Expand a FermionicOp into products of Majorana rows.
+
+    Ladder operators on mode i expand into rows i and i+N following the convention
+    of `MajoranaMapper._map_single`, which composes a term right to left with
+    creation 0.5*(g - i g') and annihilation 0.5*(g + i g'). Contributions are summed
+    so that products cancelling between terms are dropped.
+
+    Returns:
+        dict: Sorted row tuples mapped to the coefficient of the ordered product.
+    """
+    if isinstance(fermionic_op, MajoranaTerms):
+        products = {tuple(int(r) for r in rows if r >= 0): c
+                    for rows, c in zip(fermionic_op.term_indices, fermionic_op.coeffs)}
+        products[()] = fermionic_op.constant
+        return {m: c for m, c in products.items() if abs(c) > atol}
+
+    products = {}
+    for label, coeff in fermionic_op.items():
+        expansion = {(): coeff}
+        for op in reversed(label.split()):
+            idx = int(op.split('_')[1])
+            phase = -0.5j if op.startswith('+') else 0.5j
+            updated = {}
+            for monomial, c in expansion.items():
+                for row, factor in ((idx, 0.5), (idx + N, phase)):
+                    key, value = _majorana_product(monomial, c * factor, row)
+                    updated[key] = updated.get(key, 0) + value
+            expansion = updated
+        for monomial, c in expansion.items():
+            products[monomial] = products.get(monomial, 0) + c
+
+    return {m: c for m, c in products.items() if abs(c) > atol}
+
+def fermionic_majorana_terms(fermionic_op, N, atol=1e-12) -> MajoranaTerms:
+    """`majorana_products` of a FermionicOp as `MajoranaTerms` arrays."""
+    products = majorana_products(fermionic_op, N, atol)
+    constant = products.pop((), 0.0)
+    width = max((len(m) for m in products), default=0)
+    indices = np.full((len(products), width), -1, dtype=np.int64)
+    for t, m in enumerate(products):
+        indices[t, :len(m)] = m
+    coeffs = np.array(list(products.values()), dtype=np.complex128)
+    return MajoranaTerms(N, indices, coeffs, complex(constant))
+
+def majorana_term_indices(fermionic_op, N, atol=1e-12) -> np.ndarray:
+    """Majorana row products that survive in the mapped operator, identity excluded.
+
+    Returns:
+        np.ndarray: (T, K) row indices padded with -1, K the largest product length.
+    """
+    if isinstance(fermionic_op, MajoranaTerms):
+        return fermionic_op.term_indices[np.abs(fermionic_op.coeffs) > atol]
+    terms = [m for m in majorana_products(fermionic_op, N, atol) if m]
+    width = max((len(m) for m in terms), default=0)
+    indices = np.full((len(terms), width), -1, dtype=np.int64)
+    for t, m in enumerate(sorted(terms)):
+        indices[t, :len(m)] = m
+    return indices
+
+def quadratic_majorana_terms(fermionic_op, N, atol=1e-12) -> np.ndarray:
+    """(T, 2) rows of the products of two Majoranas, the terms scored by the subspace strategy."""
+    terms = majorana_term_indices(fermionic_op, N, atol)
+    return np.ascontiguousarray(terms[(terms >= 0).sum(axis=1) == 2, :2])
+
+def term_row_incidence(term_indices: np.ndarray, num_rows: int):
+    """CSR index of the terms each Majorana row appears in.
+
+    Returns:
+        (row_ptr, term_ids): the terms containing row n are term_ids[row_ptr[n]:row_ptr[n+1]].
+    """
+    rows = term_indices[term_indices >= 0]
+    terms = np.nonzero(term_indices >= 0)[0]
+    order = np.argsort(rows, kind="stable")
+    row_ptr = np.zeros(num_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=num_rows), out=row_ptr[1:])
+    return row_ptr, terms[order].astype(np.int64)
+
+def term_csr(term_indices: np.ndarray):
+    """CSR form of padded term indices.
+
+    Returns:
+        (term_ptr, term_rows): the rows of term t are term_rows[term_ptr[t]:term_ptr[t+1]].
+    """
+    valid = term_indices >= 0
+    term_ptr = np.zeros(term_indices.shape[0] + 1, dtype=np.int64)
+    np.cumsum(valid.sum(axis=1), out=term_ptr[1:])
+    return term_ptr, term_indices[valid].astype(np.int64)
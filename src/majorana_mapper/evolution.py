@@ -0,0 +1,178 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from numba import njit
+
+from .annealing import anneal_adaptive
+
+@njit
+def _commutes(x1, z1, x2, z2) -> bool:
+    return (np.sum(x1 & z2) + np.sum(z1 & x2)) % 2 == 0
+
+@njit
+def _anticommute_with_rows(vx, vz, x, z, rows, count) -> bool:
+    """Multiply v by chosen rows until it anticommutes with all of them, in place.
+
+    Multiplying by the product of a subset J of pairwise anticommuting rows flips the
+    commutation of v with the rows outside J if |J| is odd, and with those inside J
+    if |J| is even. The rows commuting with v can thus be fixed unless they are odd
+    in number while `count` is odd, i.e. unless v commutes with their product.
+    """
+    bad = np.zeros(count, dtype=np.bool_)
+    num_bad = 0
+    for k in range(count):
+        r = rows[k]
+        if _commutes(vx, vz, x[r], z[r]):
+            bad[k] = True
+            num_bad += 1
+    if num_bad % 2 == 1:
+        if count % 2 == 1:
+            return False
+        bad = ~bad
+    for k in range(count):
+        if bad[k]:
+            vx ^= x[rows[k]]
+            vz ^= z[rows[k]]
+    return True
+
+@njit
+def _flip_against(vx, vz, px, pz) -> bool:
+    # Flip one qubit of v so that its commutation with the product p changes,
+    # preferably on a qubit v already acts on
+    q = -1
+    for k in range(vx.shape[0]):
+        if (px[k] or pz[k]) and (q < 0 or vx[k] or vz[k]):
+            q = k
+            if vx[k] or vz[k]:
+                break
+    if q < 0:
+        return False
+    if px[q]:
+        vz[q] = not vz[q]
+    else:
+        vx[q] = not vx[q]
+    return True
+
+@njit
+def crossover_rows(xa, za, xb, zb, block):
+    """GF(2)-valid recombination of two Majorana tables.
+
+    The child takes both rows of every mode in `block` from parent b. Every other row
+    is taken from parent a and multiplied by products of the rows already placed, so
+    that all rows keep anticommuting pairwise (2N anticommuting Paulis are always
+    independent). If the row of a would close the placed rows into a set that nothing
+    else anticommutes with, the next row of a (then of b) is used instead. If it cannot
+    be fixed by products at all, one of its qubits is flipped first.
+
+    Returns:
+        (x, z, ok): The child, or a copy of parent a with ok False if no candidate fits.
+    """
+    R, N = xa.shape
+    M = R // 2
+    x = np.zeros((R, N), dtype=np.bool_)
+    z = np.zeros((R, N), dtype=np.bool_)
+    rows = np.empty(R, dtype=np.int64)
+    count = 0
+    px = np.zeros(N, dtype=np.bool_)
+    pz = np.zeros(N, dtype=np.bool_)
+    for m in range(M):
+        if block[m]:
+            for r in (m, m + M):
+                x[r] = xb[r]
+                z[r] = zb[r]
+                px ^= xb[r]
+                pz ^= zb[r]
+                rows[count] = r
+                count += 1
+
+    for m in range(M):
+        if block[m]:
+            continue
+        for r in (m, m + M):
+            placed = False
+            for c in range(2 * R):
+                k = (r + c) % R
+                vx, vz = (xa[k].copy(), za[k].copy()) if c < R else (xb[k].copy(), zb[k].copy())
+                if not _anticommute_with_rows(vx, vz, x, z, rows, count):
+                    if not _flip_against(vx, vz, px, pz):
+                        continue
+                    _anticommute_with_rows(vx, vz, x, z, rows, count)
+                if count % 2 == 0 and (vx == px).all() and (vz == pz).all():
+                    continue
+                placed = True
+                break
+            if not placed:
+                return xa.copy(), za.copy(), False
+            x[r] = vx
+            z[r] = vz
+            px ^= vx
+            pz ^= vz
+            rows[count] = r
+            count += 1
+    return x, z, True
+
+@njit
+def population_energies(xs, zs, energy, energy_args=()) -> np.ndarray:
+    """Energies of a stacked (P, 2N, N) population in one compiled loop."""
+    energies = np.empty(xs.shape[0])
+    for k in range(xs.shape[0]):
+        energies[k] = energy(xs[k], zs[k], *energy_args)
+    return energies
+
+def _random_walk(x, z, explore, num_moves, rng):
+    x, z = x.copy(), z.copy()
+    for n in rng.integers(0, x.shape[0], num_moves):
+        x, z = explore(n, x, z)
+    return x, z
+
+def evolve(x, z, explore, energy, generations, population=16, elite=2, refine_steps=2000,
+           workers=None, p0=0.05, p_end=1e-3, involution=True, seed=None, energy_args=()):
+    """Memetic search: a population of tables recombined by `crossover_rows`.
+
+    The initial population holds the start table and random walks from it. Every
+    generation keeps the `elite` best tables and fills up with children of tournament-
+    selected parents, which inherit a random contiguous block of modes from the second
+    parent. Every child is refined by a short `anneal_adaptive` run; the engines release
+    the GIL, so children are refined concurrently on `workers` threads.
+
+    Returns:
+        (x_opt, z_opt, best_energies, energy_opt): The best table, the best energy of
+        every generation and its energy.
+    """
+    rng = np.random.default_rng(seed)
+    R = x.shape[0]
+    M = R // 2
+
+    def refine(table):
+        x_r, z_r, _, e = anneal_adaptive(table[0], table[1], explore, energy, num_steps=refine_steps,
+                                         p0=p0, p_end=p_end, involution=involution, energy_args=energy_args)
+        return x_r, z_r, e
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="majorana-evolve") as pool:
+        tables = [(x.copy(), z.copy())] + [_random_walk(x, z, explore, R, rng) for _ in range(population - 1)]
+        members = list(pool.map(refine, tables))
+        xs = np.stack([m[0] for m in members])
+        zs = np.stack([m[1] for m in members])
+        energies = population_energies(xs, zs, energy, energy_args)
+
+        best_energies = [energies.min()]
+        for _ in range(generations):
+            order = np.argsort(energies, kind="stable")
+            children = []
+            for _ in range(population - elite):
+                a, b = (min(rng.integers(0, population, 2), key=lambda k: energies[k]) for _ in range(2))
+                start, length = rng.integers(0, M), rng.integers(1, M) if M > 1 else 1
+                block = np.zeros(M, dtype=bool)
+                block[(start + np.arange(length)) % M] = True
+                x_c, z_c, ok = crossover_rows(xs[a], zs[a], xs[b], zs[b], block)
+                if not ok:
+                    x_c, z_c = _random_walk(xs[a], zs[a], explore, M, rng)
+                children.append((x_c, z_c))
+
+            refined = list(pool.map(refine, children))
+            xs = np.concatenate([xs[order[:elite]], np.stack([c[0] for c in refined])])
+            zs = np.concatenate([zs[order[:elite]], np.stack([c[1] for c in refined])])
+            energies = population_energies(xs, zs, energy, energy_args)
+            best_energies.append(energies.min())
+
+    best = int(np.argmin(energies))
+    return xs[best].copy(), zs[best].copy(), np.array(best_energies), energies[best]
@@ -30,3 +30,8 @@ def bk_majoranas(N: int) -> Union[np.ndarray, np.ndarray]:
 
     return x, z, paulis
 
+
+def pauli_table_arrays(pauli_table) -> Union[np.ndarray, np.ndarray]:
+    """Symplectic rows of a `pauli_table`, ordered like `jw_majoranas`."""
+    paulis = PauliList([p for p, _ in pauli_table] + [q for _, q in pauli_table])
+    return paulis.x, paulis.z
@@ -0,0 +1,26 @@
+import hashlib
+import numpy as np
+
+from .integrals import MajoranaTerms
+from .device import backend_hash
+
+def mapping_fingerprint(N, strategy="baseline", coupling_map=None, hamiltonian=None, symmetries=None,
+                        backend=None) -> str:
+    """Content hash identifying an optimization request."""
+    h = hashlib.sha256()
+    h.update(f"{N}|{strategy}|".encode())
+    if coupling_map is not None:
+        h.update(repr(sorted(coupling_map.get_edges())).encode())
+    h.update(b"|")
+    if isinstance(hamiltonian, MajoranaTerms):
+        h.update(np.ascontiguousarray(hamiltonian.term_indices).tobytes())
+        h.update(np.ascontiguousarray(hamiltonian.coeffs).tobytes())
+    elif hamiltonian is not None:
+        h.update(repr(sorted((label, complex(c)) for label, c in hamiltonian.items())).encode())
+    h.update(b"|")
+    if symmetries is not None:
+        h.update(repr([list(s) for s in symmetries]).encode())
+    if backend is not None:
+        # Calibration snapshot, keeps fingerprints without a backend unchanged
+        h.update(f"|{backend_hash(backend)}".encode())
+    return h.hexdigest()
@@ -0,0 +1,198 @@
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import NamedTuple
+import numpy as np
+
+from .majorana_mapper import MajoranaMapper, set_n
+from .fingerprint import mapping_fingerprint
+from .device import backend_hash
+
+# Columns of the consolidated results, in order
+COLUMNS = ("molecule", "mapper", "num_qubits", "depth", "gates", "cnots", "nonlocal_gates",
+           "table_time", "ansatz_time", "transpile_time", "cached", "error")
+
+# Gates that act on a single qubit on the generic and IBM backends
+LOCAL_GATES = ("u", "p", "rz", "sx", "x", "id", "measure", "barrier", "delay", "reset")
+
+class BenchmarkCase(NamedTuple):
+    """One (molecule, mapper) pair of the benchmark matrix."""
+    molecule: str
+    mapper_name: str
+    mapper: object # Any FermionicMapper, pickled to the worker
+    num_spin_orbitals: int
+    num_particles: tuple[int, int]
+
+def _digest(*parts) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(f"{part}|".encode())
+    return h.hexdigest()
+
+@lru_cache(maxsize=None)
+def code_salt() -> str:
+    """Hash of the package sources, so that tables of an older annealer are never served."""
+    package = os.path.dirname(os.path.abspath(__file__))
+    h = hashlib.sha256()
+    for name in sorted(os.listdir(package)):
+        if name.endswith(".py"):
+            with open(os.path.join(package, name), "rb") as f:
+                h.update(name.encode() + b"|" + f.read())
+    return h.hexdigest()
+
+def table_key(mapper, N) -> str:
+    """Content hash of the table a mapper produces for N modes.
+
+    Besides the request fingerprint, it covers the mapper settings that change the
+    table (blocks, library use, warm start) and the package sources.
+    """
+    if isinstance(mapper, MajoranaMapper):
+        blocks = mapper.blocks
+        if blocks is not None and not isinstance(blocks, int):
+            blocks = [[int(m) for m in b] for b in blocks]
+        warm_start = None
+        if mapper.warm_start is not None:
+            warm_start = _digest(*(np.asarray(a, dtype=bool).tobytes() for a in mapper.warm_start))
+        return _digest(mapping_fingerprint(N, mapper.strategy, mapper.coupling_map, mapper.hamiltonian,
+                                           mapper.symmetries, mapper.backend),
+                       blocks, mapper.use_library, warm_start, code_salt())
+    return _digest(type(mapper).__module__, type(mapper).__qualname__, N)
+
+def _atomic_write(path, write):
+    # Workers may produce the same artifact concurrently; the last rename wins
+    tmp = f"{path}.{os.getpid()}.tmp"
+    write(tmp)
+    os.replace(tmp, path)
+
+def _dump_circuit(path, circuit):
+    from qiskit import qpy
+    def write(tmp):
+        with open(tmp, "wb") as f:
+            qpy.dump(circuit, f)
+    _atomic_write(path, write)
+
+def _load_circuit(path):
+    from qiskit import qpy
+    with open(path, "rb") as f:
+        return qpy.load(f)[0]
+
+# State every worker process receives once, instead of with every case
+_worker = {}
+
+def _init_worker(backend, cache_dir, optimization_level, seed):
+    _worker.update(backend=backend, cache_dir=cache_dir, backend_key=backend_hash(backend),
+                   optimization_level=optimization_level, seed=seed)
+
+def _artifact(kind, key, suffix):
+    directory = os.path.join(_worker["cache_dir"], kind)
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, key + suffix)
+
+def run_case(case: BenchmarkCase) -> dict:
+    """Table, UCCSD ansatz and transpiled circuit of one case, each served from the cache if present.
+
+    Artifacts are keyed by content hash: the table by `table_key`, the ansatz by the
+    table and particle numbers, the transpiled circuit by the ansatz, `backend_hash`
+    and the transpiler settings. A rerun only redoes the stages whose inputs changed.
+    """
+    from qiskit import transpile
+    from qiskit_nature.second_q.circuit.library import UCCSD, HartreeFock
+
+    N = case.num_spin_orbitals
+    row = dict(molecule=case.molecule, mapper=case.mapper_name, num_qubits=N,
+               table_time=0.0, ansatz_time=0.0, transpile_time=0.0, cached=[], error="")
+    try:
+        set_n(N)
+        mapper = case.mapper
+        table = table_key(mapper, N)
+        ansatz_key = _digest(table, case.num_particles)
+        transpiled_path = _artifact("transpiled", _digest(ansatz_key, _worker["backend_key"],
+                                    _worker["optimization_level"], _worker["seed"]), ".qpy")
+
+        if os.path.exists(transpiled_path):
+            row["cached"].append("transpiled")
+            transpiled = _load_circuit(transpiled_path)
+        else:
+            ansatz_path = _artifact("ansatz", ansatz_key, ".qpy")
+            if os.path.exists(ansatz_path):
+                row["cached"].append("ansatz")
+                ansatz = _load_circuit(ansatz_path)
+            else:
+                if isinstance(mapper, MajoranaMapper):
+                    table_path = _artifact("tables", table, ".maj")
+                    start = time.perf_counter()
+                    if os.path.exists(table_path):
+                        row["cached"].append("table")
+                        mapper = MajoranaMapper.from_file(table_path)
+                    else:
+                        mapper.build_majorana_arrays(N)
+                        _atomic_write(table_path, mapper.save)
+                    row["table_time"] = time.perf_counter() - start
+
+                start = time.perf_counter()
+                num_spatial_orbitals = N // 2
+                initial_state = HartreeFock(num_spatial_orbitals, case.num_particles, mapper)
+                ansatz = UCCSD(num_spatial_orbitals, case.num_particles, mapper,
+                               initial_state=initial_state).decompose()
+                row["ansatz_time"] = time.perf_counter() - start
+                _dump_circuit(ansatz_path, ansatz)
+
+            start = time.perf_counter()
+            transpiled = transpile(ansatz, _worker["backend"], optimization_level=_worker["optimization_level"],
+                                   seed_transpiler=_worker["seed"])
+            row["transpile_time"] = time.perf_counter() - start
+            _dump_circuit(transpiled_path, transpiled)
+
+        ops = transpiled.count_ops()
+        row.update(
+            depth=transpiled.depth(),
+            gates=sum(ops.values()),
+            cnots=ops.get("cx", ops.get("ecr", ops.get("cz", 0))),
+            nonlocal_gates=sum(v for k, v in ops.items() if k not in LOCAL_GATES),
+        )
+    except Exception as e:
+        row["error"] = f"{type(e).__name__}: {e}"
+    row["cached"] = ",".join(row["cached"])
+    return row
+
+def to_columns(rows) -> dict:
+    """Consolidate result rows into one array per column, -1 for missing counts."""
+    columns = {}
+    for name in COLUMNS:
+        values = [r.get(name, -1) for r in rows]
+        if name.endswith("_time"):
+            columns[name] = np.array(values, dtype=np.float64)
+        elif name in ("molecule", "mapper", "cached", "error"):
+            columns[name] = np.array(values, dtype=str)
+        else:
+            columns[name] = np.array(values, dtype=np.int64)
+    return columns
+
+def save_columns(path, columns):
+    np.savez_compressed(path, **columns)
+
+def load_columns(path) -> dict:
+    with np.load(path) as data:
+        return {name: data[name] for name in data.files}
+
+def run_benchmarks(cases, backend, cache_dir, workers=None, optimization_level=1, seed=42) -> dict:
+    """Run every case on a pool of worker processes with artifacts cached under `cache_dir`.
+
+    Transpilation holds the GIL, so the cases run in separate processes. The backend
+    is sent to each worker once.
+
+    Args:
+        cases: `BenchmarkCase` list, e.g. every (molecule, mapper) pair of a sweep.
+        backend: Target of the transpiler. Its calibration is part of the cache key.
+        workers: Number of processes, as for `ProcessPoolExecutor`.
+
+    Returns:
+        dict: Result columns (see `COLUMNS`), one entry per case in order.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(backend, cache_dir, optimization_level, seed)) as pool:
+        rows = list(pool.map(run_case, cases))
+    return to_columns(rows)
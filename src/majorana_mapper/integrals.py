@@ -0,0 +1,229 @@
+import re
+from itertools import islice
+from typing import NamedTuple
+import numpy as np
+from numba import njit
+
+class MajoranaTerms(NamedTuple):
+    """A Hamiltonian as typed arrays of Majorana row products.
+
+    Rows follow `majorana_products`: mode i expands into rows i and i+N. Accepted
+    wherever the mapper or the cost functions take a `FermionicOp`.
+    """
+    num_spin_orbitals: int
+    term_indices: np.ndarray # (T, K) sorted rows, padded with -1
+    coeffs: np.ndarray # (T,) complex coefficients of the ordered products
+    constant: complex = 0.0
+
+def _fortran_floats(lines):
+    for line in lines:
+        yield line.replace("D", "E").replace("d", "e")
+
+def read_fcidump(path, threshold=1e-12, chunk_size=1 << 16) -> dict:
+    """Stream an FCIDUMP file into index/coefficient arrays.
+
+    Integral lines are parsed `chunk_size` at a time and entries with a magnitude
+    up to `threshold` are dropped. The symmetry-unique integrals of the file are
+    kept as they are, with 0-based spatial orbital indices.
+
+    Returns:
+        dict: `norb`, `nelec`, `ms2`, the `core` energy, `one_body` as (p, q)
+        indices and values, and `two_body` as chemists' (pq|rs) indices and values.
+    """
+    with open(path) as f:
+        header = ""
+        for line in f:
+            header += line
+            if re.search(r"(&END|/)\s*$", line.strip()):
+                break
+        fields = dict(re.findall(r"(NORB|NELEC|MS2)\s*=\s*(-?\d+)", header.upper()))
+
+        one_idx, one_val, two_idx, two_val = [], [], [], []
+        core = 0.0
+        while True:
+            lines = list(_fortran_floats(islice(f, chunk_size)))
+            if not lines:
+                break
+            chunk = np.loadtxt(lines, ndmin=2)
+            values, idx = chunk[:, 0], chunk[:, 1:].astype(np.int64) - 1
+            core += values[(idx < 0).all(axis=1)].sum()
+            keep = np.abs(values) > threshold
+            two = keep & (idx[:, 2] >= 0)
+            one = keep & (idx[:, 0] >= 0) & (idx[:, 1] >= 0) & (idx[:, 2] < 0)
+            two_idx.append(idx[two])
+            two_val.append(values[two])
+            one_idx.append(idx[one, :2])
+            one_val.append(values[one])
+
+    return {
+        "norb": int(fields.get("NORB", 0)),
+        "nelec": int(fields.get("NELEC", 0)),
+        "ms2": int(fields.get("MS2", 0)),
+        "core": core,
+        "one_body": (np.concatenate(one_idx or [np.zeros((0, 2), np.int64)]),
+                     np.concatenate(one_val or [np.zeros(0)])),
+        "two_body": (np.concatenate(two_idx or [np.zeros((0, 4), np.int64)]),
+                     np.concatenate(two_val or [np.zeros(0)])),
+    }
+
+def load_integrals(one_body_path, two_body_path, threshold=1e-12, core=0.0) -> dict:
+    """Sparse index/coefficient arrays of dense `.npy` integrals, in the format of `read_fcidump`.
+
+    The two-body file holds chemists' (pq|rs) as an (n, n, n, n) array. It is memory-
+    mapped and scanned one leading index at a time.
+    """
+    h1 = np.load(one_body_path, mmap_mode="r")
+    h2 = np.load(two_body_path, mmap_mode="r")
+    norb = h1.shape[0]
+
+    one_idx = np.argwhere(np.abs(h1) > threshold)
+    two_idx, two_val = [], []
+    for p in range(norb):
+        block = np.asarray(h2[p])
+        idx = np.argwhere(np.abs(block) > threshold)
+        two_idx.append(np.column_stack([np.full(len(idx), p), idx]))
+        two_val.append(block[tuple(idx.T)])
+
+    return {
+        "norb": norb,
+        "core": core,
+        "one_body": (one_idx, np.asarray(h1[tuple(one_idx.T)])),
+        "two_body": (np.concatenate(two_idx), np.concatenate(two_val)),
+    }
+
+def _unique_symmetric(idx, val, permutations):
+    # Expand real-orbital permutation symmetry, keeping each index tuple once
+    idx = np.concatenate([idx[:, p] for p in permutations])
+    val = np.tile(val, len(permutations))
+    idx, first = np.unique(idx, axis=0, return_index=True)
+    return idx, val[first]
+
+def ladder_terms(integrals, symmetric=True):
+    """Spin-orbital ladder terms of an integral set, with alpha modes before beta.
+
+    H = sum h_pq a+_p a_q + 1/2 sum (pq|rs) a+_p a+_r a_s a_q over both spins, as in
+    qiskit-nature's `ElectronicEnergy`.
+
+    Args:
+        integrals: Output of `read_fcidump` or `load_integrals`.
+        symmetric: Expand the 8-fold (two-body) and 2-fold (one-body) symmetry of
+            real orbitals, as needed for the symmetry-unique FCIDUMP entries.
+
+    Returns:
+        (modes, creation, coeffs): (T, 4) mode indices padded with -1, whether each
+        operator is a creation operator, and the term coefficients.
+    """
+    n = integrals["norb"]
+    one_idx, one_val = integrals["one_body"]
+    two_idx, two_val = integrals["two_body"]
+    if symmetric:
+        one_idx, one_val = _unique_symmetric(one_idx, one_val, [[0, 1], [1, 0]])
+        two_idx, two_val = _unique_symmetric(two_idx, two_val, [
+            [0, 1, 2, 3], [1, 0, 2, 3], [0, 1, 3, 2], [1, 0, 3, 2],
+            [2, 3, 0, 1], [3, 2, 0, 1], [2, 3, 1, 0], [3, 2, 1, 0],
+        ])
+
+    modes, coeffs = [], []
+    for spin in (0, n):
+        p, q = one_idx.T + spin
+        modes.append(np.column_stack([p, q, np.full(len(p), -1), np.full(len(p), -1)]))
+        coeffs.append(one_val)
+    p, q, r, s = two_idx.T
+    for sigma in (0, n):
+        for tau in (0, n):
+            term = np.column_stack([p + sigma, r + tau, s + tau, q + sigma])
+            valid = (term[:, 0] != term[:, 1]) & (term[:, 2] != term[:, 3])
+            modes.append(term[valid])
+            coeffs.append(0.5 * two_val[valid])
+
+    modes = np.concatenate(modes).astype(np.int64)
+    creation = np.zeros(modes.shape, dtype=bool)
+    creation[:, 0] = True
+    creation[:, 1] = modes[:, 2] >= 0
+    return modes, creation, np.concatenate(coeffs).astype(np.complex128)
+
+@njit
+def _expand_majoranas(modes, creation, coeffs, N):
+    # Every ladder operator is 0.5*g + phase*g', so a term of k operators expands
+    # into 2^k ordered products, multiplied right to left as in `majorana_products`
+    T, K = modes.shape
+    rows = np.full((T << K, K), -1, dtype=np.int64)
+    values = np.zeros(T << K, dtype=np.complex128)
+    monomial = np.empty(K, dtype=np.int64)
+    out = 0
+    for t in range(T):
+        k = 0
+        while k < K and modes[t, k] >= 0:
+            k += 1
+        for choice in range(1 << k):
+            length = 0
+            value = coeffs[t]
+            for o in range(k - 1, -1, -1):
+                if (choice >> o) & 1:
+                    row = modes[t, o] + N
+                    value *= -0.5j if creation[t, o] else 0.5j
+                else:
+                    row = modes[t, o]
+                    value *= 0.5
+                # Right-multiply the sorted monomial by the row
+                passed = 0
+                pos = length
+                found = -1
+                for m in range(length):
+                    if monomial[m] > row:
+                        passed += 1
+                        if pos == length:
+                            pos = m
+                    elif monomial[m] == row:
+                        found = m
+                if passed % 2:
+                    value = -value
+                if found >= 0:
+                    monomial[found:length - 1] = monomial[found + 1:length].copy()
+                    length -= 1
+                else:
+                    monomial[pos + 1:length + 1] = monomial[pos:length].copy()
+                    monomial[pos] = row
+                    length += 1
+            rows[out, :length] = monomial[:length]
+            values[out] = value
+            out += 1
+    return rows[:out], values[:out]
+
+def _sum_rows(rows, values):
+    # Sum the values of equal row tuples
+    rows, inverse = np.unique(rows, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    summed = (np.bincount(inverse, weights=values.real, minlength=len(rows))
+              + 1j * np.bincount(inverse, weights=values.imag, minlength=len(rows)))
+    return rows, summed
+
+def majorana_terms(modes, creation, coeffs, N, atol=1e-12, chunk_size=1 << 14) -> MajoranaTerms:
+    """Vectorized `majorana_products` of ladder-term arrays, e.g. from `ladder_terms`.
+
+    Products of `chunk_size` terms at a time are expanded in a compiled kernel, then
+    summed per row tuple with `np.unique` into the products of the previous chunks,
+    so no string-keyed operator is ever built.
+    """
+    rows = np.zeros((0, modes.shape[1]), dtype=np.int64)
+    summed = np.zeros(0, dtype=np.complex128)
+    for start in range(0, len(modes), chunk_size):
+        stop = start + chunk_size
+        chunk_rows, chunk_values = _expand_majoranas(modes[start:stop], creation[start:stop],
+                                                     coeffs[start:stop], N)
+        rows, summed = _sum_rows(np.concatenate([rows, chunk_rows]),
+                                 np.concatenate([summed, chunk_values]))
+
+    identity = (rows < 0).all(axis=1)
+    constant = summed[identity].sum()
+    keep = ~identity & (np.abs(summed) > atol)
+    rows = rows[keep]
+    width = int((rows >= 0).sum(axis=1).max(initial=0))
+    return MajoranaTerms(N, np.ascontiguousarray(rows[:, :width]), summed[keep], complex(constant))
+
+def integral_terms(integrals, threshold=1e-12, symmetric=True, chunk_size=1 << 14) -> MajoranaTerms:
+    """Majorana product arrays of an integral set, with the core energy as constant."""
+    N = 2 * integrals["norb"]
+    modes, creation, coeffs = ladder_terms(integrals, symmetric)
+    terms = majorana_terms(modes, creation, coeffs, N, threshold, chunk_size)
+    return terms._replace(constant=terms.constant + integrals.get("core", 0.0))
@@ -0,0 +1,175 @@
+import hashlib
+import os
+from functools import lru_cache
+from math import factorial
+import numpy as np
+from numba import njit
+
+from .fermionic_mappings import bk_majoranas
+from .tableau import spread_node
+from .cost_functions import quadratic_term_mean_weight, connectivity_aware_cost
+from .annealing import anneal_memoized, anneal_scheduled
+from .transposition import zobrist_keys, tableau_hash, spread_node_hash, transposition_table
+from .serialization import table_bytes, parse_table, table_rows
+
+# Precomputed tables for small registers, built with `python -m majorana_mapper.library`
+LIBRARY_PATH = os.path.join(os.path.dirname(__file__), "data", "table_library.npz")
+MAX_LIBRARY_N = 8
+
+# The spread_node orbit of a table holds (2N+1)! tables, so it is enumerated up to N=4
+ORBIT_CAPACITY = 400_000
+
+# Provenance recorded in the strategy field of every entry
+ORBIT_OPTIMAL = "orbit-optimal"
+BEST_KNOWN = "best-known"
+
+def library_key(N, distances=None) -> str:
+    """Library key of the quadratic weight (no device) or of the routing cost on a region."""
+    if distances is None:
+        return f"weight-{N}"
+    digest = hashlib.sha256(np.ascontiguousarray(distances, dtype="<i4").tobytes()).hexdigest()
+    return f"routing-{N}-{digest[:16]}"
+
+@lru_cache(maxsize=None)
+def _library(path):
+    if not os.path.exists(path):
+        return {}
+    with np.load(path) as data:
+        return {key: data[key] for key in data.files}
+
+def lookup_table(key, path=LIBRARY_PATH):
+    """Rows, energy and provenance of a library entry, or None."""
+    entry = _library(path).get(key)
+    if entry is None:
+        return None
+    table = parse_table(entry)
+    x, z = table_rows(table)
+    return x, z, table["energy"], table["strategy"]
+
+@njit
+def _insert_hash(seen, used, h) -> bool:
+    # Open addressing; returns False if h was already present
+    mask = np.uint64(seen.shape[0] - 1)
+    i = h & mask
+    while used[i]:
+        if seen[i] == h:
+            return False
+        i = (i + np.uint64(1)) & mask
+    seen[i] = h
+    used[i] = True
+    return True
+
+@njit
+def orbit_search(x, z, energy, keys, capacity):
+    """Breadth-first enumeration of the `spread_node` orbit of a table.
+
+    States are deduplicated by Zobrist hash.
+
+    Returns:
+        (x, z, energy, num_states, complete): The best table of the orbit, the number of
+        states visited and whether the whole orbit fit into `capacity`.
+    """
+    R, N = x.shape
+    xs = np.empty((capacity, R, N), dtype=np.bool_)
+    zs = np.empty((capacity, R, N), dtype=np.bool_)
+    size = 1
+    while size < 2 * capacity:
+        size <<= 1
+    seen = np.zeros(size, dtype=np.uint64)
+    used = np.zeros(size, dtype=np.bool_)
+
+    xs[0] = x
+    zs[0] = z
+    _insert_hash(seen, used, tableau_hash(x, z, keys))
+    best, energy_best = 0, energy(x, z)
+    head, tail = 0, 1
+    while head < tail:
+        h = tableau_hash(xs[head], zs[head], keys)
+        for n in range(R):
+            if not _insert_hash(seen, used, h ^ spread_node_hash(n, xs[head], zs[head], keys)):
+                continue
+            if tail == capacity:
+                return xs[best].copy(), zs[best].copy(), energy_best, tail, False
+            x_new, z_new = spread_node(n, xs[head].copy(), zs[head].copy())
+            xs[tail] = x_new
+            zs[tail] = z_new
+            e = energy(x_new, z_new)
+            if e < energy_best:
+                best, energy_best = tail, e
+            tail += 1
+        head += 1
+    return xs[best].copy(), zs[best].copy(), energy_best, tail, True
+
+def best_table(N, energy, local_moves=False, restarts=4, steps=200_000):
+    """Best table found for a cost: the exhaustive orbit for small N, else annealing restarts.
+
+    Args:
+        local_moves: Also run `anneal_scheduled`, for the quadratic weight only.
+
+    Returns:
+        (x, z, energy, provenance)
+    """
+    x0, z0, _ = bk_majoranas(N)
+    keys = zobrist_keys(2*N, N)
+    candidates = []
+    orbit_complete = False
+    if factorial(2*N + 1) <= ORBIT_CAPACITY:
+        x, z, e, _, orbit_complete = orbit_search(x0.copy(), z0.copy(), energy, keys, ORBIT_CAPACITY)
+        candidates.append((e, x, z))
+
+    for _ in range(restarts):
+        table_keys, table_values = transposition_table(16)
+        x, z, _, e, _, _ = anneal_memoized(x0.copy(), z0.copy(), spread_node, spread_node_hash, energy,
+                                           keys, table_keys, table_values, num_steps=steps)
+        candidates.append((e, x, z))
+        if local_moves:
+            x, z, _, e, _ = anneal_scheduled(x0.copy(), z0.copy(), num_steps=steps)
+            candidates.append((e, x, z))
+
+    e, x, z = min(candidates, key=lambda c: c[0])
+    # The orbit is only exhaustive over spread_node moves, so it is optimal unless
+    # local moves found a better table outside of it
+    provenance = ORBIT_OPTIMAL if orbit_complete and e == candidates[0][0] else BEST_KNOWN
+    return x, z, e, provenance
+
+def common_topologies(N) -> dict:
+    """Coupling maps of the devices the library is built for."""
+    from qiskit.transpiler import CouplingMap
+    from qiskit_ibm_runtime.fake_provider import FakeBrisbane
+
+    topologies = {
+        "line": CouplingMap.from_line(N),
+        "ring": CouplingMap.from_ring(N) if N > 2 else CouplingMap.from_line(N),
+        "grid": CouplingMap.from_grid(3, 3),
+        "heavy_hex": CouplingMap(FakeBrisbane().coupling_map),
+    }
+    return topologies
+
+def build_library(path=LIBRARY_PATH, max_n=MAX_LIBRARY_N, restarts=4, steps=200_000):
+    """Search the best tables of every N up to `max_n` and write them to `path`."""
+    from .device import select_region
+
+    entries = {}
+    for N in range(2, max_n + 1):
+        key = library_key(N)
+        x, z, e, provenance = best_table(N, quadratic_term_mean_weight, local_moves=True,
+                                         restarts=restarts, steps=steps)
+        entries[key] = np.frombuffer(table_bytes(x, z, provenance, e, key, weights=False), dtype=np.uint8)
+        print(f"{key}: {e:.4f} ({provenance})")
+
+        for name, coupling_map in common_topologies(N).items():
+            _, distances = select_region(coupling_map, N)
+            key = library_key(N, distances)
+            if key in entries:
+                continue
+            energy = njit(lambda x, z: connectivity_aware_cost(x, z, distances))
+            x, z, e, provenance = best_table(N, energy, restarts=restarts, steps=steps)
+            entries[key] = np.frombuffer(table_bytes(x, z, provenance, e, key, weights=False), dtype=np.uint8)
+            print(f"{key} ({name}): {e:.4f} ({provenance})")
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.savez_compressed(path, **entries)
+    _library.cache_clear()
+
+if __name__ == "__main__":
+    build_library()
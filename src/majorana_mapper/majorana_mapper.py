@@ -1,20 +1,68 @@
 from functools import lru_cache
 import numpy as np
-from qiskit.quantum_info import PauliList, Pauli
+from qiskit.quantum_info import PauliList, Pauli, SparsePauliOp
 from qiskit_nature.second_q.mappers.fermionic_mapper import FermionicMapper
 
 from .fermionic_mappings import bk_majoranas
-from .annealing import anneal
-from .tableau import spread_node
+from .integrals import MajoranaTerms
+from .annealing import anneal_adaptive, anneal_memoized, anneal_scheduled, anneal_grouping, anneal_sparse
+from .electronic_hamiltonian import (majorana_term_indices, quadratic_majorana_terms, term_row_incidence, term_csr,
+                                     fermionic_majorana_terms)
+from .tableau import spread_node, pauli_product_phase
 from .cost_functions import quadratic_term_mean_weight
 
 from qiskit.transpiler import CouplingMap
 from .cost_functions import (
     quadratic_term_mean_weight,
     connectivity_aware_cost,
-    subspace_optimized_cost
+    subspace_optimized_cost,
+    qwc_group_cost,
+    sparse_term_mean_weight,
+    trotter_cnot_cost
 )
 from .tableau import spread_node, clifford_jump
+from .transposition import zobrist_keys, spread_node_hash, clifford_jump_hash, transposition_table
+from .tabu import tabu_search, quadratic_weight_neighbour_energies
+from .device import select_region, select_calibrated_region
+from .library import MAX_LIBRARY_N, library_key, lookup_table
+from .blocks import partition_modes, anneal_blocks
+from .evolution import evolve
+from .pareto import OBJECTIVES, mapping_objectives, anneal_pareto
+from .serialization import save_table, load_table, table_rows
+from .fingerprint import mapping_fingerprint
+from .symmetries import parity_masks, align_symmetries, penalized_cost, symmetry_operators, taper_qubit_op
+
+# Self-calibrating annealing schedules. The step budget matches a geometric
+# schedule from log10(2N) at COOLING_RATE; the temperature is calibrated and
+# adapted so that uphill moves are accepted at a rate decaying from the initial
+# to the final acceptance. Warm starts from a previously optimized table only
+# need a short run that starts at a low acceptance.
+COOLING_RATE = 0.99995
+INITIAL_ACCEPTANCE = 0.8
+FINAL_ACCEPTANCE = 1e-3
+WARM_STEP_FRACTION = 0.05
+WARM_ACCEPTANCE = 0.05
+
+# Default number of modes per block of the blocks strategy
+BLOCK_SIZE = 8
+
+# Slots (as a power of two) of the transposition table memoizing energies
+TABLE_BITS = 18
+
+# Costs expensive enough that a table lookup beats scoring the state again. Cheaper
+# costs anneal without allocating the table
+MEMOIZED_COSTS = (trotter_cnot_cost, qwc_group_cost)
+
+# Evolution strategy: population, surviving elite and generations. Every member is
+# refined by a short anneal, so the total step budget stays close to one full anneal
+POPULATION_SIZE = 8
+ELITE_SIZE = 2
+GENERATIONS = 12
+REFINE_STEP_FRACTION = 0.01
+
+def annealing_steps(N, cooling_rate=COOLING_RATE) -> int:
+    """Steps of the geometric schedule from T = log10(2N) down to 1 - cooling_rate."""
+    return int(np.ceil(np.log(np.log10(2*N) / (1 - cooling_rate)) / -np.log(cooling_rate)))
 
 # Global state to manage the number of qubits
 _n = 0
@@ -26,94 +74,362 @@ def set_n(new_n: int):
 def obtain_n() -> int:
     return _n
 
+def _parity_preserving_terms(hamiltonian, N):
+    # The incremental engines rely on spread_node leaving even products without
+    # the moved row unchanged
+    term_indices = majorana_term_indices(hamiltonian, N)
+    if ((term_indices >= 0).sum(axis=1) % 2).any():
+        raise ValueError("The strategy requires a parity-preserving Hamiltonian.")
+    return term_indices
+
+def _table_from_arrays(x, z) -> list[tuple[Pauli, Pauli]]:
+    paulis = PauliList.from_symplectic(z, x)
+    pauli_table = []
+    for i in range(int(len(paulis)//2)):
+        p1, p2 = paulis[i], paulis[int(len(paulis)//2+i)]
+        p1.phase = 0
+        p2.phase = 0
+        pauli_table.append((p1, p2))
+    return pauli_table
+
 class MajoranaMapper(FermionicMapper):
     """The Majorana fermion-to-qubit mapping optimized via simulated annealing."""
     
-    def __init__(self, strategy="baseline", coupling_map=None, hamiltonian=None):
+    def __init__(self, strategy="baseline", coupling_map=None, hamiltonian=None, symmetries=None,
+                 warm_start=None, blocks=None, workers=None, use_library=True, backend=None):
         super().__init__()
         self.strategy = strategy
         self.coupling_map = coupling_map
         self.hamiltonian = hamiltonian
+        # Mode sets whose parity is kept as a single-qubit Z, e.g. `spin_parity_symmetries(N)`
+        self.symmetries = symmetries
+        # (x, z) rows of a previously optimized table to re-anneal from
+        self.warm_start = warm_start
+        # Mode blocks of the blocks strategy, or the number of modes per block
+        self.blocks = blocks
+        # Worker threads of the parallel strategies (blocks, evolution)
+        self.workers = workers
+        # Serve precomputed tables of small registers without annealing
+        self.use_library = use_library
+        # Backend whose calibrated two-qubit errors weight routes in the fidelity strategy
+        self.backend = backend
+        # Physical qubits of the device region chosen by the connectivity and fidelity strategies
+        self.region = None
+        # (costs, x, z) of every Pareto-optimal table found by the pareto strategy
+        self.pareto_front = None
+        # Lookups, hits and hit rate of the transposition table in the last memoized run
+        self.cache_stats = None
         self._cached_table = None
         self._cached_n = None
+        self._cached_arrays = None
+        self._cached_energy = np.nan
 
     def pauli_table(self, register_length: int) -> list[tuple[Pauli, Pauli]]:
         """Instance method to allow per-instance strategies."""
         N = obtain_n() or register_length
-        
+        return self.build_pauli_table(N)
+
+    def majorana_arrays(self, register_length: int) -> tuple[np.ndarray, np.ndarray]:
+        """Read-only symplectic rows (x, z) of the table, g_i in row i and g'_i in row i+N."""
+        N = obtain_n() or register_length
+        return self.build_majorana_arrays(N)
+
+    def build_pauli_table(self, N: int) -> list[tuple[Pauli, Pauli]]:
+        """`Pauli` pairs of `build_majorana_arrays`, only built when first asked for."""
+        arrays = self.build_majorana_arrays(N)
+        if self._cached_table is None:
+            self._cached_table = _table_from_arrays(*arrays)
+        return self._cached_table
+
+    def build_majorana_arrays(self, N: int) -> tuple[np.ndarray, np.ndarray]:
+        """Optimize the table for exactly N qubits, independent of the global `set_n`."""
         # Check cache
-        if self._cached_table is not None and self._cached_n == N:
-            return self._cached_table
+        if self._cached_n == N and self._cached_arrays is not None:
+            return self._cached_arrays
+
+        entry = self._library_entry(N) if self.use_library else None
+        if entry is not None:
+            x, z, energy_opt, provenance = entry
+            print(f"Num qubits: {N}, Strategy: {self.strategy}, library table ({provenance})")
+            return self._store_arrays(N, x, z, energy_opt)
 
         print(f"Num qubits: {N}, Strategy: {self.strategy}")
-        x, z, _ = bk_majoranas(N)
+        if self.warm_start is not None:
+            x, z = (np.array(a, dtype=bool) for a in self.warm_start)
+            if x.shape != (2*N, N):
+                raise ValueError(f"Warm start of shape {x.shape} does not fit {N} qubits.")
+            num_steps = max(1, int(WARM_STEP_FRACTION * annealing_steps(N)))
+            p0 = WARM_ACCEPTANCE
+        else:
+            x, z, _ = bk_majoranas(N)
+            num_steps, p0 = annealing_steps(N), INITIAL_ACCEPTANCE
+        schedule = dict(num_steps=num_steps, p0=p0, p_end=min(p0, FINAL_ACCEPTANCE))
         
+        # Module-level kernels with their data as arguments, so that the engines are
+        # compiled once per kernel rather than once per mapper
         energy_fn = quadratic_term_mean_weight
+        energy_args = ()
         explore_fn = spread_node
 
         if self.strategy == "connectivity" and self.coupling_map:
-            dist_matrix = np.array(self.coupling_map.distance_matrix, dtype=np.float64)
-            energy_fn = lambda x, z: connectivity_aware_cost(x, z, dist_matrix)
+            # Logical qubit q is placed on physical qubit self.region[q]
+            self.region, dist_matrix = select_region(self.coupling_map, N)
+            energy_fn, energy_args = connectivity_aware_cost, (dist_matrix,)
+        elif self.strategy == "fidelity":
+            if self.backend is None:
+                raise ValueError("The fidelity strategy requires a backend.")
+            # Same routing kernel on error-weighted distances of the region
+            self.region, error_matrix = select_calibrated_region(self.backend, N)
+            energy_fn, energy_args = connectivity_aware_cost, (error_matrix,)
         elif self.strategy == "subspace" and self.hamiltonian:
-            indices = []
-            for term, _ in self.hamiltonian.items():
-                ops = term.split()
-                if len(ops) == 2:
-                    indices.append([int(o.split('_')[1]) for o in ops])
-            if indices:
-                active_indices = np.array(indices, dtype=np.int64)
-                energy_fn = lambda x, z: subspace_optimized_cost(x, z, active_indices)
+            active_indices = quadratic_majorana_terms(self.hamiltonian, N)
+            if len(active_indices):
+                energy_fn, energy_args = subspace_optimized_cost, (active_indices,)
         elif self.strategy == "clifford_assisted":
             explore_fn = clifford_jump
+        elif self.strategy == "pareto":
+            # Objectives without their input (device or Hamiltonian) stay at 0
+            distances = np.zeros((0, 0), dtype=np.int32)
+            term_indices = np.zeros((0, 2), dtype=np.int64)
+            active = [True, bool(self.coupling_map), bool(self.hamiltonian)]
+            if self.coupling_map:
+                self.region, distances = select_region(self.coupling_map, N)
+            if self.hamiltonian:
+                term_indices = _parity_preserving_terms(self.hamiltonian, N)
+            objective_args = (distances, term_indices)
+        elif self.strategy == "grouping" and self.hamiltonian:
+            term_indices = _parity_preserving_terms(self.hamiltonian, N)
+            row_ptr, term_ids = term_row_incidence(term_indices, 2*N)
+            energy_fn, energy_args = qwc_group_cost, (term_indices,)
+        elif self.strategy in ("sparse", "blocks", "evolution") and self.hamiltonian:
+            term_indices = _parity_preserving_terms(self.hamiltonian, N)
+            row_ptr, term_ids = term_row_incidence(term_indices, 2*N)
+            term_ptr, term_rows = term_csr(term_indices)
+            energy_fn, energy_args = sparse_term_mean_weight, (term_ptr, term_rows)
+        elif self.strategy == "trotter" and self.hamiltonian:
+            term_ptr, term_rows = term_csr(majorana_term_indices(self.hamiltonian, N))
+            energy_fn, energy_args = trotter_cnot_cost, (term_ptr, term_rows)
+
+        if self.strategy == "blocks" and self.warm_start is None:
+            # Anneal the blocks separately, then refine the stitched table globally
+            blocks = self.blocks
+            if blocks is None or isinstance(blocks, int):
+                blocks = partition_modes(N, blocks or BLOCK_SIZE, self.hamiltonian)
+            x, z = anneal_blocks(N, [np.asarray(b) for b in blocks], annealing_steps,
+                                 term_indices if self.hamiltonian else None,
+                                 workers=self.workers, p0=p0, p_end=FINAL_ACCEPTANCE)
+            schedule = dict(num_steps=max(1, int(WARM_STEP_FRACTION * annealing_steps(N))),
+                            p0=WARM_ACCEPTANCE, p_end=FINAL_ACCEPTANCE)
+
+        memoize = energy_fn in MEMOIZED_COSTS
+        neighbours_fn = quadratic_weight_neighbour_energies
+        if self.symmetries:
+            if self.strategy in ("clifford_moves", "pareto", "evolution"):
+                raise ValueError(f"The {self.strategy} strategy does not support symmetries.")
+            # Start from a table with the parities already aligned and penalize
+            # leaving it harder than any gain the base cost can offer
+            masks = parity_masks(N, self.symmetries)
+            x, z, _ = align_symmetries(x, z, masks)
+            penalty_weight = 1.0 + energy_fn(x, z, *energy_args)
+            energy_fn, energy_args = penalized_cost, (penalty_weight, masks, energy_fn) + energy_args
+            neighbours_fn = None # Score every neighbour with the penalized cost
 
-        x, z, energies, energy_opt = anneal(
-            x.copy(), z.copy(), 
-            explore=explore_fn, 
-            energy=energy_fn, 
-            cooling_rate=0.99995
-        )
-
-        paulis = PauliList.from_symplectic(z, x)
-        pauli_table = []
-        for i in range(int(len(paulis)//2)):
-            p1, p2 = paulis[i], paulis[int(len(paulis)//2+i)]
-            p1.phase = 0
-            p2.phase = 0
-            pauli_table.append((p1, p2))
-            
-        # Store in cache
-        self._cached_table = pauli_table
+        if self.strategy == "grouping" and self.hamiltonian and not self.symmetries:
+            x, z, energies, energy_opt = anneal_grouping(
+                x.copy(), z.copy(), term_indices, row_ptr, term_ids,
+                **schedule
+            )
+        elif self.strategy == "evolution":
+            x, z, energies, energy_opt = evolve(
+                x.copy(), z.copy(), explore_fn, energy_fn,
+                generations=GENERATIONS,
+                population=POPULATION_SIZE,
+                elite=ELITE_SIZE,
+                refine_steps=max(1, int(REFINE_STEP_FRACTION * schedule["num_steps"])),
+                workers=self.workers,
+                p0=min(schedule["p0"], WARM_ACCEPTANCE),
+                p_end=schedule["p_end"],
+                energy_args=energy_args
+            )
+        elif self.strategy in ("sparse", "blocks") and self.hamiltonian and not self.symmetries:
+            x, z, energies, energy_opt = anneal_sparse(
+                x.copy(), z.copy(), term_ptr, term_rows, row_ptr, term_ids,
+                **schedule
+            )
+        elif self.strategy == "clifford_moves":
+            x, z, energies, energy_opt, _ = anneal_scheduled(
+                x.copy(), z.copy(),
+                **schedule
+            )
+        elif self.strategy == "pareto":
+            costs, xs, zs = anneal_pareto(x.copy(), z.copy(), mapping_objectives, objective_args=objective_args,
+                                          **schedule)
+            costs = costs[:, active]
+            names = [name for name, on in zip(OBJECTIVES, active) if on]
+            self.pareto_front = [
+                (dict(zip(names, c.tolist())), x_k, z_k) for c, x_k, z_k in zip(costs, xs, zs)
+            ]
+            # Serve the member with the best sum of objectives normalized over the front
+            low, span = costs.min(axis=0), np.ptp(costs, axis=0)
+            best = int(np.argmin(((costs - low) / np.where(span > 0, span, 1)).sum(axis=1)))
+            x, z, energy_opt = xs[best], zs[best], costs[best, 0]
+        elif self.strategy == "tabu":
+            x, z, energies, energy_opt = tabu_search(
+                x.copy(), z.copy(),
+                neighbours=neighbours_fn,
+                energy=energy_fn,
+                tenure=N,
+                energy_args=energy_args
+            )
+        elif memoize:
+            table_keys, table_values = transposition_table(TABLE_BITS)
+            hash_fn = clifford_jump_hash if explore_fn is clifford_jump else spread_node_hash
+            x, z, energies, energy_opt, lookups, hits = anneal_memoized(
+                x.copy(), z.copy(),
+                explore=explore_fn,
+                hash_delta=hash_fn,
+                energy=energy_fn,
+                keys=zobrist_keys(2*N, N),
+                table_keys=table_keys,
+                table_values=table_values,
+                involution=explore_fn is spread_node,
+                energy_args=energy_args,
+                **schedule
+            )
+            self.cache_stats = {"lookups": lookups, "hits": hits, "hit_rate": hits / max(lookups, 1)}
+        else:
+            x, z, energies, energy_opt = anneal_adaptive(
+                x.copy(), z.copy(),
+                explore=explore_fn,
+                energy=energy_fn,
+                involution=explore_fn is spread_node,
+                energy_args=energy_args,
+                **schedule
+            )
+
+        return self._store_arrays(N, x, z, energy_opt)
+
+    def _store_arrays(self, N, x, z, energy):
+        x, z = np.array(x, dtype=bool), np.array(z, dtype=bool)
+        x.flags.writeable = z.flags.writeable = False
+        self._cached_table = None
         self._cached_n = N
-        return pauli_table
+        self._cached_arrays = (x, z)
+        self._cached_energy = float(energy)
+        return self._cached_arrays
+
+    def _library_entry(self, N):
+        # The library holds the baseline quadratic weight and the connectivity
+        # routing costs; every other strategy runs its own engine
+        if (N > MAX_LIBRARY_N or self.warm_start is not None or self.symmetries
+                or self.hamiltonian is not None):
+            return None
+        if self.strategy == "connectivity" and self.coupling_map:
+            region, distances = select_region(self.coupling_map, N)
+            entry = lookup_table(library_key(N, distances))
+            if entry is not None:
+                self.region = region
+            return entry
+        if self.strategy == "baseline":
+            return lookup_table(library_key(N))
+        return None
+
+    def pareto_tables(self) -> list[tuple[dict, list[tuple[Pauli, Pauli]]]]:
+        """The (costs, Pauli table) pairs of the last pareto run, by increasing weight."""
+        if self.pareto_front is None:
+            raise ValueError("No Pareto front yet, call pauli_table with strategy='pareto' first.")
+        return [(costs, _table_from_arrays(x, z)) for costs, x, z in self.pareto_front]
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """Mapper serving a table saved with `save`, without annealing."""
+        table = load_table(path)
+        mapper = cls(strategy=table["strategy"], **kwargs)
+        mapper._cached_arrays = table_rows(table)
+        mapper._cached_n = table["num_qubits"]
+        mapper._cached_energy = table["energy"]
+        return mapper
+
+    def save(self, path, weights=True):
+        """Write the optimized table in the binary format of `serialization`."""
+        if self._cached_arrays is None:
+            raise ValueError("No optimized table yet, call pauli_table first.")
+        fingerprint = mapping_fingerprint(self._cached_n, self.strategy, self.coupling_map,
+                                          self.hamiltonian, self.symmetries, self.backend)
+        save_table(path, *self._cached_arrays, strategy=self.strategy, energy=self._cached_energy,
+                   fingerprint=fingerprint, weights=weights)
+
+    def map_sequence(self, hamiltonians, register_length=None):
+        """Map a family of related Hamiltonians, e.g. along a potential-energy scan.
+
+        Every Hamiltonian after the first re-anneals from the table optimized for
+        its predecessor with a short low-temperature schedule.
+
+        Returns:
+            list[SparsePauliOp]: The mapped Hamiltonians in order.
+        """
+        qubit_ops = []
+        for hamiltonian in hamiltonians:
+            self.hamiltonian = hamiltonian
+            if self._cached_arrays is not None:
+                self.warm_start = self._cached_arrays
+            self._cached_table = self._cached_n = None
+            if isinstance(hamiltonian, MajoranaTerms):
+                qubit_ops.append(self.map_terms(hamiltonian))
+            else:
+                qubit_ops.append(self.map(hamiltonian, register_length=register_length))
+        return qubit_ops
+
+    def map_terms(self, terms: MajoranaTerms) -> SparsePauliOp:
+        """Map Majorana product arrays, e.g. from `integral_terms`, without a FermionicOp.
+
+        All terms are multiplied out column by column on the symplectic table rows,
+        tracking the phase of every product.
+        """
+        x, z = self.majorana_arrays(terms.num_spin_orbitals)
+        num_terms, N = len(terms.coeffs), x.shape[1]
+        x_p = np.zeros((num_terms, N), dtype=bool)
+        z_p = np.zeros((num_terms, N), dtype=bool)
+        k = np.zeros(num_terms, dtype=np.int64)
+        for rows in terms.term_indices.T:
+            valid = (rows >= 0)[:, None]
+            x_r, z_r = x[rows] & valid, z[rows] & valid
+            k += pauli_product_phase(x_p, z_p, x_r, z_r)
+            x_p ^= x_r
+            z_p ^= z_r
+
+        qubit_op = SparsePauliOp(PauliList.from_symplectic(z_p, x_p), terms.coeffs * 1j ** (k % 4))
+        qubit_op += SparsePauliOp(["I" * N], [terms.constant])
+        return qubit_op.simplify()
+
+    def taper(self, qubit_op, num_particles):
+        """Remove one qubit per symmetry from a mapped operator.
+
+        Args:
+            qubit_op: Operator mapped with this mapper, e.g. `mapper.map(hamiltonian)`.
+            num_particles: Particle number in each of `self.symmetries`, which fixes the
+                parity sector, e.g. `(n_alpha, n_beta)`.
+
+        Returns:
+            SparsePauliOp: The operator on the remaining qubits.
+        """
+        if not self.symmetries:
+            raise ValueError("The mapper was constructed without symmetries.")
+
+        pauli_table = self.pauli_table(qubit_op.num_qubits)
+        qubits, eigenvalues = [], []
+        for op, n in zip(symmetry_operators(pauli_table, self.symmetries), num_particles):
+            support = np.flatnonzero(op.z)
+            if op.x.any() or len(support) != 1:
+                raise ValueError(f"Symmetry {op} is not a single-qubit Z stabilizer.")
+            sign = 1 if op.phase == 0 else -1
+            qubits.append(int(support[0]))
+            eigenvalues.append(sign * (-1) ** n)
+
+        return taper_qubit_op(qubit_op, qubits, eigenvalues)
 
-    # Override internal methods to use instance's pauli_table
     def _map_single(self, second_q_op, register_length=None):
-        from qiskit_nature.second_q.operators import SparseLabelOp
+        """Map a FermionicOp through `map_terms` on the table arrays, without `Pauli` objects."""
         if register_length is None:
             register_length = second_q_op.register_length
-        
-        # We need to build the operators manually since Qiskit's logic is class-tied
-        pauli_table = self.pauli_table(register_length)
-        
-        # This is a simplified version of Qiskit's mode_based_mapping for FermionicOp
-        # It handles the creation/annihilation operators mapping
-        from qiskit.quantum_info import SparsePauliOp
-        
-        n_qubits = register_length
-        creation_ops = [0.5 * (SparsePauliOp(pauli_table[i][0]) - 1j * SparsePauliOp(pauli_table[i][1])) for i in range(n_qubits)]
-        annihilation_ops = [0.5 * (SparsePauliOp(pauli_table[i][0]) + 1j * SparsePauliOp(pauli_table[i][1])) for i in range(n_qubits)]
-        
-        # Map FermionicOp terms
-        qubit_op = SparsePauliOp(["I" * n_qubits], [0.0])
-        for term, coeff in second_q_op.items():
-            # Process terms like "+_0 -_1"
-            term_op = SparsePauliOp(["I" * n_qubits], [1.0])
-            for op in term.split():
-                idx = int(op.split('_')[1])
-                if op.startswith('+'):
-                    term_op = term_op.compose(creation_ops[idx])
-                else:
-                    term_op = term_op.compose(annihilation_ops[idx])
-            qubit_op += coeff * term_op
-            
-        return qubit_op.simplify()
+        return self.map_terms(fermionic_majorana_terms(second_q_op, register_length))
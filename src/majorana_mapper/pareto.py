@@ -0,0 +1,142 @@
+import random
+import numpy as np
+from numba import njit
+
+from .tableau import spread_node
+from .annealing import calibrate_temperature, adapt_temperature, target_acceptance
+from .cost_functions import quadratic_term_mean_weight, connectivity_aware_cost, qwc_group_cost
+
+OBJECTIVES = ("weight", "routing", "grouping")
+
+@njit
+def mapping_objectives(x, z, distances, term_indices) -> np.ndarray:
+    """Weight, routing and grouping costs of a tableau in one call.
+
+    Routing is skipped (0) for an empty distance matrix and grouping for an empty
+    term index.
+    """
+    costs = np.zeros(3)
+    costs[0] = quadratic_term_mean_weight(x, z)
+    if distances.size > 0:
+        costs[1] = connectivity_aware_cost(x, z, distances)
+    if term_indices.shape[0] > 0:
+        costs[2] = qwc_group_cost(x, z, term_indices)
+    return costs
+
+@njit
+def dominates(a, b) -> bool:
+    """Whether cost vector a Pareto-dominates b (minimization)."""
+    strict = False
+    for k in range(a.shape[0]):
+        if a[k] > b[k]:
+            return False
+        if a[k] < b[k]:
+            strict = True
+    return strict
+
+@njit
+def archive_insert(costs, xs, zs, size, c, x, z) -> int:
+    """Offer a tableau to a Pareto archive held in preallocated arrays.
+
+    Members dominated by c are removed. If the archive is full, c replaces the
+    member nearest to it in cost space.
+
+    Returns:
+        int: The new archive size.
+    """
+    for i in range(size):
+        if dominates(costs[i], c) or (costs[i] == c).all():
+            return size
+
+    k = 0
+    for i in range(size):
+        if not dominates(c, costs[i]):
+            if k != i:
+                costs[k] = costs[i]
+                xs[k] = xs[i]
+                zs[k] = zs[i]
+            k += 1
+    size = k
+
+    slot = size
+    if size == costs.shape[0]:
+        slot, nearest = 0, np.inf
+        for i in range(size):
+            d = ((costs[i] - c) ** 2).sum()
+            if d < nearest:
+                slot, nearest = i, d
+    else:
+        size += 1
+    costs[slot] = c
+    xs[slot] = x
+    zs[slot] = z
+    return size
+
+@njit(nogil=True)
+def anneal_pareto(x, z, objectives, num_steps, num_weights=16, p0=0.8, p_end=1e-3, window=100, capacity=64,
+                  objective_args=()):
+    """Multi-objective annealing into an archive of Pareto-optimal tableaus.
+
+    The run is split into `num_weights` epochs. Each epoch starts from a random
+    archive member and anneals a random convex combination of the objectives,
+    normalized by their initial values, with the schedule of `anneal_adaptive`.
+    Every accepted tableau is offered to the archive, so all cost vectors are
+    evaluated once per move.
+
+    Args:
+        objectives: Compiled function returning the cost vector of a tableau.
+        objective_args: Extra arguments of `objectives`, e.g. those of `mapping_objectives`.
+
+    Returns:
+        (costs, xs, zs): Cost vectors and tableaus of the archive.
+    """
+    N = x.shape[0]
+    c = objectives(x, z, *objective_args)
+    K = c.shape[0]
+    scale = np.where(c > 0, c, 1.0)
+
+    costs = np.empty((capacity, K))
+    xs = np.empty((capacity,) + x.shape, dtype=np.bool_)
+    zs = np.empty((capacity,) + z.shape, dtype=np.bool_)
+    size = archive_insert(costs, xs, zs, 0, c, x, z)
+
+    steps = max(1, num_steps // num_weights)
+    for epoch in range(num_weights):
+        w = -np.log(1.0 - np.random.random(K))
+        w /= w.sum() * scale
+
+        start = random.randint(0, size - 1)
+        x, z = xs[start].copy(), zs[start].copy()
+        current_energy = (w * costs[start]).sum()
+
+        deltas = np.zeros(N)
+        for n in range(N):
+            x, z = spread_node(n, x, z)
+            deltas[n] = (w * objectives(x, z, *objective_args)).sum() - current_energy
+            x, z = spread_node(n, x, z) # Undo
+        T = calibrate_temperature(deltas, p0)
+        uphill = 0
+        accepted = 0
+
+        for i in range(1, steps + 1):
+            n = random.randint(0, N - 1)
+            x, z = spread_node(n, x, z)
+            c = objectives(x, z, *objective_args)
+            delta = (w * c).sum() - current_energy
+
+            if delta > 0:
+                uphill += 1
+            if delta <= 0 or random.random() < np.exp(-delta / T):
+                if delta > 0:
+                    accepted += 1
+                current_energy += delta
+                size = archive_insert(costs, xs, zs, size, c, x, z)
+            else:
+                x, z = spread_node(n, x, z) # Undo
+
+            if i % window == 0:
+                T = adapt_temperature(T, accepted, uphill, target_acceptance(i, steps, p0, p_end))
+                uphill = accepted = 0
+
+    order = np.argsort(costs[:size, 0])
+    return costs[:size][order], xs[:size][order], zs[:size][order]
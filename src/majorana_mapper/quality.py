@@ -0,0 +1,107 @@
+import numpy as np
+from numba import njit
+
+from .fermionic_mappings import pauli_table_arrays
+from .electronic_hamiltonian import majorana_term_indices, term_csr
+from .device import select_region, device_distances
+
+# CNOTs of one SWAP, inserted before and undone after a Pauli exponential
+SWAP_CNOTS = 3
+
+def mapped_term_supports(x, z, term_indices) -> np.ndarray:
+    """Boolean qubit support of every mapped Majorana product, one row per term."""
+    term_ptr, term_rows = term_csr(term_indices)
+    if len(term_rows) == 0:
+        return np.zeros((0, x.shape[1]), dtype=bool)
+    starts = term_ptr[:-1]
+    tx = np.bitwise_xor.reduceat(x[term_rows], starts, axis=0)
+    tz = np.bitwise_xor.reduceat(z[term_rows], starts, axis=0)
+    return tx | tz
+
+@njit
+def support_mst_weights(supports, distances) -> np.ndarray:
+    """Minimum spanning tree weight of every support under the device distances (Prim)."""
+    weights = np.zeros(supports.shape[0], dtype=np.int64)
+    for t in range(supports.shape[0]):
+        qubits = np.flatnonzero(supports[t])
+        k = len(qubits)
+        if k < 2:
+            continue
+        in_tree = np.zeros(k, dtype=np.bool_)
+        best = np.full(k, np.iinfo(np.int64).max)
+        best[0] = 0
+        for _ in range(k):
+            u = -1
+            for i in range(k):
+                if not in_tree[i] and (u < 0 or best[i] < best[u]):
+                    u = i
+            in_tree[u] = True
+            weights[t] += best[u]
+            for i in range(k):
+                d = distances[qubits[u], qubits[i]]
+                if not in_tree[i] and d < best[i]:
+                    best[i] = d
+    return weights
+
+def quality_report(mapper, hamiltonian=None, coupling_map=None, register_length=None) -> dict:
+    """Weight, CNOT and routing estimates of any `FermionicMapper` table.
+
+    Everything is computed from the symplectic rows: Majorana row weights, the
+    weights of the mapped Hamiltonian terms, CNOT ladders of 2(w - 1) per term
+    and, on a device, the MST of every term support over the mapper's `region` or
+    the one chosen by `select_region`. Each MST hop beyond w - 1 is counted as a
+    SWAP done and undone.
+
+    Args:
+        mapper: Any mapper with a `pauli_table(register_length)` method. The arrays of
+            `majorana_arrays` are used directly where available.
+        hamiltonian: `FermionicOp` whose terms are scored, optional.
+        coupling_map: Device for the routing estimate, optional.
+        register_length: Number of modes, defaults to the Hamiltonian's.
+    """
+    N = register_length or (hamiltonian.num_spin_orbitals if hamiltonian is not None else None)
+    if N is None:
+        raise ValueError("Either a Hamiltonian or the register length is required.")
+    if hasattr(mapper, "majorana_arrays"):
+        x, z = mapper.majorana_arrays(N)
+    else:
+        x, z = pauli_table_arrays(mapper.pauli_table(N))
+    N = x.shape[1]
+
+    row_weights = (x | z).sum(axis=1)
+    report = {
+        "num_qubits": N,
+        "row_weight_mean": float(row_weights.mean()),
+        "row_weight_max": int(row_weights.max()),
+        "row_weight_histogram": np.bincount(row_weights, minlength=N + 1),
+    }
+    if hamiltonian is None:
+        return report
+
+    supports = mapped_term_supports(x, z, majorana_term_indices(hamiltonian, N))
+    term_weights = supports.sum(axis=1)
+    cnots = 2 * np.maximum(term_weights - 1, 0)
+    report.update({
+        "num_terms": len(term_weights),
+        "term_weight_mean": float(term_weights.mean()) if len(term_weights) else 0.0,
+        "term_weight_max": int(term_weights.max(initial=0)),
+        "term_weight_histogram": np.bincount(term_weights, minlength=N + 1),
+        "cnots": int(cnots.sum()),
+    })
+    if coupling_map is None:
+        return report
+
+    region = getattr(mapper, "region", None)
+    if region is not None and len(region) == N:
+        distances = device_distances(coupling_map)[np.ix_(region, region)]
+    else:
+        region, distances = select_region(coupling_map, N)
+    mst = support_mst_weights(supports, distances)
+    swaps = np.maximum(mst - np.maximum(term_weights - 1, 0), 0)
+    report.update({
+        "region": region,
+        "routing_mst_mean": float(mst.mean()) if len(mst) else 0.0,
+        "swaps": int(swaps.sum()),
+        "routed_cnots": int((cnots + 2 * SWAP_CNOTS * swaps).sum()),
+    })
+    return report
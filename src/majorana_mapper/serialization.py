@@ -0,0 +1,101 @@
+import numpy as np
+from multiprocessing import shared_memory
+
+from .cost_functions import pack_rows, unpack_rows
+
+# File layout: a 128-byte header followed by the packed x rows, the packed z rows
+# (2N x W little-endian uint64 words each, qubit q in bit q % 64 of word q // 64)
+# and, if FLAG_WEIGHTS is set, the Pauli weight of every row as uint32.
+MAGIC = b"MAJTABLE"
+VERSION = 1
+FLAG_WEIGHTS = 1
+
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("num_qubits", "<u4"),
+    ("words", "<u4"),
+    ("flags", "<u4"),
+    ("energy", "<f8"),
+    ("strategy", "S32"),
+    ("fingerprint", "S64"),
+])
+
+def _sizes(N, W, flags):
+    # x and z, each 2N rows of W eight-byte words
+    rows = 2 * (2*N) * W * 8
+    weights = 2 * N * 4 if flags & FLAG_WEIGHTS else 0
+    return rows, weights
+
+def table_bytes(x, z, strategy="", energy=np.nan, fingerprint="", weights=True) -> bytes:
+    """Serialize table rows (2N x N booleans) into the binary format."""
+    N = x.shape[1]
+    x_packed, z_packed = pack_rows(np.asarray(x, dtype=np.bool_), np.asarray(z, dtype=np.bool_))
+
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header["magic"] = MAGIC
+    header["version"] = VERSION
+    header["num_qubits"] = N
+    header["words"] = x_packed.shape[1]
+    header["flags"] = FLAG_WEIGHTS if weights else 0
+    header["energy"] = energy
+    header["strategy"] = strategy.encode()
+    header["fingerprint"] = fingerprint.encode()
+
+    parts = [header.tobytes(), x_packed.astype("<u8").tobytes(), z_packed.astype("<u8").tobytes()]
+    if weights:
+        parts.append(np.bitwise_or(x, z).sum(axis=1).astype("<u4").tobytes())
+    return b"".join(parts)
+
+def save_table(path, x, z, strategy="", energy=np.nan, fingerprint="", weights=True):
+    with open(path, "wb") as f:
+        f.write(table_bytes(x, z, strategy, energy, fingerprint, weights))
+
+def parse_table(buffer) -> dict:
+    """Zero-copy views of a serialized table in any uint8 buffer (memmap, shared memory, bytes).
+
+    Returns:
+        dict: Header fields, the packed `x`/`z` words and the row `weights` (or None).
+    """
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+    header = raw[:HEADER_DTYPE.itemsize].view(HEADER_DTYPE)[0]
+    if header["magic"] != MAGIC:
+        raise ValueError("Not a Majorana table file.")
+    if header["version"] != VERSION:
+        raise ValueError(f"Unsupported table format version {header['version']}.")
+
+    N, W, flags = int(header["num_qubits"]), int(header["words"]), int(header["flags"])
+    row_bytes, weight_bytes = _sizes(N, W, flags)
+    offset = HEADER_DTYPE.itemsize
+    x = raw[offset:offset + row_bytes // 2].view("<u8").reshape(2*N, W)
+    z = raw[offset + row_bytes // 2:offset + row_bytes].view("<u8").reshape(2*N, W)
+    weights = None
+    if flags & FLAG_WEIGHTS:
+        weights = raw[offset + row_bytes:offset + row_bytes + weight_bytes].view("<u4")
+
+    return {
+        "num_qubits": N,
+        "strategy": header["strategy"].decode(),
+        "energy": float(header["energy"]),
+        "fingerprint": header["fingerprint"].decode(),
+        "x": x,
+        "z": z,
+        "weights": weights,
+    }
+
+def load_table(path) -> dict:
+    """Memory-map a table file, see `parse_table`."""
+    return parse_table(np.memmap(path, dtype=np.uint8, mode="r"))
+
+def table_rows(table: dict):
+    """Unpack the boolean (x, z) rows of a parsed table."""
+    return unpack_rows(np.ascontiguousarray(table["x"], dtype=np.uint64),
+                       np.ascontiguousarray(table["z"], dtype=np.uint64),
+                       table["num_qubits"])
+
+def share_table(path, name=None) -> shared_memory.SharedMemory:
+    """Copy a table file into shared memory once, for `parse_table(shm.buf)` in other processes."""
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    shm = shared_memory.SharedMemory(name=name, create=True, size=data.size)
+    shm.buf[:data.size] = data
+    return shm
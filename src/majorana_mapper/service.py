@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .majorana_mapper import MajoranaMapper
+from .fingerprint import mapping_fingerprint
+
+class MappingService:
+    """Local mapping service: an asyncio front end over a pool of worker threads.
+
+    The annealing engines release the GIL, so the workers anneal in parallel.
+    Identical requests that are in flight are coalesced onto one optimization and
+    finished tables are served from an LRU cache.
+    """
+
+    def __init__(self, max_workers=None, cache_size=128, latency_window=1000):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="majorana-worker")
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=latency_window)
+        self._counters = dict.fromkeys(
+            ["requests", "cache_hits", "coalesced", "computed", "failed", "queued", "running"], 0
+        )
+        self._loop = None
+        self._thread = None
+
+    def start(self):
+        """Run the event loop in a background thread for synchronous clients."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="majorana-service", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    async def _mapper(self, N, strategy, coupling_map, hamiltonian, symmetries, backend):
+        """Optimized mapper for the request, computed at most once per fingerprint."""
+        start = time.perf_counter()
+        key = mapping_fingerprint(N, strategy, coupling_map, hamiltonian, symmetries, backend)
+        self._count("requests")
+
+        try:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self._count("cache_hits")
+                return self._cache[key]
+
+            if key in self._in_flight:
+                self._count("coalesced")
+                return await asyncio.shield(self._in_flight[key])
+
+            self._count("queued")
+            future = asyncio.get_running_loop().run_in_executor(
+                self._executor, self._optimize, N, strategy, coupling_map, hamiltonian, symmetries, backend
+            )
+            self._in_flight[key] = future
+            try:
+                mapper = await future
+            finally:
+                del self._in_flight[key]
+
+            self._cache[key] = mapper
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+            return mapper
+        finally:
+            self._latencies.append(time.perf_counter() - start)
+
+    async def majorana_arrays(self, N, strategy="baseline", coupling_map=None, hamiltonian=None, symmetries=None,
+                              backend=None):
+        """Read-only (x, z) rows of the optimized table for the request."""
+        mapper = await self._mapper(N, strategy, coupling_map, hamiltonian, symmetries, backend)
+        return mapper.build_majorana_arrays(N)
+
+    async def pauli_table(self, N, strategy="baseline", coupling_map=None, hamiltonian=None, symmetries=None,
+                          backend=None):
+        """`Pauli` pairs of the optimized table, built once per cached table."""
+        mapper = await self._mapper(N, strategy, coupling_map, hamiltonian, symmetries, backend)
+        return mapper.build_pauli_table(N)
+
+    def request(self, N, strategy="baseline", coupling_map=None, hamiltonian=None, symmetries=None, backend=None,
+                timeout=None):
+        """Blocking `pauli_table` for clients outside the event loop. Requires `start`."""
+        return self._result(self.pauli_table(N, strategy, coupling_map, hamiltonian, symmetries, backend), timeout)
+
+    def request_arrays(self, N, strategy="baseline", coupling_map=None, hamiltonian=None, symmetries=None,
+                       backend=None, timeout=None):
+        """Blocking `majorana_arrays` for clients outside the event loop. Requires `start`."""
+        return self._result(self.majorana_arrays(N, strategy, coupling_map, hamiltonian, symmetries, backend),
+                            timeout)
+
+    def _result(self, coroutine, timeout):
+        if self._loop is None:
+            coroutine.close()
+            raise RuntimeError("The service is not running, call start() first.")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result(timeout)
+
+    def metrics(self) -> dict:
+        """Counters, queue depth and request latencies (seconds) over the recent window."""
+        with self._lock:
+            metrics = dict(self._counters)
+        metrics["queue_depth"] = metrics.pop("queued")
+        metrics["in_flight"] = len(self._in_flight)
+        metrics["cached"] = len(self._cache)
+
+        latencies = np.array(self._latencies)
+        if len(latencies):
+            metrics.update({
+                "latency_mean": latencies.mean(),
+                "latency_p50": np.percentile(latencies, 50),
+                "latency_p95": np.percentile(latencies, 95),
+                "latency_max": latencies.max(),
+            })
+        return metrics
+
+    def _count(self, name, step=1):
+        with self._lock:
+            self._counters[name] += step
+
+    def _optimize(self, N, strategy, coupling_map, hamiltonian, symmetries, backend):
+        self._count("queued", -1)
+        self._count("running")
+        try:
+            mapper = MajoranaMapper(strategy, coupling_map, hamiltonian, symmetries, backend=backend)
+            mapper.build_majorana_arrays(N)
+            self._count("computed")
+            return mapper
+        except Exception:
+            self._count("failed")
+            raise
+        finally:
+            self._count("running", -1)
+
+class MappingClient(MajoranaMapper):
+    """Drop-in `FermionicMapper` that obtains its table from a `MappingService`."""
+
+    def __init__(self, service, strategy="baseline", coupling_map=None, hamiltonian=None, symmetries=None,
+                 backend=None):
+        super().__init__(strategy, coupling_map, hamiltonian, symmetries, backend=backend)
+        self.service = service
+
+    def build_pauli_table(self, N):
+        return self.service.request(N, self.strategy, self.coupling_map, self.hamiltonian, self.symmetries,
+                                    self.backend)
+
+    def build_majorana_arrays(self, N):
+        return self.service.request_arrays(N, self.strategy, self.coupling_map, self.hamiltonian, self.symmetries,
+                                           self.backend)
@@ -0,0 +1,124 @@
+import numpy as np
+from numba import njit
+from qiskit.quantum_info import Pauli, SparsePauliOp
+
+from .tableau import cnot_columns, hadamard_column, phase_column
+
+def spin_parity_symmetries(num_spin_orbitals: int) -> list[list[int]]:
+    """N_alpha and N_beta parity in qiskit-nature's blocked spin ordering."""
+    half = num_spin_orbitals // 2
+    return [list(range(half)), list(range(half, num_spin_orbitals))]
+
+def parity_masks(N: int, symmetries: list[list[int]]) -> np.ndarray:
+    """Row masks of the Majorana pairs (g_i, g_{i+N}) whose products form each mode parity."""
+    masks = np.zeros((len(symmetries), 2*N), dtype=np.bool_)
+    for s, modes in enumerate(symmetries):
+        for i in modes:
+            masks[s, i] = masks[s, i+N] = True
+    return masks
+
+@njit
+def symmetry_paulis(x: np.ndarray, z: np.ndarray, masks: np.ndarray):
+    S = masks.shape[0]
+    N = x.shape[1]
+    x_sym = np.zeros((S, N), dtype=np.bool_)
+    z_sym = np.zeros((S, N), dtype=np.bool_)
+    for s in range(S):
+        for i in range(x.shape[0]):
+            if masks[s, i]:
+                x_sym[s] ^= x[i]
+                z_sym[s] ^= z[i]
+    return x_sym, z_sym
+
+@njit
+def symmetry_penalty(x: np.ndarray, z: np.ndarray, masks: np.ndarray) -> float:
+    """Distance of every parity operator from a single-qubit Z.
+
+    Counts the extra qubits a parity acts on plus its X components, so it is zero
+    iff all chosen parities are single-qubit Z stabilizers.
+    """
+    x_sym, z_sym = symmetry_paulis(x, z, masks)
+    penalty = 0.0
+    for s in range(masks.shape[0]):
+        penalty += np.bitwise_or(x_sym[s], z_sym[s]).sum() - 1 + x_sym[s].sum()
+    return penalty
+
+@njit
+def penalized_cost(x, z, weight, masks, base, *base_args) -> float:
+    """The `base` cost plus `weight` times the `symmetry_penalty`."""
+    return base(x, z, *base_args) + weight * symmetry_penalty(x, z, masks)
+
+def _rotate_to_z(q, x, z, x_q, z_q):
+    # Y -S-> X -H-> Z
+    if x_q:
+        if z_q:
+            x, z = phase_column(q, x, z)
+        x, z = hadamard_column(q, x, z)
+    return x, z
+
+def align_symmetries(x: np.ndarray, z: np.ndarray, masks: np.ndarray):
+    """Clifford-rotate a tableau so that every parity operator becomes a single-qubit Z.
+
+    Symplectic Gaussian elimination with the column moves from `tableau`: each parity
+    picks a fresh pivot qubit, is rotated to Z there and cleared elsewhere with CNOTs
+    that leave the previously aligned parities untouched.
+
+    Returns:
+        The rotated x, z and the pivot qubit of each symmetry.
+    """
+    x, z = x.copy(), z.copy()
+    pivots = []
+
+    for s in range(masks.shape[0]):
+        x_sym, z_sym = symmetry_paulis(x, z, masks[s:s+1])
+        support = np.flatnonzero(x_sym[0] | z_sym[0])
+        free = [q for q in support if q not in pivots]
+        if not free:
+            raise ValueError(f"Symmetry {s} is not independent of the previous ones.")
+
+        pivot = free[0]
+        for q in free:
+            x_sym, z_sym = symmetry_paulis(x, z, masks[s:s+1])
+            x, z = _rotate_to_z(q, x, z, x_sym[0, q], z_sym[0, q])
+            if q != pivot:
+                x, z = cnot_columns(q, pivot, x, z)
+
+        for q in pivots:
+            x_sym, z_sym = symmetry_paulis(x, z, masks[s:s+1])
+            if x_sym[0, q]:
+                raise ValueError(f"Symmetry {s} does not commute with the previous ones.")
+            if z_sym[0, q]:
+                x, z = cnot_columns(q, pivot, x, z)
+
+        pivots.append(pivot)
+
+    return x, z, pivots
+
+def symmetry_operators(pauli_table: list[tuple[Pauli, Pauli]], symmetries: list[list[int]]) -> list[Pauli]:
+    """Mapped parity operators prod_i (i g_i g_{i+N}), including their sign.
+
+    `_map_single` composes terms right to left, so a mode is occupied in the -1
+    eigenspace of i g_i g_{i+N}.
+    """
+    N = len(pauli_table)
+    operators = []
+    for modes in symmetries:
+        op = Pauli("I" * N)
+        for i in modes:
+            p1, p2 = pauli_table[i]
+            op = op.dot(1j * p1.dot(p2))
+        operators.append(op)
+    return operators
+
+def taper_qubit_op(qubit_op: SparsePauliOp, qubits: list[int], eigenvalues: list[int]) -> SparsePauliOp:
+    """Remove qubits on which every term acts as I or Z by fixing the Z eigenvalues."""
+    paulis = qubit_op.paulis
+    if paulis.x[:, qubits].any():
+        raise ValueError("The operator does not commute with the tapered symmetries.")
+
+    signs = np.ones(len(paulis))
+    for q, eig in zip(qubits, eigenvalues):
+        signs[paulis.z[:, q]] *= eig
+
+    tapered = SparsePauliOp(paulis.delete(qubits, qubit=True), qubit_op.coeffs * signs)
+    return tapered.simplify()
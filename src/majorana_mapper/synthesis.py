@@ -0,0 +1,152 @@
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector
+from qiskit_nature.second_q.operators import FermionicOp
+from qiskit_nature.second_q.circuit.library.ansatzes.utils import generate_fermionic_excitations
+
+from .electronic_hamiltonian import majorana_products
+from .tableau import pauli_product_phase
+from .cost_functions import pack_rows, greedy_trotter_order
+
+_INVERSE = {"h": "h", "s": "sdg", "sdg": "s", "cx": "cx"}
+
+def uccsd_excitations(num_spatial_orbitals: int, num_particles: tuple[int, int]) -> list:
+    """The excitation list of qiskit-nature's default `UCCSD`."""
+    excitations = []
+    for order in (1, 2):
+        excitations.extend(generate_fermionic_excitations(order, num_spatial_orbitals, num_particles))
+    return excitations
+
+def excitation_generator(excitation, N) -> FermionicOp:
+    """Hermitian generator 1j*(T - T^dagger) of one excitation, built like `UCC`."""
+    occ, unocc = excitation
+    label = " ".join([f"+_{i}" for i in occ] + [f"-_{a}" for a in unocc])
+    op = FermionicOp({label: 1}, num_spin_orbitals=N)
+    return 1j * (op - op.adjoint())
+
+def _pauli_phase(x1, z1, x2, z2) -> int:
+    return int(pauli_product_phase(x1, z1, x2, z2))
+
+def majorana_rotations(x, z, generator) -> list[tuple[np.ndarray, np.ndarray, float]]:
+    """Pauli terms (x, z, real coefficient) of a Hermitian generator mapped by the table rows."""
+    N = x.shape[1]
+    terms = []
+    for rows, coeff in majorana_products(generator, N).items():
+        if not rows:
+            continue
+        x_p, z_p = np.zeros(N, dtype=bool), np.zeros(N, dtype=bool)
+        k = 0
+        for r in rows:
+            k += _pauli_phase(x_p, z_p, x[r], z[r])
+            x_p, z_p = x_p ^ x[r], z_p ^ z[r]
+        value = coeff * 1j ** k
+        if abs(value.imag) > 1e-9:
+            raise ValueError("The generator is not Hermitian.")
+        terms.append((x_p, z_p, value.real))
+    return terms
+
+def _ladder_order(x_p, z_p):
+    # Z-basis qubits first: they carry no basis change, so the ladders of
+    # consecutive exponentials cancel from the outside in along them
+    support = np.flatnonzero(x_p | z_p)
+    return sorted((int(q) for q in support), key=lambda q: (bool(x_p[q]), q))
+
+def _append(gates, wires, name, qubits, param=None):
+    """Append a gate, cancelling it against an adjacent inverse or merging adjacent rz."""
+    stack = wires[qubits[0]]
+    if stack:
+        last = stack[-1]
+        prev_name, prev_qubits, prev_param = gates[last]
+        if prev_qubits == qubits and all(wires[q] and wires[q][-1] == last for q in qubits):
+            if name == "rz" and prev_name == "rz":
+                gates[last] = ("rz", qubits, prev_param + param)
+                return
+            if _INVERSE.get(prev_name) == name:
+                gates[last] = None
+                for q in qubits:
+                    wires[q].pop()
+                return
+    gates.append((name, qubits, param))
+    for q in qubits:
+        wires[q].append(len(gates) - 1)
+
+def _append_exponential(gates, wires, x_p, z_p, angle):
+    """exp(-i angle/2 P) as basis change, CNOT ladder, rz and uncomputation."""
+    order = _ladder_order(x_p, z_p)
+    for q in order:
+        if x_p[q] and z_p[q]:
+            _append(gates, wires, "sdg", (q,))
+        if x_p[q]:
+            _append(gates, wires, "h", (q,))
+    for a, b in zip(order, order[1:]):
+        _append(gates, wires, "cx", (a, b))
+    _append(gates, wires, "rz", (order[-1],), angle)
+    for a, b in reversed(list(zip(order, order[1:]))):
+        _append(gates, wires, "cx", (a, b))
+    for q in reversed(order):
+        if x_p[q]:
+            _append(gates, wires, "h", (q,))
+        if x_p[q] and z_p[q]:
+            _append(gates, wires, "s", (q,))
+
+def synthesize_gates(x, z, excitations, parameters=None):
+    """Gate list of the first-order UCC circuit for a Majorana table.
+
+    Every excitation exp(-i theta G) becomes one Pauli exponential per term of the
+    mapped generator. Terms of one generator commute and are sorted so that similar
+    strings are adjacent, and gates cancelling or merging across neighbouring
+    exponentials are removed while appending.
+
+    Args:
+        x, z: Table rows, e.g. `pauli_table_arrays(mapper.pauli_table(N))`.
+        excitations: List of (occupied, unoccupied) tuples, e.g. `uccsd_excitations`.
+        parameters: One angle per excitation, a `ParameterVector` by default.
+
+    Returns:
+        list: Gates as (name, qubits, parameter) tuples.
+    """
+    N = x.shape[1]
+    if parameters is None:
+        parameters = ParameterVector("t", len(excitations))
+
+    gates, wires = [], [[] for _ in range(N)]
+    for excitation, theta in zip(excitations, parameters):
+        terms = majorana_rotations(x, z, excitation_generator(excitation, N))
+        terms.sort(key=lambda t: (tuple(np.flatnonzero(t[0] | t[1])), tuple(t[0]), tuple(t[1])))
+        for x_p, z_p, coeff in terms:
+            _append_exponential(gates, wires, x_p, z_p, 2 * coeff * theta)
+
+    return [g for g in gates if g is not None]
+
+def gate_counts(gates, num_qubits) -> dict:
+    """Gate count, CNOT count and depth of a gate list."""
+    level = np.zeros(num_qubits, dtype=np.int64)
+    cnots = 0
+    for name, qubits, _ in gates:
+        depth = level[list(qubits)].max() + 1
+        level[list(qubits)] = depth
+        cnots += name == "cx"
+    return {"gates": len(gates), "cnots": cnots, "depth": int(level.max()) if num_qubits else 0}
+
+def gates_to_circuit(gates, num_qubits) -> QuantumCircuit:
+    circuit = QuantumCircuit(num_qubits)
+    for name, qubits, param in gates:
+        if name == "rz":
+            circuit.rz(param, *qubits)
+        else:
+            getattr(circuit, name)(*qubits)
+    return circuit
+
+def trotter_term_order(qubit_op):
+    """Reorder a mapped Hamiltonian for a Trotter step, see `greedy_trotter_order`.
+
+    Identity terms are moved to the end.
+
+    Returns:
+        (SparsePauliOp, int): The reordered operator and its estimated CNOTs per step.
+    """
+    identity = ~(qubit_op.paulis.x | qubit_op.paulis.z).any(axis=1)
+    terms = np.flatnonzero(~identity)
+    x_packed, z_packed = pack_rows(qubit_op.paulis.x[terms], qubit_op.paulis.z[terms])
+    order, cnots = greedy_trotter_order(x_packed, z_packed)
+    return qubit_op[np.concatenate([terms[order], np.flatnonzero(identity)])], int(cnots)
@@ -78,4 +78,86 @@ def anticommutation_matrix(x, z) -> np.ndarray:
         np.ndarray: Adjacency matrix of the anticommutation graph
     """
 
-    return np.bitwise_xor(binary_matmul_xor(x, z.T), binary_matmul_xor(z, x.T))
\ No newline at end of file
+    return np.bitwise_xor(binary_matmul_xor(x, z.T), binary_matmul_xor(z, x.T))
+
+def pauli_product_phase(x1, z1, x2, z2):
+    """Exponent k with P1 P2 = i^k P(x1^x2, z1^z2) for Hermitian Paulis (Aaronson-Gottesman g).
+
+    Works on stacks of Paulis along the last axis.
+    """
+    x1, z1, x2, z2 = (np.asarray(a, dtype=np.int64) for a in (x1, z1, x2, z2))
+    g = np.where(x1 & z1, z2 - x2,
+        np.where(x1, z2 * (2*x2 - 1),
+        np.where(z1, x2 * (1 - 2*z2), 0)))
+    return g.sum(axis=-1) % 4
+
+# Local Clifford moves. Column moves conjugate every Majorana by a one- or
+# two-qubit Clifford and only touch the 2N bits of the affected columns. Phases
+# are dropped like in `pauli_table`, so every move is an involution.
+MOVE_CNOT = 0
+MOVE_CZ = 1
+MOVE_SWAP = 2
+MOVE_H = 3
+MOVE_S = 4
+MOVE_ROW_SWAP = 5
+NUM_MOVES = 6
+
+@njit(fastmath=True)
+def cnot_columns(c: int, t: int, x: np.ndarray, z: np.ndarray):
+    x[:, t] ^= x[:, c]
+    z[:, c] ^= z[:, t]
+    return x, z
+
+@njit(fastmath=True)
+def cz_columns(a: int, b: int, x: np.ndarray, z: np.ndarray):
+    z[:, a] ^= x[:, b]
+    z[:, b] ^= x[:, a]
+    return x, z
+
+@njit(fastmath=True)
+def swap_columns(a: int, b: int, x: np.ndarray, z: np.ndarray):
+    for i in range(x.shape[0]):
+        x[i, a], x[i, b] = x[i, b], x[i, a]
+        z[i, a], z[i, b] = z[i, b], z[i, a]
+    return x, z
+
+@njit(fastmath=True)
+def hadamard_column(a: int, x: np.ndarray, z: np.ndarray):
+    for i in range(x.shape[0]):
+        x[i, a], z[i, a] = z[i, a], x[i, a]
+    return x, z
+
+@njit(fastmath=True)
+def phase_column(a: int, x: np.ndarray, z: np.ndarray):
+    z[:, a] ^= x[:, a]
+    return x, z
+
+@njit(fastmath=True)
+def row_swap(i: int, j: int, x: np.ndarray, z: np.ndarray):
+    """Swap two Majorana rows as three pairwise row XORs.
+
+    A single row XOR would break the mutual anticommutation of the table, the
+    XOR-swap keeps it.
+    """
+    x[i] ^= x[j]
+    x[j] ^= x[i]
+    x[i] ^= x[j]
+    z[i] ^= z[j]
+    z[j] ^= z[i]
+    z[i] ^= z[j]
+    return x, z
+
+@njit
+def apply_clifford_move(kind: int, a: int, b: int, x: np.ndarray, z: np.ndarray):
+    """Apply one of the local moves above. Single-qubit moves ignore `b`."""
+    if kind == MOVE_CNOT:
+        return cnot_columns(a, b, x, z)
+    elif kind == MOVE_CZ:
+        return cz_columns(a, b, x, z)
+    elif kind == MOVE_SWAP:
+        return swap_columns(a, b, x, z)
+    elif kind == MOVE_H:
+        return hadamard_column(a, x, z)
+    elif kind == MOVE_S:
+        return phase_column(a, x, z)
+    return row_swap(a, b, x, z)
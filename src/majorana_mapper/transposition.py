@@ -0,0 +1,81 @@
+import numpy as np
+from numba import njit
+
+# Zobrist hashing: every (row, qubit) bit of x and z owns a random 64-bit key and
+# a tableau hashes to the XOR of the keys of its set bits. A move flipping a set
+# of bits changes the hash by the XOR of their keys.
+
+def zobrist_keys(num_rows, num_qubits, seed=0):
+    """Random keys of every x and z bit, plus their XOR over each column.
+
+    Returns:
+        (key_x, key_z, col_x, col_z)
+    """
+    rng = np.random.default_rng(seed)
+    key_x = rng.integers(0, 2**64, size=(num_rows, num_qubits), dtype=np.uint64)
+    key_z = rng.integers(0, 2**64, size=(num_rows, num_qubits), dtype=np.uint64)
+    return key_x, key_z, np.bitwise_xor.reduce(key_x, axis=0), np.bitwise_xor.reduce(key_z, axis=0)
+
+@njit
+def tableau_hash(x, z, keys) -> np.uint64:
+    key_x, key_z, _, _ = keys
+    h = np.uint64(0)
+    for i in range(x.shape[0]):
+        for q in range(x.shape[1]):
+            if x[i, q]:
+                h ^= key_x[i, q]
+            if z[i, q]:
+                h ^= key_z[i, q]
+    return h
+
+@njit
+def spread_node_hash(n, x, z, keys) -> np.uint64:
+    """Hash change of `spread_node(n)`, from row n alone in O(N).
+
+    A set bit (n, q) flips bit q of every other row, i.e. the column key without
+    the key of row n.
+    """
+    key_x, key_z, col_x, col_z = keys
+    h = np.uint64(0)
+    for q in range(x.shape[1]):
+        if x[n, q]:
+            h ^= col_x[q] ^ key_x[n, q]
+        if z[n, q]:
+            h ^= col_z[q] ^ key_z[n, q]
+    return h
+
+@njit
+def clifford_jump_hash(n, x, z, keys) -> np.uint64:
+    """Hash change of `clifford_jump(n)`: swap rows n and n+1, then spread row n."""
+    key_x, key_z, col_x, col_z = keys
+    m = (n + 1) % x.shape[0]
+    h = np.uint64(0)
+    for q in range(x.shape[1]):
+        if x[n, q] != x[m, q]:
+            h ^= key_x[n, q] ^ key_x[m, q]
+        if z[n, q] != z[m, q]:
+            h ^= key_z[n, q] ^ key_z[m, q]
+        if x[m, q]:
+            h ^= col_x[q] ^ key_x[n, q]
+        if z[m, q]:
+            h ^= col_z[q] ^ key_z[n, q]
+    return h
+
+def transposition_table(bits):
+    """Empty table of 2^bits (hash, energy) slots. Free slots hold a NaN energy."""
+    return np.zeros(1 << bits, dtype=np.uint64), np.full(1 << bits, np.nan)
+
+@njit
+def table_lookup(table_keys, table_values, h):
+    """Memoized energy of hash h, or NaN."""
+    i = h & np.uint64(table_keys.shape[0] - 1)
+    if table_keys[i] == h:
+        return table_values[i]
+    return np.nan
+
+@njit
+def table_store(table_keys, table_values, h, value):
+    # Always replace: recent states are the likeliest to be revisited
+    i = h & np.uint64(table_keys.shape[0] - 1)
+    table_keys[i] = h
+    table_values[i] = value
@@ -0,0 +1,34 @@
+import numpy as np
+from qiskit_nature.second_q.operators import FermionicOp
+from majorana_mapper.fermionic_mappings import bk_majoranas, jw_majoranas, pauli_table_arrays
+from majorana_mapper.blocks import partition_modes, stitch_blocks
+from majorana_mapper.majorana_mapper import MajoranaMapper
+from majorana_mapper.tableau import anticommutation_matrix
+
+def chain(N):
+    terms = {f"+_{i} -_{i}": -1.0 for i in range(N)}
+    for i in range(0, N - 2, 2):
+        terms[f"+_{i} -_{i+2}"] = terms[f"+_{i+2} -_{i}"] = 0.2
+    return FermionicOp(terms, num_spin_orbitals=N)
+
+def test_partition_follows_interactions():
+    # Even and odd modes do not interact
+    blocks = partition_modes(8, 4, chain(8))
+    assert sorted(map(tuple, blocks)) == [(0, 2, 4, 6), (1, 3, 5, 7)]
+
+def test_stitched_table_is_valid_and_keeps_block_products():
+    N = 5
+    blocks = [np.array([0, 3]), np.array([1, 2, 4])]
+    tables = [bk_majoranas(2)[:2], jw_majoranas(3)[:2]]
+    x, z = stitch_blocks(tables, blocks, N)
+    assert (anticommutation_matrix(x, z) == 1 - np.eye(2*N)).all()
+    # g_1 g'_2 of the second block keeps its block-local weight
+    bx, bz = tables[1]
+    local = (bx[0] ^ bx[1 + 3]) | (bz[0] ^ bz[1 + 3])
+    assert ((x[1] ^ x[2 + N]) | (z[1] ^ z[2 + N])).sum() == local.sum()
+
+def test_blocks_strategy():
+    N = 6
+    mapper = MajoranaMapper(strategy="blocks", hamiltonian=chain(N), blocks=[[0, 2, 4], [1, 3, 5]], workers=2)
+    x, z = pauli_table_arrays(mapper.build_pauli_table(N))
+    assert (anticommutation_matrix(x, z) == 1 - np.eye(2*N)).all()
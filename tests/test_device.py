@@ -0,0 +1,55 @@
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import dijkstra
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.transpiler import CouplingMap, InstructionProperties
+from majorana_mapper.device import (coupling_map_hash, device_distances, select_region, error_distances,
+                                    two_qubit_errors, select_calibrated_region)
+from majorana_mapper.majorana_mapper import MajoranaMapper
+
+def test_device_distances_match_coupling_map():
+    cm = CouplingMap.from_heavy_hex(3)
+    dist = device_distances(cm)
+    assert dist.dtype == np.int32
+    assert (dist == cm.distance_matrix).all()
+    assert device_distances(CouplingMap(cm.get_edges())) is dist
+    assert coupling_map_hash(cm) != coupling_map_hash(CouplingMap.from_line(cm.size()))
+
+def test_select_region_is_connected_and_compact():
+    cm = CouplingMap.from_grid(6, 6)
+    region, distances = select_region(cm, 4)
+    assert len(set(region)) == 4
+    # A 2x2 square is the most compact region of a grid
+    assert distances.sum() // 2 == 8
+    assert (distances == cm.distance_matrix[np.ix_(region, region)]).all()
+
+def test_connectivity_strategy_uses_region():
+    N = 4
+    mapper = MajoranaMapper(strategy="connectivity", coupling_map=CouplingMap.from_grid(5, 5))
+    assert len(mapper.build_pauli_table(N)) == N
+    assert len(mapper.region) == N
+
+def test_error_distances_follow_calibration():
+    backend = GenericBackendV2(num_qubits=6, coupling_map=CouplingMap.from_grid(2, 3), seed=3)
+    dist = error_distances(backend)
+    assert error_distances(backend) is dist
+    assert error_distances(GenericBackendV2(num_qubits=6, coupling_map=CouplingMap.from_grid(2, 3), seed=4)) is not dist
+
+    edges, errors = two_qubit_errors(backend)
+    graph = coo_matrix((-np.log1p(-errors), tuple(edges.T)), shape=(6, 6))
+    assert np.allclose(dijkstra(graph, directed=False), dist)
+
+    region, distances = select_calibrated_region(backend, 4)
+    assert (distances == dist[np.ix_(region, region)]).all()
+    mapper = MajoranaMapper(strategy="fidelity", backend=backend)
+    mapper.build_majorana_arrays(4)
+    assert (mapper.region == region).all()
+
+def test_two_qubit_errors_skip_uncalibrated_gates():
+    backend = GenericBackendV2(num_qubits=6, basis_gates=["cx", "cz", "id", "rz", "sx", "x"],
+                               coupling_map=CouplingMap.from_grid(2, 3), seed=3)
+    for qargs in ((0, 1), (1, 0)):
+        backend.target.update_instruction_properties("cx", qargs, InstructionProperties(error=None))
+    edges, errors = two_qubit_errors(backend)
+    cz = min(backend.target["cz"][qargs].error for qargs in ((0, 1), (1, 0)))
+    assert errors[edges.tolist().index([0, 1])] == cz
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from qiskit_nature.second_q.operators import FermionicOp
+from majorana_mapper import majorana_mapper
+from majorana_mapper.majorana_mapper import MajoranaMapper, set_n
+from majorana_mapper.fermionic_mappings import bk_majoranas, jw_majoranas
+from majorana_mapper.tableau import spread_node, anticommutation_matrix
+from majorana_mapper.cost_functions import quadratic_term_mean_weight
+from majorana_mapper.evolution import crossover_rows, evolve
+from majorana_mapper.symmetries import spin_parity_symmetries
+
+def test_crossover_keeps_anticommutation():
+    rng = np.random.default_rng(0)
+    N = 6
+    for _ in range(50):
+        xa, za = jw_majoranas(N)
+        xb, zb = bk_majoranas(N)[:2]
+        for n in rng.integers(0, 2*N, 20):
+            xa, za = spread_node(n, xa, za)
+            xb, zb = spread_node(n, xb, zb)
+        block = rng.random(N) < 0.5
+        x, z, ok = crossover_rows(xa, za, xb, zb, block)
+        assert ok
+        assert (anticommutation_matrix(x, z) == 1 - np.eye(2*N)).all()
+        rows = np.concatenate([np.flatnonzero(block), np.flatnonzero(block) + N])
+        assert (x[rows] == xb[rows]).all() and (z[rows] == zb[rows]).all()
+
+def test_evolve_improves_on_start():
+    x, z = jw_majoranas(6)
+    x_opt, z_opt, energies, energy_opt = evolve(x, z, spread_node, quadratic_term_mean_weight,
+                                                generations=3, population=4, refine_steps=500, seed=0)
+    assert energy_opt == quadratic_term_mean_weight(x_opt, z_opt) == energies[-1]
+    assert energy_opt < quadratic_term_mean_weight(x, z)
+    assert (np.diff(energies) <= 0).all()
+
+def test_evolution_strategy():
+    set_n(0)
+    hamiltonian = FermionicOp({
+        "+_0 -_3": 0.5, "+_3 -_0": 0.5, "+_1 -_4": 0.5, "+_4 -_1": 0.5,
+        "+_2 +_5 -_5 -_2": 0.3,
+    }, num_spin_orbitals=6)
+    mapper = MajoranaMapper(strategy="evolution", hamiltonian=hamiltonian, workers=2)
+    x, z = mapper.majorana_arrays(6)
+    assert (anticommutation_matrix(x, z) == 1 - np.eye(12)).all()
+    assert mapper.map(hamiltonian).num_qubits == 6
+
+def test_evolution_strategy_without_hamiltonian(monkeypatch):
+    set_n(0)
+    runs = []
+    def spy(*args, **kwargs):
+        runs.append(evolve(*args, **kwargs))
+        return runs[-1]
+    monkeypatch.setattr(majorana_mapper, "evolve", spy)
+
+    x, z = MajoranaMapper(strategy="evolution").majorana_arrays(6)
+    assert len(runs) == 1
+    assert (anticommutation_matrix(x, z) == 1 - np.eye(12)).all()
+    assert quadratic_term_mean_weight(x, z) == runs[0][3] <= quadratic_term_mean_weight(*bk_majoranas(6)[:2])
+
+def test_evolution_strategy_rejects_symmetries():
+    set_n(0)
+    mapper = MajoranaMapper(strategy="evolution", symmetries=spin_parity_symmetries(4))
+    with pytest.raises(ValueError, match="does not support symmetries"):
+        mapper.majorana_arrays(4)
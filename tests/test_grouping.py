@@ -0,0 +1,36 @@
+import numpy as np
+from qiskit.quantum_info import PauliList
+from qiskit_nature.second_q.operators import FermionicOp
+from majorana_mapper.majorana_mapper import MajoranaMapper, set_n
+from majorana_mapper.electronic_hamiltonian import majorana_term_indices
+from majorana_mapper.cost_functions import pack_rows, greedy_qwc_groups
+
+def test_majorana_term_indices_match_mapped_terms():
+    set_n(4)
+    hamiltonian = FermionicOp({
+        "+_0 -_0": -1.252, "+_1 -_1": -0.475,
+        "+_0 -_1": 0.2, "+_1 -_0": 0.2,
+        "+_0 +_2 -_2 -_0": 0.674, "+_0 +_1 -_3 -_2": 0.1, "+_2 +_3 -_1 -_0": 0.1,
+    }, num_spin_orbitals=4)
+    mapper = MajoranaMapper(strategy="tabu")
+    qubit_op = mapper.map(hamiltonian)
+
+    table = mapper.pauli_table(4)
+    rows = PauliList([p for p, _ in table] + [q for _, q in table])
+    x, z = rows.x, rows.z
+
+    products = set()
+    for term in majorana_term_indices(hamiltonian, 4):
+        mask = np.isin(np.arange(8), term)
+        pauli = PauliList.from_symplectic(np.logical_xor.reduce(z[mask]), np.logical_xor.reduce(x[mask]))
+        products.add(pauli[0].to_label().lstrip("-i"))
+
+    mapped = {p.to_label().lstrip("-i") for p in qubit_op.paulis} - {"IIII"}
+    assert products == mapped
+
+def test_greedy_qwc_groups():
+    paulis = PauliList(["XX", "XI", "IZ", "ZZ", "II"])
+    tx, tz = pack_rows(paulis.x, paulis.z)
+    num_groups, weight = greedy_qwc_groups(tx, tz)
+    assert num_groups == 2
+    assert weight == 6
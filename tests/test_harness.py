@@ -0,0 +1,40 @@
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit_nature.second_q.mappers import JordanWignerMapper
+from majorana_mapper.majorana_mapper import MajoranaMapper
+from majorana_mapper.harness import BenchmarkCase, COLUMNS, run_benchmarks, save_columns, load_columns, table_key
+
+def test_run_benchmarks_caches_artifacts(tmp_path):
+    backend = GenericBackendV2(num_qubits=6, seed=1)
+    cases = [
+        BenchmarkCase("H2", "JW", JordanWignerMapper(), 4, (1, 1)),
+        BenchmarkCase("H2", "Majorana", MajoranaMapper(), 4, (1, 1)),
+    ]
+    first = run_benchmarks(cases, backend, tmp_path / "cache", workers=1)
+    assert set(first) == set(COLUMNS)
+    assert (first["error"] == "").all() and (first["cnots"] > 0).all()
+    assert (first["cached"] == "").all()
+    assert (tmp_path / "cache" / "tables").exists()
+
+    second = run_benchmarks(cases, backend, tmp_path / "cache", workers=1)
+    assert (second["cached"] == "transpiled").all()
+    assert (second["cnots"] == first["cnots"]).all()
+
+    third = run_benchmarks(cases, backend, tmp_path / "cache", workers=1, optimization_level=0)
+    assert (third["cached"] == "ansatz").all()
+
+    save_columns(tmp_path / "results.npz", third)
+    assert load_columns(tmp_path / "results.npz")["mapper"].tolist() == ["JW", "Majorana"]
+
+def test_differently_configured_mappers_do_not_share_tables(tmp_path):
+    assert table_key(MajoranaMapper(strategy="blocks", blocks=2), 6) != \
+        table_key(MajoranaMapper(strategy="blocks", blocks=3), 6)
+
+    backend = GenericBackendV2(num_qubits=6, seed=1)
+    cases = [
+        BenchmarkCase("H2", "library", MajoranaMapper(), 4, (1, 1)),
+        BenchmarkCase("H2", "annealed", MajoranaMapper(use_library=False), 4, (1, 1)),
+    ]
+    columns = run_benchmarks(cases, backend, tmp_path / "cache", workers=1)
+    assert (columns["error"] == "").all()
+    assert (columns["cached"] == "").all()
+    assert len(list((tmp_path / "cache" / "tables").iterdir())) == 2
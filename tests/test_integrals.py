@@ -0,0 +1,74 @@
+import warnings
+import numpy as np
+from qiskit_nature.second_q.hamiltonians import ElectronicEnergy
+from majorana_mapper.integrals import read_fcidump, load_integrals, integral_terms
+from majorana_mapper.electronic_hamiltonian import majorana_products, quadratic_majorana_terms
+from majorana_mapper.majorana_mapper import MajoranaMapper, set_n
+from majorana_mapper.cost_functions import subspace_optimized_cost
+
+def random_integrals(n, seed=0):
+    rng = np.random.default_rng(seed)
+    h1 = rng.normal(size=(n, n))
+    h1 = h1 + h1.T
+    h2 = rng.normal(size=(n, n, n, n))
+    h2 = h2 + h2.transpose(1, 0, 2, 3)
+    h2 = h2 + h2.transpose(0, 1, 3, 2)
+    h2 = h2 + h2.transpose(2, 3, 0, 1)
+    return h1, h2
+
+def write_fcidump(path, h1, h2, core):
+    n = h1.shape[0]
+    lines = [f" &FCI NORB={n},NELEC=2,MS2=0,", "  ORBSYM=" + "1," * n, "  ISYM=1,", " &END"]
+    for p, q, r, s in np.ndindex(h2.shape):
+        if p >= q and r >= s and p * n + q >= r * n + s:
+            lines.append(f"{h2[p, q, r, s]:.16E} {p+1} {q+1} {r+1} {s+1}".replace("E", "D"))
+    for p, q in np.ndindex(h1.shape):
+        if p >= q:
+            lines.append(f"{h1[p, q]:.16E} {p+1} {q+1} 0 0")
+    lines.append(f"{core:.16E} 0 0 0 0")
+    path.write_text("\n".join(lines) + "\n")
+
+def test_fcidump_terms_match_electronic_energy(tmp_path):
+    n = 3
+    h1, h2 = random_integrals(n)
+    write_fcidump(tmp_path / "FCIDUMP", h1, h2, core=1.5)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        integrals = read_fcidump(tmp_path / "FCIDUMP", chunk_size=7)
+    assert integrals["norb"] == n and integrals["nelec"] == 2 and np.isclose(integrals["core"], 1.5)
+
+    terms = integral_terms(integrals, chunk_size=5)
+    assert np.array_equal(terms.term_indices, integral_terms(integrals).term_indices)
+    reference = majorana_products(ElectronicEnergy.from_raw_integrals(h1, h2).second_q_op(), 2*n)
+    assert np.isclose(terms.constant, reference.pop(()) + 1.5)
+    products = majorana_products(terms, 2*n)
+    products.pop(())
+    assert products.keys() == reference.keys()
+    assert all(np.isclose(products[m], c) for m, c in reference.items())
+
+def test_npy_terms_map_like_fermionic_op(tmp_path):
+    n = 2
+    h1, h2 = random_integrals(n, seed=1)
+    np.save(tmp_path / "h1.npy", h1)
+    np.save(tmp_path / "h2.npy", h2)
+    terms = integral_terms(load_integrals(tmp_path / "h1.npy", tmp_path / "h2.npy"), symmetric=False)
+
+    set_n(2*n)
+    mapper = MajoranaMapper(strategy="sparse", hamiltonian=terms)
+    expected = mapper.map(ElectronicEnergy.from_raw_integrals(h1, h2).second_q_op())
+    assert (mapper.map_terms(terms) - expected).simplify(atol=1e-10).coeffs.tolist() == [0]
+
+def test_subspace_strategy_takes_majorana_terms(tmp_path):
+    n = 2
+    h1, h2 = random_integrals(n, seed=2)
+    np.save(tmp_path / "h1.npy", h1)
+    np.save(tmp_path / "h2.npy", h2)
+    terms = integral_terms(load_integrals(tmp_path / "h1.npy", tmp_path / "h2.npy"), symmetric=False)
+    hamiltonian = ElectronicEnergy.from_raw_integrals(h1, h2).second_q_op()
+    pairs = quadratic_majorana_terms(terms, 2*n)
+    assert len(pairs) and np.array_equal(pairs, quadratic_majorana_terms(hamiltonian, 2*n))
+
+    set_n(2*n)
+    mapper = MajoranaMapper(strategy="subspace", hamiltonian=terms)
+    x, z = mapper.majorana_arrays(2*n)
+    assert np.isclose(mapper._cached_energy, subspace_optimized_cost(x, z, pairs))
@@ -0,0 +1,34 @@
+import numpy as np
+from math import factorial
+from majorana_mapper.fermionic_mappings import bk_majoranas, pauli_table_arrays
+from majorana_mapper.cost_functions import quadratic_term_mean_weight
+from majorana_mapper.tableau import anticommutation_matrix
+from majorana_mapper.transposition import zobrist_keys
+from majorana_mapper.library import orbit_search, library_key, lookup_table
+from majorana_mapper.majorana_mapper import MajoranaMapper
+
+def test_orbit_search_enumerates_whole_orbit():
+    N = 3
+    x, z, _ = bk_majoranas(N)
+    x_opt, z_opt, energy, num_states, complete = orbit_search(
+        x.copy(), z.copy(), quadratic_term_mean_weight, zobrist_keys(2*N, N), 10_000
+    )
+    assert complete and num_states == factorial(2*N + 1)
+    assert np.isclose(quadratic_term_mean_weight(x_opt, z_opt), energy)
+    assert energy <= quadratic_term_mean_weight(x, z)
+
+def test_mapper_serves_library_tables():
+    N = 4
+    x, z, energy, provenance = lookup_table(library_key(N))
+    assert provenance == "orbit-optimal"
+
+    mapper = MajoranaMapper()
+    x_t, z_t = pauli_table_arrays(mapper.build_pauli_table(N))
+    assert mapper._cached_energy == energy
+    assert (anticommutation_matrix(x_t, z_t) == 1 - np.eye(2*N)).all()
+    assert np.isclose(quadratic_term_mean_weight(x_t, z_t), energy)
+
+def test_library_only_serves_its_strategies():
+    assert MajoranaMapper()._library_entry(4) is not None
+    for strategy in ("tabu", "clifford_assisted", "clifford_moves", "blocks", "evolution", "sparse", "connectivity"):
+        assert MajoranaMapper(strategy=strategy)._library_entry(4) is None
@@ -1,6 +1,12 @@
+import numpy as np
 import pytest
-from qiskit.quantum_info import Pauli
+from qiskit.quantum_info import Pauli, SparsePauliOp
+from qiskit.transpiler import CouplingMap
+from qiskit_nature.second_q.operators import FermionicOp
 from majorana_mapper.majorana_mapper import MajoranaMapper, set_n, obtain_n
+from majorana_mapper.fermionic_mappings import pauli_table_arrays
+from majorana_mapper import majorana_mapper
+from majorana_mapper.annealing import anneal_adaptive, anneal_sparse
 
 def test_n_management():
     set_n(4)
@@ -19,3 +25,78 @@ def test_majorana_mapper_pauli_table():
     for p1, p2 in pauli_table:
         assert isinstance(p1, Pauli)
         assert isinstance(p2, Pauli)
+
+
+def test_map_sequence_warm_starts(monkeypatch):
+    set_n(4)
+    hamiltonians = [
+        FermionicOp({"+_0 -_1": t, "+_1 -_0": t, "+_2 +_3 -_3 -_2": 0.5}, num_spin_orbitals=4)
+        for t in (0.1, 0.2)
+    ]
+    runs = []
+    def spy(x, z, *args, **kwargs):
+        result = anneal_sparse(x, z, *args, **kwargs)
+        runs.append((x, z, kwargs, result))
+        return result
+    monkeypatch.setattr(majorana_mapper, "anneal_sparse", spy)
+
+    mapper = MajoranaMapper(strategy="sparse")
+    qubit_ops = mapper.map_sequence(hamiltonians)
+    assert len(qubit_ops) == 2
+    assert all(op.num_qubits == 4 for op in qubit_ops)
+
+    (_, _, cold, first), (x, z, warm, _) = runs
+    assert cold["num_steps"] == majorana_mapper.annealing_steps(4)
+    assert warm["num_steps"] == max(1, int(majorana_mapper.WARM_STEP_FRACTION * cold["num_steps"]))
+    assert warm["p0"] == majorana_mapper.WARM_ACCEPTANCE < cold["p0"]
+    # The second run starts from the table optimized for the first Hamiltonian
+    assert (x == first[0]).all() and (z == first[1]).all()
+    set_n(0)
+
+def test_majorana_arrays_build_paulis_lazily():
+    set_n(4)
+    mapper = MajoranaMapper()
+    x, z = mapper.majorana_arrays(4)
+    assert x.shape == (8, 4) and not x.flags.writeable
+    mapper.map(FermionicOp({"+_0 -_1": 0.5, "+_1 -_0": 0.5}, num_spin_orbitals=4))
+    assert mapper._cached_table is None
+
+    x_t, z_t = pauli_table_arrays(mapper.pauli_table(4))
+    assert (x_t == x).all() and (z_t == z).all()
+
+def _compose_map(mapper, op, N):
+    # Ladder operators composed from the Pauli table, as _map_single did before the arrays
+    table = mapper.pauli_table(N)
+    creation = [0.5 * (SparsePauliOp(g) - 1j * SparsePauliOp(h)) for g, h in table]
+    annihilation = [0.5 * (SparsePauliOp(g) + 1j * SparsePauliOp(h)) for g, h in table]
+    qubit_op = SparsePauliOp(["I" * N], [0.0])
+    for term, coeff in op.items():
+        term_op = SparsePauliOp(["I" * N], [1.0])
+        for o in term.split():
+            mode = int(o.split("_")[1])
+            term_op = term_op.compose(creation[mode] if o.startswith("+") else annihilation[mode])
+        qubit_op += coeff * term_op
+    return qubit_op.simplify()
+
+def test_array_mapping_matches_pauli_composition():
+    rng = np.random.default_rng(0)
+    for N in (4, 6):
+        set_n(N)
+        terms = {}
+        for _ in range(20):
+            length = int(rng.choice([2, 4]))
+            modes = rng.integers(0, N, length)
+            ops = rng.choice(["+", "-"], length)
+            terms[" ".join(f"{o}_{m}" for o, m in zip(ops, modes))] = complex(*rng.normal(size=2))
+        op = FermionicOp(terms, num_spin_orbitals=N)
+        mapper = MajoranaMapper()
+        reference = _compose_map(mapper, op, N)
+        assert (mapper.map(op) - reference).simplify(atol=1e-10).coeffs.tolist() == [0]
+    set_n(0)
+
+def test_new_mappers_reuse_compiled_engines():
+    # Costs take their data as arguments, so a new device does not recompile the engine
+    MajoranaMapper("connectivity", CouplingMap.from_grid(3, 3), use_library=False).build_majorana_arrays(4)
+    signatures = len(anneal_adaptive.signatures)
+    MajoranaMapper("connectivity", CouplingMap.from_line(6), use_library=False).build_majorana_arrays(4)
+    assert len(anneal_adaptive.signatures) == signatures
@@ -0,0 +1,26 @@
+import random
+import numpy as np
+from majorana_mapper.fermionic_mappings import bk_majoranas
+from majorana_mapper.tableau import anticommutation_matrix, NUM_MOVES, MOVE_ROW_SWAP
+from majorana_mapper.cost_functions import (
+    quadratic_term_mean_weight,
+    column_symbol_counts,
+    quadratic_weight_move_delta
+)
+
+def test_move_deltas_track_full_cost():
+    random.seed(0)
+    N = 6
+    x, z, _ = bk_majoranas(N)
+    x, z = x.copy(), z.copy()
+    counts = column_symbol_counts(x, z)
+    energy = quadratic_term_mean_weight(x, z)
+
+    for _ in range(200):
+        kind = random.randrange(NUM_MOVES)
+        a, b = random.sample(range(2*N if kind == MOVE_ROW_SWAP else N), 2)
+        energy += quadratic_weight_move_delta(kind, a, b, x, z, counts)
+        assert np.isclose(energy, quadratic_term_mean_weight(x, z))
+
+    assert (counts == column_symbol_counts(x, z)).all()
+    assert (anticommutation_matrix(x, z) == 1 - np.eye(2*N)).all()
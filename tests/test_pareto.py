@@ -0,0 +1,31 @@
+import numpy as np
+from numba import njit
+from qiskit.transpiler import CouplingMap
+from majorana_mapper.fermionic_mappings import bk_majoranas
+from majorana_mapper.device import select_region
+from majorana_mapper.pareto import dominates, archive_insert, mapping_objectives, anneal_pareto
+from majorana_mapper.tableau import anticommutation_matrix
+
+def test_archive_keeps_non_dominated_points():
+    x, z, _ = bk_majoranas(2)
+    costs = np.empty((4, 2))
+    xs = np.empty((4,) + x.shape, dtype=np.bool_)
+    zs = np.empty((4,) + z.shape, dtype=np.bool_)
+    size = 0
+    for c in ([2.0, 2.0], [1.0, 3.0], [3.0, 1.0], [2.5, 2.5], [1.0, 1.5]):
+        size = archive_insert(costs, xs, zs, size, np.array(c), x, z)
+    assert sorted(map(tuple, costs[:size])) == [(1.0, 1.5), (3.0, 1.0)]
+
+def test_anneal_pareto_returns_front():
+    N = 5
+    _, distances = select_region(CouplingMap.from_line(8), N)
+    term_indices = np.zeros((0, 2), dtype=np.int64)
+    objectives = njit(lambda x, z: mapping_objectives(x, z, distances, term_indices))
+
+    x, z, _ = bk_majoranas(N)
+    costs, xs, zs = anneal_pareto(x.copy(), z.copy(), objectives, num_steps=4000)
+
+    for i in range(len(costs)):
+        assert np.allclose(objectives(xs[i], zs[i]), costs[i])
+        assert (anticommutation_matrix(xs[i], zs[i]) == 1 - np.eye(2*N)).all()
+        assert not any(dominates(costs[j], costs[i]) for j in range(len(costs)))
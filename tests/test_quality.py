@@ -0,0 +1,24 @@
+import numpy as np
+from qiskit.transpiler import CouplingMap
+from qiskit_nature.second_q.operators import FermionicOp
+from qiskit_nature.second_q.mappers import JordanWignerMapper
+from majorana_mapper.quality import quality_report, support_mst_weights
+
+def test_quality_report_matches_mapped_operator():
+    N = 6
+    hamiltonian = FermionicOp({"+_0 -_4": 1.0, "+_4 -_0": 1.0, "+_2 -_2": 1.0}, num_spin_orbitals=N)
+    report = quality_report(JordanWignerMapper(), hamiltonian, CouplingMap.from_line(N))
+
+    qubit_op = JordanWignerMapper().map(hamiltonian).simplify()
+    weights = sorted(int((p.x | p.z).sum()) for p in qubit_op.paulis if (p.x | p.z).any())
+    assert report["num_terms"] == len(weights)
+    assert report["term_weight_histogram"].sum() == len(weights)
+    assert report["cnots"] == sum(2 * (w - 1) for w in weights)
+    # Jordan-Wigner strings are contiguous, so a line routes them without SWAPs
+    assert report["swaps"] == 0
+    assert report["row_weight_histogram"].sum() == 2 * N
+
+def test_support_mst_weights():
+    distances = CouplingMap.from_line(5).distance_matrix.astype(np.int32)
+    supports = np.array([[1, 0, 0, 0, 1], [1, 1, 1, 0, 0], [0, 0, 1, 0, 0]], dtype=bool)
+    assert list(support_mst_weights(supports, distances)) == [4, 2, 0]
@@ -0,0 +1,47 @@
+import numpy as np
+from numba import njit
+from majorana_mapper.fermionic_mappings import bk_majoranas
+from majorana_mapper.cost_functions import quadratic_term_mean_weight
+from majorana_mapper.tableau import spread_node, anticommutation_matrix
+from majorana_mapper.annealing import anneal_adaptive, calibrate_temperature, adapt_temperature, target_acceptance
+
+def test_calibrated_temperature_accepts_mean_uphill_move_at_p0():
+    deltas = np.array([-1.0, 0.0, 0.5, 1.5])
+    T = calibrate_temperature(deltas, 0.8)
+    assert np.isclose(np.exp(-1.0 / T), 0.8)
+
+def test_adapt_temperature_moves_towards_target():
+    assert adapt_temperature(1.0, 90, 100, 0.1) < 1.0
+    assert adapt_temperature(1.0, 1, 100, 0.1) > 1.0
+    assert np.isclose(adapt_temperature(1.0, 10, 100, 0.1), 1.0)
+    # No accept is the expected outcome of 30 proposals at a 0.1% target
+    assert adapt_temperature(1.0, 0, 30, 1e-3) == 1.0
+
+def test_adapted_temperature_freezes_over_the_tail():
+    # Windows of 30 uphill moves of unit delta, accepted at exp(-1/T)
+    rng = np.random.default_rng(0)
+    num_windows, proposed = 200, 30
+    T = 1.0 / -np.log(0.8)
+    temperatures = []
+    for w in range(1, num_windows + 1):
+        accepted = rng.binomial(proposed, np.exp(-1.0 / T))
+        T = adapt_temperature(T, accepted, proposed, target_acceptance(w, num_windows, 0.8, 1e-3))
+        temperatures.append(T)
+    tail = np.array(temperatures[num_windows // 2:])
+    means = tail.reshape(4, -1).mean(axis=1)
+    assert (np.diff(means) < 0).all()
+    assert np.exp(-1.0 / tail[-1]) < 0.01
+
+def test_anneal_adaptive_is_scale_invariant():
+    # The schedule adapts to the energy scale, so a rescaled cost anneals equally well
+    N = 10
+    x, z, _ = bk_majoranas(N)
+    initial = quadratic_term_mean_weight(x, z)
+    for scale in (1e-3, 1e3):
+        energy = njit(lambda x, z: scale * quadratic_term_mean_weight(x, z))
+        x_opt, z_opt, _, energy_opt = anneal_adaptive(
+            x.copy(), z.copy(), spread_node, energy, num_steps=5000
+        )
+        assert energy_opt / scale < initial
+        assert np.isclose(scale * quadratic_term_mean_weight(x_opt, z_opt), energy_opt)
+        assert (anticommutation_matrix(x_opt, z_opt) == 1 - np.eye(2*N)).all()
@@ -0,0 +1,25 @@
+import pytest
+from majorana_mapper.majorana_mapper import MajoranaMapper, set_n
+from majorana_mapper.serialization import load_table, parse_table, table_bytes
+from majorana_mapper.fermionic_mappings import jw_majoranas
+
+def test_mapper_roundtrip(tmp_path):
+    set_n(6)
+    mapper = MajoranaMapper(strategy="tabu")
+    table = mapper.pauli_table(6)
+    mapper.save(tmp_path / "table.maj")
+
+    loaded = load_table(tmp_path / "table.maj")
+    assert loaded["num_qubits"] == 6 and loaded["strategy"] == "tabu"
+    assert loaded["weights"].shape == (12,)
+
+    restored = MajoranaMapper.from_file(tmp_path / "table.maj")
+    assert restored.pauli_table(6) == table
+
+def test_parse_rejects_foreign_data():
+    x, z = jw_majoranas(3)
+    data = bytearray(table_bytes(x, z, weights=False))
+    assert parse_table(bytes(data))["weights"] is None
+    data[:8] = b"NOTATABL"
+    with pytest.raises(ValueError):
+        parse_table(bytes(data))
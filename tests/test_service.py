@@ -0,0 +1,46 @@
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.transpiler import CouplingMap
+from majorana_mapper.service import MappingService, MappingClient
+from majorana_mapper.fingerprint import mapping_fingerprint
+from majorana_mapper.fermionic_mappings import pauli_table_arrays
+
+def test_service_coalesces_and_caches():
+    with MappingService(max_workers=2) as service:
+        clients = [MappingClient(service, strategy="tabu") for _ in range(4)]
+        with ThreadPoolExecutor(4) as pool:
+            tables = list(pool.map(lambda c: c.build_pauli_table(4), clients))
+
+        assert all(t is tables[0] for t in tables)
+        clients[0].build_pauli_table(4)
+
+        metrics = service.metrics()
+        assert metrics["requests"] == 5
+        assert metrics["computed"] == 1
+        assert metrics["coalesced"] + metrics["cache_hits"] == 4
+        assert metrics["queue_depth"] == 0 and metrics["in_flight"] == 0
+
+def test_fingerprint_distinguishes_requests():
+    assert mapping_fingerprint(4, "tabu") == mapping_fingerprint(4, "tabu")
+    assert mapping_fingerprint(4, "tabu") != mapping_fingerprint(6, "tabu")
+    assert mapping_fingerprint(4, "tabu") != mapping_fingerprint(4, "baseline")
+
+def test_service_passes_backend_to_fidelity_strategy():
+    backend = GenericBackendV2(num_qubits=6, coupling_map=CouplingMap.from_grid(2, 3), seed=3)
+    assert mapping_fingerprint(4, "fidelity") != mapping_fingerprint(4, "fidelity", backend=backend)
+    with MappingService(max_workers=1) as service:
+        table = MappingClient(service, strategy="fidelity", backend=backend).build_pauli_table(4)
+        assert len(table) == 4
+        with pytest.raises(ValueError, match="requires a backend"):
+            MappingClient(service, strategy="fidelity").build_pauli_table(4)
+
+def test_service_serves_read_only_arrays():
+    with MappingService(max_workers=1) as service:
+        x, z = MappingClient(service, strategy="tabu").build_majorana_arrays(4)
+        assert not x.flags.writeable and not z.flags.writeable
+        assert MappingClient(service, strategy="tabu").build_majorana_arrays(4)[0] is x
+
+        x_t, z_t = pauli_table_arrays(service.request(4, "tabu"))
+        assert (x_t == x).all() and (z_t == z).all()
+        assert service.metrics()["computed"] == 1
@@ -0,0 +1,38 @@
+import numpy as np
+from qiskit_nature.second_q.operators import FermionicOp
+from majorana_mapper.fermionic_mappings import bk_majoranas
+from majorana_mapper.electronic_hamiltonian import majorana_term_indices, term_row_incidence, term_csr
+from majorana_mapper.annealing import anneal_sparse
+from majorana_mapper.cost_functions import sparse_term_mean_weight
+from majorana_mapper.tableau import anticommutation_matrix
+
+def test_anneal_sparse_tracks_cost():
+    N = 8
+    terms = {f"+_{i} -_{i}": -1.0 for i in range(N)}
+    for i in range(N - 1):
+        terms[f"+_{i} -_{i+1}"] = terms[f"+_{i+1} -_{i}"] = 0.1
+    hamiltonian = FermionicOp(terms, num_spin_orbitals=N)
+
+    term_indices = majorana_term_indices(hamiltonian, N)
+    row_ptr, term_ids = term_row_incidence(term_indices, 2*N)
+    term_ptr, term_rows = term_csr(term_indices)
+
+    x, z, _ = bk_majoranas(N)
+    x_opt, z_opt, _, energy_opt = anneal_sparse(
+        x.copy(), z.copy(), term_ptr, term_rows, row_ptr, term_ids, num_steps=5000
+    )
+
+    assert energy_opt <= sparse_term_mean_weight(x, z, term_ptr, term_rows)
+    assert np.isclose(sparse_term_mean_weight(x_opt, z_opt, term_ptr, term_rows), energy_opt)
+    assert (anticommutation_matrix(x_opt, z_opt) == 1 - np.eye(2*N)).all()
+
+def test_anneal_sparse_without_terms():
+    N = 4
+    term_indices = np.zeros((0, 2), dtype=np.int64)
+    row_ptr, term_ids = term_row_incidence(term_indices, 2*N)
+    term_ptr, term_rows = term_csr(term_indices)
+
+    x, z, _ = bk_majoranas(N)
+    x_opt, z_opt, _, energy_opt = anneal_sparse(x, z, term_ptr, term_rows, row_ptr, term_ids, num_steps=100)
+    assert energy_opt == 0.0
+    assert (x_opt == x).all() and (z_opt == z).all()
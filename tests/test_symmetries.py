@@ -0,0 +1,28 @@
+import numpy as np
+from qiskit_nature.second_q.operators import FermionicOp
+from qiskit_nature.second_q.mappers import JordanWignerMapper
+from majorana_mapper.majorana_mapper import MajoranaMapper, set_n
+from majorana_mapper.symmetries import spin_parity_symmetries
+
+def test_tapered_energies_match_parity_sectors():
+    set_n(4)
+    hamiltonian = FermionicOp({
+        "+_0 -_0": -1.252, "+_1 -_1": -0.475, "+_2 -_2": -1.252, "+_3 -_3": -0.475,
+        "+_0 -_1": 0.2, "+_1 -_0": 0.2,
+        "+_0 +_2 -_2 -_0": 0.674, "+_1 +_3 -_3 -_1": 0.663,
+    }, num_spin_orbitals=4)
+
+    mapper = MajoranaMapper(strategy="tabu", symmetries=spin_parity_symmetries(4))
+    qubit_op = mapper.map(hamiltonian)
+    reference = JordanWignerMapper().map(hamiltonian).to_matrix()
+
+    for num_particles in [(0, 0), (1, 0), (1, 1), (2, 1)]:
+        tapered = mapper.taper(qubit_op, num_particles)
+        assert tapered.num_qubits == 2
+
+        # JW basis state b occupies mode i iff bit i is set
+        sector = [b for b in range(16)
+                  if bin(b & 0b0011).count("1") % 2 == num_particles[0] % 2
+                  and bin(b & 0b1100).count("1") % 2 == num_particles[1] % 2]
+        expected = np.linalg.eigvalsh(reference[np.ix_(sector, sector)]).min()
+        assert np.isclose(np.linalg.eigvalsh(tapered.to_matrix()).min(), expected)
@@ -0,0 +1,22 @@
+import numpy as np
+from qiskit.quantum_info import Operator
+from qiskit_nature.second_q.circuit.library import UCCSD
+from majorana_mapper.majorana_mapper import MajoranaMapper, set_n
+from majorana_mapper.fermionic_mappings import pauli_table_arrays
+from majorana_mapper.synthesis import uccsd_excitations, synthesize_gates, gates_to_circuit, gate_counts
+
+def test_synthesized_circuit_matches_uccsd():
+    set_n(4)
+    mapper = MajoranaMapper(strategy="tabu")
+    excitations = uccsd_excitations(2, (1, 1))
+    ansatz = UCCSD(2, (1, 1), mapper)
+    assert list(ansatz.excitation_list) == excitations
+
+    values = np.random.default_rng(7).normal(size=len(excitations))
+    x, z = pauli_table_arrays(mapper.pauli_table(4))
+    gates = synthesize_gates(x, z, excitations, values)
+
+    assert Operator(gates_to_circuit(gates, 4)).equiv(Operator(ansatz.assign_parameters(values)))
+    counts = gate_counts(gates, 4)
+    assert counts["gates"] == len(gates)
+    assert counts["cnots"] == sum(name == "cx" for name, _, _ in gates)
@@ -0,0 +1,23 @@
+import numpy as np
+from majorana_mapper.fermionic_mappings import bk_majoranas
+from majorana_mapper.cost_functions import quadratic_term_mean_weight
+from majorana_mapper.tabu import (
+    tabu_search,
+    spread_node_neighbour_energies,
+    quadratic_weight_neighbour_energies
+)
+
+def test_batched_neighbour_energies_match_full_evaluation():
+    x, z, _ = bk_majoranas(6)
+    batched = quadratic_weight_neighbour_energies(x, z)
+    full = spread_node_neighbour_energies(x.copy(), z.copy(), quadratic_term_mean_weight)
+    assert np.allclose(batched, full)
+
+def test_tabu_search_does_not_worsen():
+    x, z, _ = bk_majoranas(10)
+    initial = quadratic_term_mean_weight(x, z)
+    x_opt, z_opt, _, energy_opt = tabu_search(
+        x.copy(), z.copy(), quadratic_weight_neighbour_energies, quadratic_term_mean_weight
+    )
+    assert energy_opt <= initial
+    assert np.isclose(quadratic_term_mean_weight(x_opt, z_opt), energy_opt)
@@ -0,0 +1,45 @@
+import numpy as np
+from majorana_mapper.fermionic_mappings import bk_majoranas
+from majorana_mapper.cost_functions import quadratic_term_mean_weight
+from majorana_mapper.tableau import spread_node, clifford_jump
+from majorana_mapper.annealing import anneal_memoized
+from majorana_mapper.majorana_mapper import MajoranaMapper
+from majorana_mapper.transposition import (
+    zobrist_keys,
+    tableau_hash,
+    spread_node_hash,
+    clifford_jump_hash,
+    transposition_table
+)
+
+def test_incremental_hash_matches_full_hash():
+    N = 5
+    x, z, _ = bk_majoranas(N)
+    keys = zobrist_keys(2*N, N)
+    h = tableau_hash(x, z, keys)
+    rng = np.random.default_rng(1)
+    for step in range(50):
+        n = int(rng.integers(2*N))
+        if step % 3:
+            h ^= spread_node_hash(n, x, z, keys)
+            x, z = spread_node(n, x, z)
+        else:
+            h ^= clifford_jump_hash(n, x, z, keys)
+            x, z = clifford_jump(n, x, z)
+        assert h == tableau_hash(x, z, keys)
+
+def test_anneal_memoized_reuses_energies():
+    N = 6
+    x, z, _ = bk_majoranas(N)
+    table_keys, table_values = transposition_table(12)
+    x_opt, z_opt, _, energy_opt, lookups, hits = anneal_memoized(
+        x.copy(), z.copy(), spread_node, spread_node_hash, quadratic_term_mean_weight,
+        zobrist_keys(2*N, N), table_keys, table_values, num_steps=3000
+    )
+    assert lookups == 3000 and 0 < hits < lookups
+    assert np.isclose(quadratic_term_mean_weight(x_opt, z_opt), energy_opt)
+
+def test_cheap_costs_anneal_without_table():
+    mapper = MajoranaMapper(use_library=False)
+    mapper.build_majorana_arrays(4)
+    assert mapper.cache_stats is None
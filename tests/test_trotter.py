@@ -0,0 +1,61 @@
+import numpy as np
+from qiskit.quantum_info import PauliList, SparsePauliOp
+from qiskit_nature.second_q.operators import FermionicOp
+from majorana_mapper.majorana_mapper import MajoranaMapper, set_n
+from majorana_mapper.fermionic_mappings import bk_majoranas
+from majorana_mapper.electronic_hamiltonian import majorana_term_indices, term_csr
+from majorana_mapper.cost_functions import pack_rows, greedy_trotter_order, trotter_cnot_cost
+from majorana_mapper.synthesis import trotter_term_order
+
+def _order_cnots(qubit_op):
+    # CNOTs of the operator's own term order: 2(w - 1) per term, minus 2(s - 1)
+    # for every consecutive pair sharing the same Pauli on s qubits
+    paulis = [p for p in qubit_op.paulis if (p.x | p.z).any()]
+    cnots = sum(2 * ((p.x | p.z).sum() - 1) for p in paulis)
+    for a, b in zip(paulis, paulis[1:]):
+        shared = ((a.x | a.z) & (a.x == b.x) & (a.z == b.z)).sum()
+        cnots -= 2 * max(shared - 1, 0)
+    return cnots
+
+def _hamiltonian(N):
+    return FermionicOp({
+        **{f"+_{i} -_{i}": -1.0 + 0.1 * i for i in range(N)},
+        **{f"+_{i} -_{i+1}": 0.2 for i in range(N - 1)},
+        **{f"+_{i+1} -_{i}": 0.2 for i in range(N - 1)},
+        **{f"+_{i} +_{i+3} -_{i+3} -_{i}": 0.5 for i in range(N - 3)},
+    }, num_spin_orbitals=N)
+
+def test_greedy_trotter_order():
+    paulis = PauliList(["ZZZI", "XXII", "IZZZ", "ZZZZ"])
+    tx, tz = pack_rows(paulis.x, paulis.z)
+    order, cnots = greedy_trotter_order(tx, tz)
+    # ZZZZ first, then the terms sharing three Zs with it; XXII shares nothing
+    assert order.tolist() == [3, 0, 2, 1]
+    assert cnots == (6 + 4 + 4 + 2) - 4 - 2
+
+def test_trotter_term_order_keeps_operator():
+    qubit_op = SparsePauliOp(["IIII", "XXII", "ZZZI", "IZZZ", "ZZZZ"], [-1.0, 0.1, 0.2, 0.3, 0.4])
+    ordered, cnots = trotter_term_order(qubit_op)
+    assert ordered.paulis[-1] == PauliList(["IIII"])[0]
+    assert ordered.simplify().equiv(qubit_op.simplify())
+    assert cnots == _order_cnots(ordered) == 10
+
+def test_trotter_term_order_beats_input_order():
+    qubit_op = SparsePauliOp(["ZZZZ", "XXII", "ZZZI", "IIII", "IZZZ"])
+    ordered, cnots = trotter_term_order(qubit_op)
+    assert _order_cnots(qubit_op) == 16 - 2
+    assert cnots == _order_cnots(ordered) == 16 - 4 - 2
+
+def test_trotter_strategy():
+    set_n(0)
+    N = 6
+    hamiltonian = _hamiltonian(N)
+    mapper = MajoranaMapper(strategy="trotter", hamiltonian=hamiltonian)
+    x, z = bk_majoranas(N)[:2]
+    term_ptr, term_rows = term_csr(majorana_term_indices(hamiltonian, N))
+    mapper.pauli_table(N)
+    assert mapper._cached_energy <= trotter_cnot_cost(x, z, term_ptr, term_rows)
+    assert mapper.cache_stats["lookups"] > 0
+
+    ordered, cnots = trotter_term_order(mapper.map(hamiltonian))
+    assert cnots == _order_cnots(ordered)